@@ -1,9 +1,13 @@
 from PyQt6.QtWidgets import QWidget, QApplication, QScrollArea # Import QScrollArea
 from PyQt6.QtCore import pyqtSignal, Qt, QRectF, QPointF, QSize # Import QSize for sizeHint
-from PyQt6.QtGui import QPainter, QColor, QPen, QFontMetrics, QFont, QTextOption
+from PyQt6.QtGui import QPainter, QColor, QPen, QFontMetrics, QFont, QTextOption, QPixmap
+from collections import OrderedDict
 from datetime import date, timedelta, datetime
 import hashlib
-from engine import VibeTask
+from engine import VibeTask, TaskGraph, parse_linked_ids
+from task_store import IntervalIndex
+
+TILE_SIZE = 512 # Side of a cached static-layer tile, in logical pixels
 
 def generate_color_from_text(text):
     # Ensure text is a string, even if it's a list (e.g., if project_name has multiple values)
@@ -17,15 +21,134 @@ def generate_color_from_text(text):
     hue = hash_val % 360
     return QColor.fromHsv(hue, 200, 220)
 
+# --- Time scale ---
+# The header ticks at the finest unit whose ticks land at least UNIT_MIN_PIXELS apart, with the next
+# coarser unit labelled above it, and only the ticks inside the visible span are generated. Header
+# cost therefore follows the screen width instead of the number of days in the range.
+TIME_UNITS = ('day', 'week', 'month', 'quarter', 'year')
+UNIT_DAYS = {'day': 1, 'week': 7, 'month': 30.44, 'quarter': 91.31, 'year': 365.25} # Average length, for picking
+UNIT_MIN_PIXELS = {'day': 28, 'week': 40, 'month': 40, 'quarter': 40, 'year': 40}
+UPPER_TIME_UNIT = {'day': 'month', 'week': 'month', 'month': 'year', 'quarter': 'year', 'year': None}
+
+def pick_time_unit(pixels_per_day):
+    """Finest tick unit that is still wide enough to label at this zoom."""
+    for unit in TIME_UNITS:
+        if UNIT_DAYS[unit] * pixels_per_day >= UNIT_MIN_PIXELS[unit]:
+            return unit
+    return 'year'
+
+def floor_to_unit(day, unit):
+    """Start of the unit containing day (weeks start on Monday)."""
+    if unit == 'day':
+        return day
+    if unit == 'week':
+        return day - timedelta(days=day.weekday())
+    if unit == 'month':
+        return day.replace(day=1)
+    if unit == 'quarter':
+        return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    return date(day.year, 1, 1)
+
+def next_tick(day, unit):
+    if unit == 'day':
+        return day + timedelta(days=1)
+    if unit == 'week':
+        return day + timedelta(days=7)
+    month_index = day.year * 12 + day.month - 1 + {'month': 1, 'quarter': 3, 'year': 12}[unit]
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+def time_ticks(first_date, last_date, unit):
+    """(tick, next tick) for every unit that meets [first_date, last_date]."""
+    tick = floor_to_unit(first_date, unit)
+    while tick <= last_date:
+        following = next_tick(tick, unit)
+        yield tick, following
+        tick = following
+
+def tick_label(tick, unit, pixels_per_day):
+    if unit == 'day':
+        return tick.strftime("%a %d" if pixels_per_day > 100 else "%d")
+    if unit == 'week':
+        return tick.strftime("%b %d")
+    if unit == 'month':
+        return tick.strftime("%b" if pixels_per_day * 30 < 80 else "%B")
+    if unit == 'quarter':
+        return f"Q{(tick.month - 1) // 3 + 1}"
+    return tick.strftime("%Y")
+
+def upper_tick_label(tick, unit):
+    return tick.strftime("%B %Y") if unit == 'month' else tick.strftime("%Y")
+
+class PaintResources:
+    """Bounded LRU caches for what render() needs per bar: colors by project, fonts and font metrics
+       by point size, and elided strings keyed by (text, point size, pixel width). Edited text or a
+       new zoom width simply misses; clear_text() drops the elided strings when every width changes."""
+    def __init__(self, max_colors=1024, max_elided=8192):
+        self.max_colors = max_colors
+        self.max_elided = max_elided
+        self.colors = OrderedDict() # project name -> QColor
+        self.fonts = {} # point size -> QFont
+        self.font_metrics = {} # point size -> QFontMetrics
+        self.elided = OrderedDict() # (text, point size, width) -> elided text
+
+    def color(self, text):
+        if isinstance(text, list):
+            text = str(text[0]) if text else ""
+        color = self.colors.get(text)
+        if color is None:
+            color = self.colors[text] = generate_color_from_text(text)
+            if len(self.colors) > self.max_colors:
+                self.colors.popitem(last=False)
+        else:
+            self.colors.move_to_end(text)
+        return color
+
+    def font(self, point_size):
+        font = self.fonts.get(point_size)
+        if font is None:
+            font = self.fonts[point_size] = QFont("Segoe UI", point_size)
+        return font
+
+    def metrics(self, point_size):
+        metrics = self.font_metrics.get(point_size)
+        if metrics is None:
+            metrics = self.font_metrics[point_size] = QFontMetrics(self.font(point_size))
+        return metrics
+
+    def elide(self, text, point_size, width):
+        key = (text, point_size, width)
+        elided_text = self.elided.get(key)
+        if elided_text is None:
+            elided_text = self.elided[key] = self.metrics(point_size).elidedText(text, Qt.TextElideMode.ElideRight, width)
+            if len(self.elided) > self.max_elided:
+                self.elided.popitem(last=False)
+        else:
+            self.elided.move_to_end(key)
+        return elided_text
+
+    def clear_text(self):
+        self.elided.clear()
+
 class GanttChartWidget(QWidget):
     task_clicked = pyqtSignal(VibeTask)
+    tasks_rescheduled = pyqtSignal(list) # Tasks whose dates changed in a drag (the dragged task and its dependents)
 
     def __init__(self):
         super().__init__()
         self.tasks = []
+        self.task_graph = TaskGraph() # vibe_id lookups and link adjacency for all tasks
         self.tasks_to_display = []
+        self.display_row_of = {} # id(task) -> row in tasks_to_display
+        self.bar_intervals = IntervalIndex() # Display row -> (start, end) ordinals, for horizontal culling
+        self.display_links = [] # (from_row, to_row) pairs between displayed tasks
+        self.link_rows = IntervalIndex() # Link index -> row span, for vertical culling of links
         self.start_date, self.end_date = date.today(), date.today() + timedelta(days=60)
-        self.task_rects = [] # Stores QRectF objects for click detection (logical coordinates)
+        self.tile_cache = OrderedDict() # (tile_x, tile_y) -> QPixmap of the static layers, least recently used first
+        self.max_cached_tiles = 48 # About 1 MB each at 1x scale
+        self.tile_ratio = 1.0 # Device pixel ratio the cached tiles were painted at
+        self.live_rows = set() # Display rows painted over the tiles instead of into them (a drag in progress)
+        self.live_links = [] # display_links touching live_rows
+        self.paint_resources = PaintResources()
         self.zoom_factor = 1.0
         self.task_height = 30
         self.task_spacing = 5
@@ -41,6 +164,7 @@ class GanttChartWidget(QWidget):
         self.drag_task = None
         self.drag_start_pos = None
         self.drag_start_date = None
+        self.rescheduled_tasks = {}
 
         self.linking_mode = False
         self.link_start_task = None
@@ -49,8 +173,9 @@ class GanttChartWidget(QWidget):
         # Set a minimum size to ensure it's always viewable even with no tasks
         self.setMinimumSize(QSize(200 + self.name_column_width, self.header_height + 100)) # Min visible area
 
-    def set_tasks(self, tasks: list[VibeTask], all_tasks: list[VibeTask], start_date: date, end_date: date):
+    def set_tasks(self, tasks: list[VibeTask], all_tasks: list[VibeTask], start_date: date, end_date: date, task_graph: TaskGraph = None):
         self.tasks = all_tasks
+        self.task_graph = task_graph if task_graph is not None else TaskGraph(all_tasks)
         # Helper function to ensure string conversion for sorting keys
         def get_string_value(metadata_value, default=""):
             if isinstance(metadata_value, list):
@@ -63,15 +188,89 @@ class GanttChartWidget(QWidget):
             get_string_value(t.metadata.get('task_name', 'Unnamed Task'))
         ))
         
+        self.display_row_of = {id(task): row for row, task in enumerate(self.tasks_to_display)}
+        self.bar_intervals = IntervalIndex((row,) + self._bar_span(task) for row, task in enumerate(self.tasks_to_display))
+        self._build_display_links()
+
         # Ensure start_date is not after end_date just in case
         if start_date > end_date:
             end_date = start_date + timedelta(days=1)
         self.start_date, self.end_date = start_date, end_date
+        self.live_rows, self.live_links = set(), []
+        self.invalidate_tiles()
         
         # Crucial: Tell parent layout/QScrollArea that our content size might have changed
         self.updateGeometry()
         self.update() # Request a repaint
 
+    @staticmethod
+    def _bar_span(task):
+        """(start, end) ordinals a task's bar covers; undated tasks are drawn as today..tomorrow."""
+        if task.start_ord and task.end_ord:
+            return task.start_ord, task.end_ord
+        today = date.today().toordinal()
+        return today, today + 1
+
+    def _row_top(self, row):
+        return self.header_height + row * (self.task_height + self.task_spacing)
+
+    def _bar_rect(self, row):
+        """Canvas rectangle of the bar in display row `row`."""
+        start_ord, end_ord = self._bar_span(self.tasks_to_display[row])
+        pixels_per_day = self.get_pixels_per_day()
+        days_from_view_start = start_ord - self.start_date.toordinal()
+        task_duration_days = end_ord - start_ord + 1
+        x_start_on_canvas = self.name_column_width + int(days_from_view_start * pixels_per_day)
+        width_on_canvas = int(task_duration_days * pixels_per_day)
+        return QRectF(x_start_on_canvas, self._row_top(row), width_on_canvas, self.task_height)
+
+    def _visible_row_range(self, clip_rect):
+        """First and last display rows that meet clip_rect (first > last when none do)."""
+        row_pitch = self.task_height + self.task_spacing
+        top = clip_rect.top() - self.pan_offset.y() - self.header_height
+        bottom = clip_rect.bottom() - self.pan_offset.y() - self.header_height
+        first_row = max(0, int(top // row_pitch))
+        last_row = min(len(self.tasks_to_display) - 1, int(bottom // row_pitch))
+        return first_row, last_row
+
+    def _row_at(self, y):
+        """Display row whose bar band contains canvas y, or None (header, row spacing, past the last row)."""
+        offset = y - self.header_height
+        if offset < 0:
+            return None
+        row, within_row = divmod(offset, self.task_height + self.task_spacing)
+        row = int(row)
+        if within_row >= self.task_height or row >= len(self.tasks_to_display):
+            return None
+        return row
+
+    def task_at(self, pos):
+        """Task whose bar is under canvas position pos. Constant time: the row comes from y,
+           then only that row's bar span is checked."""
+        row = self._row_at(pos.y())
+        if row is None:
+            return None
+        if not self._bar_rect(row).contains(pos):
+            return None
+        return self.tasks_to_display[row]
+
+    def _build_display_links(self):
+        """(from_row, to_row) for every link between two displayed tasks, plus an index over their row spans."""
+        self.display_links = []
+        for row, task in enumerate(self.tasks_to_display):
+            for linked_task in self.task_graph.successors(task):
+                linked_row = self.display_row_of.get(id(linked_task))
+                if linked_row is not None:
+                    self.display_links.append((row, linked_row))
+        self.link_rows = IntervalIndex((index, min(link), max(link)) for index, link in enumerate(self.display_links))
+
+    def _visible_day_range(self, clip_rect):
+        """First and last day offsets (from start_date) whose columns meet clip_rect."""
+        pixels_per_day = self.get_pixels_per_day()
+        first_day = int((clip_rect.left() - self.pan_offset.x() - self.name_column_width) // pixels_per_day)
+        last_day = int((clip_rect.right() - self.pan_offset.x() - self.name_column_width) // pixels_per_day)
+        return first_day, last_day
+
     # Override sizeHint to tell QScrollArea how big the *total content* is
     def sizeHint(self):
         # Calculate the total height needed for all tasks
@@ -149,6 +348,8 @@ class GanttChartWidget(QWidget):
         self.zoom_factor = max(0.05, min(self.zoom_factor, 20.0))
 
         # Update the geometry to reflect the new sizeHint, which depends on the zoom_factor
+        self.invalidate_tiles()
+        self.paint_resources.clear_text() # Bar widths all changed
         self.updateGeometry()
         self.update() # Repaint the widget
 
@@ -167,25 +368,24 @@ class GanttChartWidget(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             modifiers = QApplication.keyboardModifiers()
             # Translate mouse position by pan offset for accurate detection
-            panned_pos = event.pos() - self.pan_offset
-            for task_obj, rect in self.task_rects:
-                if rect.contains(panned_pos):
-                    if modifiers == Qt.KeyboardModifier.ShiftModifier:
-                        self.linking_mode = True
-                        self.link_start_task = task_obj
-                        self.update()
-                        break
-                    else:
-                        self.dragging = True
-                        self.drag_task = task_obj
-                        self.drag_start_pos = panned_pos
-                        self.drag_start_date = task_obj.metadata['date_start']
-                        self.task_clicked.emit(task_obj)
-                        break
+            panned_pos = event.position() - self.pan_offset
+            task_obj = self.task_at(panned_pos)
+            if task_obj is not None:
+                if modifiers == Qt.KeyboardModifier.ShiftModifier:
+                    self.linking_mode = True
+                    self.link_start_task = task_obj
+                    self.update()
+                else:
+                    self.dragging = True
+                    self.drag_task = task_obj
+                    self.drag_start_pos = panned_pos
+                    self.drag_start_date = task_obj.metadata['date_start']
+                    self._begin_live_rows(task_obj)
+                    self.task_clicked.emit(task_obj)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        panned_pos = event.pos() - self.pan_offset
+        panned_pos = event.position() - self.pan_offset
         if self.linking_mode:
             self.link_end_pos = panned_pos
             self.update()
@@ -200,29 +400,66 @@ class GanttChartWidget(QWidget):
             self.update()
 
     def update_task_and_dependencies(self, task, new_start_date):
+        """Moves task to new_start_date and pushes everything downstream of it: each linked task starts the
+           day after the latest end among the moved tasks linking to it. Tasks are visited in topological
+           order, so each one is updated once per call however many paths lead to it."""
+        downstream, pending = {id(task): task}, [task]
+        while pending:
+            for linked_task in self.task_graph.successors(pending.pop()):
+                if id(linked_task) not in downstream:
+                    downstream[id(linked_task)] = linked_task
+                    pending.append(linked_task)
+        waiting = dict.fromkeys(downstream, 0) # Links into each task not yet followed
+        for current in downstream.values():
+            for linked_task in self.task_graph.successors(current):
+                waiting[id(linked_task)] += 1
+        waiting[id(task)] = 0 # The dragged task moves first even when a link cycle leads back to it
+
+        start_of = {id(task): new_start_date}
+        ready, moved = [task], set()
+        while len(moved) < len(downstream):
+            if not ready: # Only link cycles are left: break one at a task that already has a start date
+                ready.append(next(downstream[key] for key in start_of if key not in moved))
+            current = ready.pop()
+            if id(current) in moved:
+                continue
+            moved.add(id(current))
+            self._move_task(current, start_of[id(current)])
+
+            # A linked task should start when the current task ends
+            next_start = current.metadata['date_end'] + timedelta(days=1)
+            for linked_task in self.task_graph.successors(current):
+                key = id(linked_task)
+                if key in moved:
+                    continue
+                if key not in start_of or next_start > start_of[key]:
+                    start_of[key] = next_start
+                waiting[key] -= 1
+                if waiting[key] == 0:
+                    ready.append(linked_task)
+
+    def _move_task(self, task, new_start_date):
         duration = task.metadata['date_end'] - task.metadata['date_start']
         task.metadata['date_start'] = new_start_date
         task.metadata['date_end'] = new_start_date + duration
         task.is_dirty = True
-
-        if 'linked_tasks' in task.metadata:
-            for linked_task_id in task.metadata['linked_tasks']:
-                linked_task = next((t for t in self.tasks if t.metadata.get('vibe_id') == linked_task_id), None)
-                if linked_task:
-                    # The linked task should start when the current task ends
-                    self.update_task_and_dependencies(linked_task, task.metadata['date_end'] + timedelta(days=1))
+        self.rescheduled_tasks[id(task)] = task
+        row = self.display_row_of.get(id(task))
+        if row is not None:
+            self.bar_intervals.update(row, *self._bar_span(task))
 
     def mouseReleaseEvent(self, event):
-        panned_pos = event.pos() - self.pan_offset
+        panned_pos = event.position() - self.pan_offset
         if self.linking_mode:
-            for task_obj, rect in self.task_rects:
-                if rect.contains(panned_pos) and task_obj != self.link_start_task:
-                    # Add link from self.link_start_task to task_obj
-                    if 'linked_tasks' not in self.link_start_task.metadata:
-                        self.link_start_task.metadata['linked_tasks'] = []
-                    self.link_start_task.metadata['linked_tasks'].append(task_obj.metadata['vibe_id'])
+            task_obj = self.task_at(panned_pos)
+            if task_obj is not None and task_obj != self.link_start_task:
+                # Add link from self.link_start_task to task_obj (refused if it already exists or would close a cycle)
+                if self.task_graph.add_link(self.link_start_task, task_obj):
+                    linked_ids = parse_linked_ids(self.link_start_task.metadata.get('linked_tasks'))
+                    self.link_start_task.metadata['linked_tasks'] = linked_ids + [task_obj.metadata['vibe_id']]
                     self.link_start_task.is_dirty = True
-                    break
+                    self._build_display_links()
+                    self.invalidate_tasks([self.link_start_task, task_obj])
             self.linking_mode = False
             self.link_start_task = None
             self.link_end_pos = None
@@ -230,144 +467,286 @@ class GanttChartWidget(QWidget):
         elif self.dragging:
             self.dragging = False
             self.drag_task.is_dirty = True
+            self._end_live_rows()
+            self.update()
             self.task_clicked.emit(self.drag_task)
+            if self.rescheduled_tasks:
+                self.tasks_rescheduled.emit(list(self.rescheduled_tasks.values()))
+                self.rescheduled_tasks = {}
             self.drag_task = None
             self.drag_start_pos = None
             self.drag_start_date = None
 
-    def render(self, painter, clip_rect=None):
-        # This method is for printing or exporting the entire Gantt chart.
-        # It's similar to paintEvent but draws the whole chart, not just the visible part.
+    # --- Layered rendering ---
+    # Static layers (background, date header, grid, bars, name column, links) are painted once into
+    # TILE_SIZE QPixmap tiles keyed by widget tile coordinates and reused by every paintEvent. Bars in
+    # live_rows (a dragged bar and its dependents) and the links touching them are left out of the tiles
+    # and painted on top each frame, so a drag only repaints those bars over cached pixmaps.
+
+    def invalidate_tiles(self, rows=None):
+        """Drops cached tiles: all of them, or only those crossing the band spanned by display rows `rows`."""
+        if rows is None:
+            self.tile_cache.clear()
+            return
+        rows = [row for row in rows if row is not None]
+        if not rows:
+            return
+        top = self._row_top(min(rows)) + self.pan_offset.y()
+        bottom = self._row_top(max(rows)) + self.task_height + self.pan_offset.y()
+        first_tile, last_tile = int(top // TILE_SIZE), int(bottom // TILE_SIZE)
+        for key in [key for key in self.tile_cache if first_tile <= key[1] <= last_tile]:
+            del self.tile_cache[key]
+
+    def invalidate_tasks(self, tasks):
+        """Drops the tiles showing these tasks' bars and the links drawn to and from them."""
+        self.invalidate_tiles(self._with_link_partners({self.display_row_of.get(id(task)) for task in tasks} - {None}))
+
+    def _with_link_partners(self, rows):
+        """rows plus the displayed rows linked to or from them (their links cross the rows in between)."""
+        partners = set(rows)
+        for row in rows:
+            task = self.tasks_to_display[row]
+            for linked_task in self.task_graph.successors(task) + self.task_graph.predecessors(task):
+                linked_row = self.display_row_of.get(id(linked_task))
+                if linked_row is not None:
+                    partners.add(linked_row)
+        return partners
+
+    def _begin_live_rows(self, task):
+        """Moves task and everything downstream of it to the overlay layer for the length of a drag."""
+        rows, seen, pending = set(), set(), [task]
+        while pending:
+            current = pending.pop()
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+            row = self.display_row_of.get(id(current))
+            if row is not None:
+                rows.add(row)
+            pending.extend(self.task_graph.successors(current))
+        self.live_rows = rows
+        self.live_links = [link for link in self.display_links if link[0] in rows or link[1] in rows]
+        self.invalidate_tiles(self._with_link_partners(rows))
+
+    def _end_live_rows(self):
+        """Returns the live bars to the cached tiles at their new positions."""
+        rows = self._with_link_partners(self.live_rows)
+        self.live_rows = set()
+        self.live_links = []
+        self.invalidate_tiles(rows)
+
+    def _tile(self, tile_x, tile_y):
+        ratio = self.devicePixelRatioF()
+        if ratio != self.tile_ratio:
+            self.tile_cache.clear() # Moved to a screen with a different scale
+            self.tile_ratio = ratio
+        key = (tile_x, tile_y)
+        pixmap = self.tile_cache.get(key)
+        if pixmap is not None:
+            self.tile_cache.move_to_end(key)
+            return pixmap
+
+        pixmap = QPixmap(int(TILE_SIZE * ratio), int(TILE_SIZE * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        tile_painter = QPainter(pixmap)
+        tile_painter.translate(-tile_x * TILE_SIZE, -tile_y * TILE_SIZE)
+        self.render(tile_painter, clip_rect=QRectF(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                    skip_rows=self.live_rows, overlay=False)
+        tile_painter.end()
+        self.tile_cache[key] = pixmap
+        while len(self.tile_cache) > self.max_cached_tiles:
+            self.tile_cache.popitem(last=False)
+        return pixmap
+
+    def _paint_bar(self, painter, task_index):
+        task = self.tasks_to_display[task_index]
+        task_rect = self._bar_rect(task_index)
+        width_on_canvas = task_rect.width()
+
+        resources = self.paint_resources
+        task_color = resources.color(task.metadata.get('project_name', ''))
+        painter.fillRect(task_rect, task_color)
+        painter.setPen(QPen(QColor(0, 0, 0), 1))
+        painter.drawRect(task_rect)
+
+        task_name = task.metadata.get('task_name', 'Unnamed Task')
+        project_id = task.metadata.get('project_name', '')
+        cost_code = task.metadata.get('cost_code', '')
+        if isinstance(project_id, list): project_id = project_id[0] if project_id else ''
+        if isinstance(cost_code, list): cost_code = cost_code[0] if cost_code else ''
+        task_info = f"{project_id} - {cost_code} - {task_name}"
+
+        painter.setPen(QPen(QColor(255, 255, 255)))
+        font_size_bar_text = 8
+        if width_on_canvas < 50: font_size_bar_text = 7
+        painter.setFont(resources.font(font_size_bar_text))
+        text_padding = 2
+        bar_text_rect = QRectF(task_rect.left() + text_padding, task_rect.top() + text_padding,
+                               task_rect.width() - 2 * text_padding, task_rect.height() - 2 * text_padding)
+        elided_text = resources.elide(task_info, font_size_bar_text, int(bar_text_rect.width()))
+        painter.drawText(bar_text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided_text)
+
+    def _paint_link(self, painter, from_row, to_row, clip_rect):
+        task_rect, linked_task_rect = self._bar_rect(from_row), self._bar_rect(to_row)
+        start_point = QPointF(task_rect.right(), task_rect.center().y())
+        end_point = QPointF(linked_task_rect.left(), linked_task_rect.center().y())
+        if QRectF(start_point, end_point).normalized().adjusted(-1, -1, 1, 1).intersects(clip_rect):
+            painter.drawLine(start_point, end_point)
+
+    def render(self, painter, clip_rect=None, skip_rows=None, overlay=True):
+        # Draws the chart. With clip_rect (a tile or the exposed area) only the rows, day columns and links
+        # that meet it are drawn; without it (printing/export) the whole chart is drawn. Tiles pass the
+        # live rows as skip_rows and overlay=False, leaving those bars and the linking line to the overlay.
+        # Returns the display rows whose bars were painted.
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        skip_rows = skip_rows or ()
 
         # Use the full sizeHint for drawing dimensions
         content_size = self.sizeHint()
+        if clip_rect is None:
+            clip_rect = QRectF(0, 0, max(content_size.width(), self.width()), max(content_size.height(), self.height()))
+        else:
+            clip_rect = QRectF(clip_rect)
 
-        # Draw background for the entire content area
-        painter.fillRect(self.rect(), QColor(43, 43, 43))
+        # Draw background for the exposed area
+        painter.fillRect(clip_rect, QColor(43, 43, 43))
 
         painter.translate(self.pan_offset)
 
-
         total_days = (self.end_date - self.start_date).days + 1
         if total_days <= 0: total_days = 1
         pixels_per_day = self.get_pixels_per_day()
+        first_day, last_day = self._visible_day_range(clip_rect)
+        first_day, last_day = max(0, first_day), min(total_days - 1, last_day)
+        first_row, last_row = self._visible_row_range(clip_rect)
 
         # --- Draw Date Header ---
-        painter.fillRect(self.name_column_width, 0,
-                         content_size.width() - self.name_column_width, self.header_height,
-                         QColor(50, 50, 50))
+        if clip_rect.top() < self.header_height:
+            painter.fillRect(self.name_column_width, 0,
+                             content_size.width() - self.name_column_width, self.header_height,
+                             QColor(50, 50, 50))
         painter.setPen(QPen(QColor(100, 100, 100)))
         painter.drawLine(self.name_column_width, self.header_height,
                          content_size.width(), self.header_height)
 
-        date_format = "%b %d"
         font_size_header = 8
         if pixels_per_day > 100:
-            date_format = "%a %b %d"
             font_size_header = 10
         elif pixels_per_day > 40:
-            date_format = "%b %d"
             font_size_header = 9
-        elif pixels_per_day < 15:
-            date_format = "%b '%y"
-            font_size_header = 7
-        painter.setFont(QFont("Segoe UI", font_size_header))
-
-        for i in range(total_days):
-            current_date = self.start_date + timedelta(days=i)
-            x_on_canvas = self.name_column_width + int(i * pixels_per_day)
-            painter.drawLine(x_on_canvas, self.header_height, x_on_canvas, content_size.height())
-            if pixels_per_day > 15:
-                date_text = current_date.strftime(date_format)
-                text_rect_header = QRectF(x_on_canvas, 0, pixels_per_day, self.header_height - 5)
-                painter.setPen(QPen(QColor(211, 211, 211)))
+
+        resources = self.paint_resources
+        unit = pick_time_unit(pixels_per_day)
+        upper_unit = UPPER_TIME_UNIT[unit]
+        view_start_ord = self.start_date.toordinal()
+        first_date, last_date = self.start_date + timedelta(days=first_day), self.start_date + timedelta(days=last_day)
+        def tick_x(tick):
+            return self.name_column_width + int((tick.toordinal() - view_start_ord) * pixels_per_day)
+
+        grid_top = max(self.header_height, int(clip_rect.top()))
+        grid_bottom = min(content_size.height(), int(clip_rect.bottom()) + 1)
+        grid_pen, label_pen = QPen(QColor(100, 100, 100)), QPen(QColor(211, 211, 211))
+        lower_top = self.header_height // 2 if upper_unit else 0
+        painter.setFont(resources.font(font_size_header))
+        for tick, following in time_ticks(first_date, last_date, unit):
+            x_on_canvas, next_x = tick_x(tick), tick_x(following)
+            painter.setPen(grid_pen)
+            painter.drawLine(x_on_canvas, grid_top, x_on_canvas, grid_bottom)
+            if clip_rect.top() < self.header_height:
+                text_rect_header = QRectF(x_on_canvas, lower_top, next_x - x_on_canvas, self.header_height - 5 - lower_top)
+                date_text = resources.elide(tick_label(tick, unit, pixels_per_day), font_size_header, int(text_rect_header.width()))
+                painter.setPen(label_pen)
                 painter.drawText(text_rect_header, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom, date_text)
 
+        if upper_unit and clip_rect.top() < self.header_height:
+            painter.setFont(resources.font(9))
+            for tick, following in time_ticks(first_date, last_date, upper_unit):
+                x_on_canvas, next_x = tick_x(tick), tick_x(following)
+                painter.setPen(grid_pen)
+                painter.drawLine(x_on_canvas, 0, x_on_canvas, self.header_height)
+                # Keep the label of a span that starts off the left edge next to the name column
+                label_left = max(x_on_canvas, self.name_column_width) + 4
+                text_rect_upper = QRectF(label_left, 0, next_x - label_left - 4, lower_top)
+                if text_rect_upper.width() <= 0:
+                    continue
+                upper_text = resources.elide(upper_tick_label(tick, upper_unit), 9, int(text_rect_upper.width()))
+                painter.setPen(label_pen)
+                painter.drawText(text_rect_upper, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, upper_text)
+
         # --- Draw Tasks ---
-        self.task_rects.clear()
-        task_y_start_offset = self.header_height
-        for task_index, task in enumerate(self.tasks_to_display):
-            task_start_date, task_end_date = task.metadata.get('date_start'), task.metadata.get('date_end')
-            if not (isinstance(task_start_date, date) and isinstance(task_end_date, date)):
-                task_start_date, task_end_date = date.today(), date.today() + timedelta(days=1)
-
-            days_from_view_start = (task_start_date - self.start_date).days
-            task_duration_days = (task_end_date - task_start_date).days + 1
-            x_start_on_canvas = self.name_column_width + int(days_from_view_start * pixels_per_day)
-            width_on_canvas = int(task_duration_days * pixels_per_day)
-            height = self.task_height
-            y_on_canvas = task_y_start_offset + task_index * (self.task_height + self.task_spacing)
-
-            task_rect = QRectF(x_start_on_canvas, y_on_canvas, width_on_canvas, height)
-            self.task_rects.append((task, task_rect))
-
-            task_color = generate_color_from_text(task.metadata.get('project_name', ''))
-            painter.fillRect(task_rect, task_color)
-            painter.setPen(QPen(QColor(0, 0, 0), 1))
-            painter.drawRect(task_rect)
-
-            task_name = task.metadata.get('task_name', 'Unnamed Task')
-            project_id = task.metadata.get('project_name', '')
-            cost_code = task.metadata.get('cost_code', '')
-            if isinstance(project_id, list): project_id = project_id[0] if project_id else ''
-            if isinstance(cost_code, list): cost_code = cost_code[0] if cost_code else ''
-            task_info = f"{project_id} - {cost_code} - {task_name}"
-
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            font_size_bar_text = 8
-            if width_on_canvas < 50: font_size_bar_text = 7
-            painter.setFont(QFont("Segoe UI", font_size_bar_text))
-            text_padding = 2
-            bar_text_rect = QRectF(task_rect.left() + text_padding, task_rect.top() + text_padding,
-                                   task_rect.width() - 2 * text_padding, task_rect.height() - 2 * text_padding)
-            font_metrics = QFontMetrics(painter.font())
-            elided_text = font_metrics.elidedText(task_info, Qt.TextElideMode.ElideRight, int(bar_text_rect.width()))
-            painter.drawText(bar_text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided_text)
+        # Rows come straight from the exposed y range; the interval index drops bars outside the exposed days
+        bar_rows = {row for row in self.bar_intervals.overlapping(view_start_ord + first_day, view_start_ord + last_day)
+                    if first_row <= row <= last_row and row not in skip_rows} if first_row <= last_row else set()
+
+        painted_rows = sorted(bar_rows)
+        for task_index in painted_rows:
+            self._paint_bar(painter, task_index)
 
         # --- Draw Fixed Name Column ---
         painter.save()
         painter.translate(-self.pan_offset) # Untranslate to draw fixed elements
-        painter.fillRect(0, 0, self.name_column_width, self.height(), QColor(50, 50, 50))
-        painter.setPen(QPen(QColor(100, 100, 100), 1))
-        painter.drawLine(self.name_column_width, 0, self.name_column_width, self.height())
-
-        painter.setFont(QFont("Segoe UI", 9))
-        for task_index, task in enumerate(self.tasks_to_display):
-            y_on_canvas = task_y_start_offset + task_index * (self.task_height + self.task_spacing)
-            task_name = task.metadata.get('task_name', 'Unnamed Task')
+        if clip_rect.left() < self.name_column_width:
+            painter.fillRect(QRectF(0, clip_rect.top(), self.name_column_width, clip_rect.height()), QColor(50, 50, 50))
+            painter.setPen(QPen(QColor(100, 100, 100), 1))
+            painter.drawLine(self.name_column_width, int(clip_rect.top()), self.name_column_width, int(clip_rect.bottom()) + 1)
+
+            painter.setFont(self.paint_resources.font(9))
             painter.setPen(QPen(QColor(211, 211, 211)))
-            name_rect = QRectF(5, y_on_canvas, self.name_column_width - 10, self.task_height)
-            font_metrics_name = QFontMetrics(painter.font())
-            elided_name = font_metrics_name.elidedText(task_name, Qt.TextElideMode.ElideRight, int(name_rect.width()))
-            painter.drawText(name_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided_name)
+            for task_index in range(first_row, last_row + 1):
+                task = self.tasks_to_display[task_index]
+                y_on_canvas = self._row_top(task_index)
+                task_name = str(task.metadata.get('task_name', 'Unnamed Task'))
+                name_rect = QRectF(5, y_on_canvas, self.name_column_width - 10, self.task_height)
+                elided_name = self.paint_resources.elide(task_name, 9, int(name_rect.width()))
+                painter.drawText(name_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided_name)
         painter.restore()
-        
+
         # --- Draw Task Links ---
+        # Only links whose row span crosses the exposed rows can be visible
         painter.setPen(QPen(QColor(255, 255, 255), 1, Qt.PenStyle.DashLine))
-        for task in self.tasks_to_display:
-            if 'linked_tasks' in task.metadata and task.metadata['linked_tasks']:
-                for linked_task_id in task.metadata['linked_tasks']:
-                    linked_task = next((t for t in self.tasks if t.metadata.get('vibe_id') == linked_task_id), None)
-                    if linked_task:
-                        task_rect = next((rect for t, rect in self.task_rects if t == task), None)
-                        linked_task_rect = next((rect for t, rect in self.task_rects if t == linked_task), None)
-                        if task_rect and linked_task_rect:
-                            start_point = QPointF(task_rect.right(), task_rect.center().y())
-                            end_point = QPointF(linked_task_rect.left(), linked_task_rect.center().y())
-                            painter.drawLine(start_point, end_point)
+        if first_row <= last_row:
+            for link_index in self.link_rows.overlapping(first_row, last_row):
+                from_row, to_row = self.display_links[link_index]
+                if from_row not in skip_rows and to_row not in skip_rows:
+                    self._paint_link(painter, from_row, to_row, clip_rect)
+
+        if overlay:
+            self._render_overlay(painter)
+        return painted_rows
 
+    def _render_overlay(self, painter):
         # --- Draw linking line ---
         if self.linking_mode and self.link_start_task and self.link_end_pos:
-            task_rect = next((rect for t, rect in self.task_rects if t == self.link_start_task), None)
-            if task_rect:
+            link_start_row = self.display_row_of.get(id(self.link_start_task))
+            if link_start_row is not None:
+                task_rect = self._bar_rect(link_start_row)
                 start_point = QPointF(task_rect.right(), task_rect.center().y())
                 painter.setPen(QPen(QColor(255, 165, 0), 2, Qt.PenStyle.DashLine)) # Orange color for linking line
                 painter.drawLine(start_point, self.link_end_pos)
 
+    def _render_live(self, painter, clip_rect):
+        """Paints the live bars and their links over the cached tiles. They are clipped to the chart area right
+           of the name column, which render() paints over bars."""
+        painter.save()
+        painter.setClipRect(QRectF(self.name_column_width, clip_rect.top(),
+                                   max(0.0, clip_rect.right() - self.name_column_width), clip_rect.height()))
+        painter.translate(self.pan_offset)
+        for task_index in sorted(self.live_rows):
+            if self._bar_rect(task_index).intersects(clip_rect):
+                self._paint_bar(painter, task_index)
+        painter.setPen(QPen(QColor(255, 255, 255), 1, Qt.PenStyle.DashLine))
+        for from_row, to_row in self.live_links:
+            self._paint_link(painter, from_row, to_row, clip_rect)
+        painter.restore()
+        painter.translate(self.pan_offset)
+        self._render_overlay(painter)
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        exposed = event.rect()
+        for tile_y in range(exposed.top() // TILE_SIZE, exposed.bottom() // TILE_SIZE + 1):
+            for tile_x in range(exposed.left() // TILE_SIZE, exposed.right() // TILE_SIZE + 1):
+                painter.drawPixmap(tile_x * TILE_SIZE, tile_y * TILE_SIZE, self._tile(tile_x, tile_y))
 
-        # Pass the paint event's rectangle to the render method for optimized drawing
-        self.render(painter, clip_rect=event.rect())
\ No newline at end of file
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._render_live(painter, QRectF(exposed))
@@ -0,0 +1,218 @@
+"""Performance benchmarks on synthetic vaults (see make_vault.py).
+
+Times ingest_project_data (cold and with a warm parse cache), VibeGanttApp.apply_filters for the date
+presets and a facet selection, an offscreen GanttChartWidget.render of one viewport at several zoom
+levels, and VibeGanttApp.save_all_changes of every task, for each vault size. Each case reports the best
+and median of --repeat runs. Results are written as JSON (bench_output.json by default) so runs on
+different commits can be compared with --compare.
+
+    python benchmark.py --tasks 2000,20000 --repeat 3
+    python benchmark.py --compare old_bench.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen') # Set before Qt starts; windows are never shown
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtCore import QRectF
+from engine import ingest_project_data
+from make_vault import generate_vault
+
+DEFAULT_OUTPUT = 'bench_output.json'
+ZOOM_LEVELS = (0.05, 0.25, 1.0, 4.0)
+VIEWPORT = (1600, 900)
+
+def time_runs(function, repeat):
+    """Runs function repeat times with its console output discarded; returns the durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - started)
+    return durations
+
+def _result(name, tasks, durations, **details):
+    return {'name': name, 'tasks': tasks, 'best': min(durations), 'median': statistics.median(durations),
+            'runs': len(durations), **details}
+
+def bench_ingest(root, tasks, repeat):
+    results = [_result('ingest_project_data', tasks, time_runs(lambda: ingest_project_data(str(root)), repeat), variant='cold')]
+    cache_path = Path(root).parent / 'parse_cache.pickle'
+    with redirect_stdout(io.StringIO()):
+        ingest_project_data(str(root), cache_path=cache_path) # Fill the cache
+    results.append(_result('ingest_project_data', tasks,
+                           time_runs(lambda: ingest_project_data(str(root), cache_path=cache_path), repeat), variant='cached'))
+    return results
+
+def _open_window(root):
+    from main_gui import VibeGanttApp
+    with redirect_stdout(io.StringIO()):
+        tasks, errors = ingest_project_data(str(root))
+    window = VibeGanttApp(open_last_project=False)
+    window.project_root = str(root)
+    window._swap_in_project(tasks, errors)
+    return window
+
+def bench_filters(window, tasks, repeat):
+    results = []
+    for preset in ("All Time", "Next 90 Days", "This Year"):
+        window.date_range_filter.blockSignals(True)
+        window.date_range_filter.setCurrentText(preset)
+        window.date_range_filter.blockSignals(False)
+        results.append(_result('apply_filters', tasks, time_runs(window.apply_filters, repeat), variant=preset))
+
+    # One project and one person selected, over all time
+    window.date_range_filter.blockSignals(True)
+    window.date_range_filter.setCurrentText("All Time")
+    window.date_range_filter.blockSignals(False)
+    for list_widget in (window.project_filter, window.assigned_to_filter):
+        if list_widget.count():
+            list_widget.blockSignals(True)
+            list_widget.item(0).setSelected(True)
+            list_widget.blockSignals(False)
+    results.append(_result('apply_filters', tasks, time_runs(window.apply_filters, repeat), variant='facets'))
+    for list_widget in (window.project_filter, window.assigned_to_filter):
+        list_widget.blockSignals(True)
+        list_widget.clearSelection()
+        list_widget.blockSignals(False)
+    window.apply_filters()
+    return results
+
+def bench_render(window, tasks, repeat):
+    """Full (untiled) render of one viewport at the top left of the chart, per zoom level."""
+    chart = window.gantt_chart
+    chart.resize(*VIEWPORT)
+    image = QImage(*VIEWPORT, QImage.Format.Format_ARGB32_Premultiplied)
+    clip_rect = QRectF(0, 0, *VIEWPORT)
+
+    def render():
+        painter = QPainter(image)
+        chart.render(painter, clip_rect)
+        painter.end()
+
+    results = []
+    original_zoom = chart.zoom_factor
+    for zoom_factor in ZOOM_LEVELS:
+        chart.zoom_factor = zoom_factor
+        chart.invalidate_tiles()
+        chart.paint_resources.clear_text()
+        results.append(_result('render', tasks, time_runs(render, repeat), variant=f'zoom {zoom_factor:g}',
+                               pixels_per_day=chart.get_pixels_per_day()))
+    chart.zoom_factor = original_zoom
+    return results
+
+def bench_save(window, tasks, repeat):
+    """Every task edited (hours_est changes each run, so every file is really rewritten), then saved."""
+    counter = [0]
+
+    def save_all():
+        counter[0] += 1
+        for task in window.tasks:
+            task.metadata['hours_est'] = 1000 + counter[0]
+            task.is_dirty = True
+        window.save_all_changes()
+        window.task_saver.wait()
+
+    return [_result('save_all_changes', tasks, time_runs(save_all, repeat), variant='all dirty')]
+
+def run_benchmarks(task_counts, repeat=3, seed=0, skip=()):
+    """Generates a vault per size in a temporary folder and runs every benchmark not in skip.
+       Returns the list of result dicts."""
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = []
+    for tasks in task_counts:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir, 'vault')
+            generate_vault(root, tasks, seed=seed)
+            if 'ingest' not in skip:
+                results.extend(bench_ingest(root, tasks, repeat))
+            if {'filters', 'render', 'save'} - set(skip):
+                window = _open_window(root)
+                try:
+                    if 'filters' not in skip:
+                        results.extend(bench_filters(window, tasks, repeat))
+                    if 'render' not in skip:
+                        results.extend(bench_render(window, tasks, repeat))
+                    if 'save' not in skip:
+                        results.extend(bench_save(window, tasks, repeat))
+                finally:
+                    window.close()
+                    window.deleteLater()
+                    app.processEvents()
+    return results
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                              capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def result_key(result):
+    return result['name'], result['tasks'], result.get('variant')
+
+def compare(results, previous_results):
+    """Lines comparing best times with a previous run; ratios above 1 mean slower now."""
+    previous = {result_key(result): result for result in previous_results}
+    lines = []
+    for result in results:
+        before = previous.get(result_key(result))
+        if before and before['best'] > 0:
+            ratio = result['best'] / before['best']
+            lines.append(f"{_label(result):<48} {before['best'] * 1000:10.2f} ms -> {result['best'] * 1000:10.2f} ms  x{ratio:.2f}")
+    return lines
+
+def _label(result):
+    return f"{result['name']} [{result.get('variant')}] n={result['tasks']}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ingestion, filtering, rendering and saving on synthetic vaults.")
+    parser.add_argument('--tasks', default='1000,10000', help="Comma-separated vault sizes (default 1000,10000)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per case; best and median are reported (default 3)")
+    parser.add_argument('--seed', type=int, default=0, help="Vault generator seed (default 0)")
+    parser.add_argument('--skip', default='', help="Comma-separated groups to skip: ingest, filters, render, save")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f"JSON results file (default {DEFAULT_OUTPUT})")
+    parser.add_argument('--compare', help="Earlier JSON results file to compare against")
+    args = parser.parse_args(argv)
+
+    try:
+        task_counts = [int(count) for count in args.tasks.split(',') if count.strip()]
+    except ValueError:
+        print(f"Error: --tasks must be comma-separated integers, got {args.tasks!r}.", file=sys.stderr)
+        return 2
+    skip = {group.strip() for group in args.skip.split(',') if group.strip()}
+
+    results = run_benchmarks(task_counts, max(1, args.repeat), args.seed, skip)
+    for result in results:
+        print(f"{_label(result):<48} best {result['best'] * 1000:10.2f} ms  median {result['median'] * 1000:10.2f} ms")
+
+    report = {'created': datetime.now().isoformat(timespec='seconds'), 'commit': _git_commit(),
+              'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count(),
+              'repeat': args.repeat, 'seed': args.seed, 'results': results}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}.")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        print(f"\nCompared with {args.compare} (commit {previous.get('commit')}):")
+        for line in compare(results, previous.get('results', [])):
+            print(line)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,125 +1,1139 @@
-import frontmatter
+import hashlib
+import os
+import pickle
+import re
+import sys
 import uuid
+from array import array
+from collections import namedtuple, deque
+from collections.abc import MutableMapping
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, date, timedelta
 
+# Hot metadata keys get typed slots on VibeTask; every other key lives in the task's overflow dict
+FACET_KEYS = ('project_name', 'phase', 'cost_code', 'assigned_to')
+_VALUE_SLOTS = {'vibe_id': 'vibe_id', 'task_name': 'task_name', 'project_name': 'project_name',
+                'phase': 'phase', 'cost_code': 'cost_code', 'assigned_to': 'assigned_to'}
+_DATE_SLOTS = {'date_start': 'start_ord', 'date_end': 'end_ord'}
+class _MissingType:
+    """Type of _MISSING. Pickles by name, so cached TaskFields unpickle to the same marker."""
+    __slots__ = ()
+
+    def __reduce__(self):
+        return '_MISSING'
+
+    def __repr__(self):
+        return '<missing>'
+
+_MISSING = _MissingType() # Marks a hot key that is absent from the metadata
+# A VibeTask's typed slots (see VibeTask.fields); the parse cache keeps these instead of metadata dicts
+TaskFields = namedtuple('TaskFields', 'vibe_id task_name project_name phase cost_code assigned_to start_ord end_ord extra')
+
+def _intern_facet(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(item) if isinstance(item, str) else item for item in value]
+    return value
+
+class TaskMetadata(MutableMapping):
+    """Dict-compatible view over a VibeTask's typed fields and overflow dict, so task.metadata[...] keeps working."""
+    __slots__ = ('_task',)
+
+    def __init__(self, task):
+        self._task = task
+
+    def __getitem__(self, key):
+        task = self._task
+        slot = _DATE_SLOTS.get(key)
+        if slot is not None:
+            ordinal = getattr(task, slot)
+            if ordinal is not None:
+                return date.fromordinal(ordinal)
+        else:
+            slot = _VALUE_SLOTS.get(key)
+            if slot is not None:
+                value = getattr(task, slot)
+                if value is _MISSING:
+                    raise KeyError(key)
+                return value
+        if task.extra is None:
+            raise KeyError(key)
+        return task.extra[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key, value):
+        self._task.set_field(key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._task.set_field(key, _MISSING)
+
+    def __iter__(self):
+        task = self._task
+        for key, slot in _VALUE_SLOTS.items():
+            if getattr(task, slot) is not _MISSING:
+                yield key
+        for key, slot in _DATE_SLOTS.items():
+            if getattr(task, slot) is not None:
+                yield key
+        if task.extra:
+            yield from task.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 class VibeTask:
-    """Represents a single task parsed from a Markdown file."""
-    def __init__(self, file_path, metadata, content):
+    """Represents a single task parsed from a Markdown file.
+       The hot metadata keys are stored in typed slots (dates as ordinals, interned facet strings) and the rest in an
+       overflow dict; task.metadata is a dict-like view over both.
+       Passing content=None makes the note body lazy: it is read from file_path on first access
+       (body_line is the number of header lines to skip, see read_frontmatter_header)."""
+    __slots__ = ('file_path', '_content', 'body_line', 'is_dirty', 'linked_tasks',
+                 'vibe_id', 'task_name', 'project_name', 'phase', 'cost_code', 'assigned_to',
+                 'start_ord', 'end_ord', 'extra')
+
+    def __init__(self, file_path, metadata, content, body_line=None):
         self.file_path = file_path
         self.metadata = metadata
-        self.content = content
+        self._content = content
+        self.body_line = body_line
         self.is_dirty = False # Flag to track unsaved changes
-        self.linked_tasks = []
+        self.linked_tasks = () # Shared empty default; links normally live in metadata['linked_tasks']
+
+    @property
+    def metadata(self):
+        return TaskMetadata(self)
+
+    @metadata.setter
+    def metadata(self, metadata):
+        self.vibe_id = self.task_name = _MISSING
+        self.project_name = self.phase = self.cost_code = self.assigned_to = _MISSING
+        self.start_ord = self.end_ord = None
+        self.extra = None
+        for key, value in metadata.items():
+            self.set_field(key, value)
+
+    def set_field(self, key, value):
+        """Stores one metadata value in its typed slot, or in the overflow dict. _MISSING removes the key."""
+        slot = _DATE_SLOTS.get(key)
+        if slot is not None:
+            if type(value) is date:
+                setattr(self, slot, value.toordinal())
+                if self.extra:
+                    self.extra.pop(key, None)
+                return
+            setattr(self, slot, None) # Non-date values (e.g. unvalidated strings) go to the overflow dict
+        else:
+            slot = _VALUE_SLOTS.get(key)
+            if slot is not None:
+                setattr(self, slot, _intern_facet(value) if key in FACET_KEYS else value)
+                return
+        if value is _MISSING:
+            if self.extra:
+                self.extra.pop(key, None)
+            return
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def fields(self):
+        """The typed slots holding this task's metadata, as a TaskFields tuple (see from_fields)."""
+        return TaskFields(*(getattr(self, slot) for slot in TaskFields._fields))
+
+    @classmethod
+    def from_fields(cls, file_path, fields, content, body_line=None):
+        """Builds a task from another task's fields() without going through a metadata dict."""
+        task = cls.__new__(cls)
+        task.file_path = file_path
+        task._content = content
+        task.body_line = body_line
+        task.is_dirty = False
+        task.linked_tasks = ()
+        (task.vibe_id, task.task_name, project_name, phase, cost_code, assigned_to,
+         task.start_ord, task.end_ord, extra) = fields
+        # Unpickled strings are not interned, and the overflow dict must not be shared with the cache
+        task.project_name, task.phase = _intern_facet(project_name), _intern_facet(phase)
+        task.cost_code, task.assigned_to = _intern_facet(cost_code), _intern_facet(assigned_to)
+        task.extra = dict(extra) if extra else None
+        return task
+
+    def facet(self, key):
+        """Raw value of one of FACET_KEYS, or None when the task does not have it."""
+        value = getattr(self, key)
+        return None if value is _MISSING else value
+
+    @property
+    def content(self):
+        if self._content is None and self.file_path is not None:
+            self._content = load_task_body(self.file_path, self.body_line)
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        self._content = value
+
+    @property
+    def content_loaded(self):
+        return self._content is not None
+
+    def update_from(self, other):
+        """Takes over another task's parsed state (used when a file is re-read from disk), keeping the body lazy."""
+        self.metadata = other.metadata
+        self._content = other._content
+        self.body_line = other.body_line
+        self.is_dirty = other.is_dirty
 
     def __repr__(self):
         task_name = self.metadata.get('task_name', 'Unnamed Task')
         return f"VibeTask(name='{task_name}', path='{self.file_path.name}')"
 
-def validate_task_data(task_metadata):
-    """Checks for presence of essential fields AND logical consistency, providing defaults for dates.
-       Modifies task_metadata in place with validated/defaulted date objects."""
-    issues = []
-
-    if 'task_name' not in task_metadata or task_metadata['task_name'] is None:
-        issues.append('missing_task_name')
-
-    start_date = None
-    end_date = None
-
-    # Helper to parse date values, handling lists and various date types
-    def parse_date_value(value, default_date=None):
-        if value is None:
-            return default_date
-        if isinstance(value, datetime):
-            return value.date()
-        if isinstance(value, date): # Already a date object
-            return value
-        if isinstance(value, list) and value: # Take first item if it's a list
-            value = value[0]
-        try:
-            return datetime.strptime(str(value), '%Y-%m-%d').date()
-        except (ValueError, TypeError):
-            return default_date
+# Date strings the vault contains: ISO YYYY-MM-DD (as written by the app and YAML) and MM/DD/YYYY
+# (as written by fix_dates.py). Zero padding is optional in both, as it was with strptime.
+_ISO_DATE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+_US_DATE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})")
 
-    # Process date_start
-    start_date = parse_date_value(task_metadata.get('date_start'), date.today())
-    if 'date_start' not in task_metadata or task_metadata['date_start'] is None:
-        issues.append("missing_date_start")
-    elif not isinstance(task_metadata['date_start'], (date, datetime)) and "invalid_date_start_format" not in issues and start_date == date.today():
-         issues.append("invalid_date_start_format")
+@lru_cache(maxsize=4096) # Thousands of tasks share the same few hundred dates
+def parse_date_text(text):
+    """Parses a date string in one of the supported formats, returning None for anything else."""
+    text = text.strip()
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        # Canonical ISO: sliced by hand, no regex or strptime
+        year, month, day = text[:4], text[5:7], text[8:]
+        if not (year + month + day).isdigit() or not text.isascii():
+            return None
+    else:
+        match = _ISO_DATE.fullmatch(text)
+        if match:
+            year, month, day = match.groups()
+        else:
+            match = _US_DATE.fullmatch(text)
+            if match is None:
+                return None
+            month, day, year = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+def parse_date_value(value, default_date=None):
+    """Turns a metadata date value (date, datetime, a list holding one, or a supported date string) into a date.
+       Returns default_date when the value is missing or not a date in any supported format."""
+    if value is None:
+        return default_date
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date): # Already a date object
+        return value
+    if isinstance(value, list) and value: # Take first item if it's a list
+        value = value[0]
+        if isinstance(value, (date, datetime)):
+            return parse_date_value(value)
+    parsed = parse_date_text(value if isinstance(value, str) else str(value))
+    return default_date if parsed is None else parsed
+
+# Validation issue codes in the order validate_task_data reports them; bit i of an issue mask is ISSUE_CODES[i]
+ISSUE_CODES = ('missing_task_name', 'missing_date_start', 'invalid_date_start_format', 'using_date_due_for_date_end',
+               'missing_date_end', 'impossible_timeline')
+(MISSING_TASK_NAME, MISSING_DATE_START, INVALID_DATE_START_FORMAT, USING_DATE_DUE_FOR_DATE_END,
+ MISSING_DATE_END, IMPOSSIBLE_TIMELINE) = (1 << bit for bit in range(len(ISSUE_CODES)))
 
+def issue_codes(mask):
+    """The issue codes set in an issue mask, in report order."""
+    return [code for bit, code in enumerate(ISSUE_CODES) if mask >> bit & 1]
+
+def _check_task_fields(task_metadata, today):
+    """Shared rules of validate_task_data and validate_tasks. Returns (issue mask, start date, end date)
+       without modifying task_metadata."""
+    mask = 0
+    if task_metadata.get('task_name') is None:
+        mask |= MISSING_TASK_NAME
+
+    # Process date_start
+    raw_start = task_metadata.get('date_start')
+    start_date = parse_date_value(raw_start)
+    if raw_start is None:
+        mask |= MISSING_DATE_START
+    elif start_date is None:
+        mask |= INVALID_DATE_START_FORMAT
+    if start_date is None:
+        start_date = today
 
     # Process date_end, with date_due as fallback
     end_date = parse_date_value(task_metadata.get('date_end'))
     if end_date is None: # If date_end is missing/invalid, try date_due
         end_date = parse_date_value(task_metadata.get('date_due'))
         if end_date is not None:
-            issues.append("using_date_due_for_date_end")
+            mask |= USING_DATE_DUE_FOR_DATE_END
 
     if end_date is None: # If still no end_date, default
-        issues.append("missing_date_end")
+        mask |= MISSING_DATE_END
         end_date = start_date + timedelta(days=1)
 
     # Ensure start_date is not after end_date
     if start_date > end_date:
-        issues.append("impossible_timeline")
+        mask |= IMPOSSIBLE_TIMELINE
         end_date = start_date # Adjust end_date to be at least start_date
+    return mask, start_date, end_date
+
+def validate_task_data(task_metadata):
+    """Checks for presence of essential fields AND logical consistency, providing defaults for dates.
+       Modifies task_metadata in place with validated/defaulted date objects."""
+    mask, start_date, end_date = _check_task_fields(task_metadata, date.today())
 
     # Update metadata with validated/defaulted dates
     task_metadata['date_start'] = start_date
     task_metadata['date_end'] = end_date
 
-    return issues if issues else None
+    return issue_codes(mask) or None
 
-def ingest_project_data(root_path_str):
-    """Scans, parses, and VALIDATES project files."""
-    if not root_path_str:
-        print("No folder selected. Aborting.")
-        return [], []
+TaskValidation = namedtuple('TaskValidation', 'masks start_ords end_ords issue_counts flagged')
 
-    root_path = Path(root_path_str)
-    print(f"Scanning directory: {root_path}")
+def validate_tasks(tasks):
+    """Validates many tasks (VibeTasks or metadata mappings) in one pass, leaving them untouched.
+       Returns a TaskValidation: per-task issue masks (see ISSUE_CODES) and the normalized start/end
+       ordinals validate_task_data would store, as compact arrays in input order, plus one summary:
+       issue_counts ({code: tasks with it}) and flagged (tasks with any issue)."""
+    masks, start_ords, end_ords = array('B'), array('q'), array('q')
+    code_totals = [0] * len(ISSUE_CODES)
+    flagged = 0
+    today = date.today()
+    for task in tasks:
+        if isinstance(task, VibeTask) and task.start_ord and task.end_ord:
+            # Already validated dates (the usual case after a load): only the name and order can be off
+            mask = MISSING_TASK_NAME if task.task_name is _MISSING or task.task_name is None else 0
+            start_ord, end_ord = task.start_ord, task.end_ord
+            if start_ord > end_ord:
+                mask |= IMPOSSIBLE_TIMELINE
+                end_ord = start_ord
+        else:
+            mask, start_date, end_date = _check_task_fields(task.metadata if isinstance(task, VibeTask) else task, today)
+            start_ord, end_ord = start_date.toordinal(), end_date.toordinal()
+        masks.append(mask)
+        start_ords.append(start_ord)
+        end_ords.append(end_ord)
+        if mask:
+            flagged += 1
+            for bit in range(len(ISSUE_CODES)):
+                if mask >> bit & 1:
+                    code_totals[bit] += 1
+    issue_counts = {code: count for code, count in zip(ISSUE_CODES, code_totals) if count}
+    return TaskValidation(masks, start_ords, end_ords, issue_counts, flagged)
 
+def find_task_files(root_path):
+    """Returns every .md file under root_path, skipping anything inside a Templates folder."""
     # Use rglob to find all .md files, then filter out templates
-    all_md_files = list(root_path.rglob('*.md'))
-    task_files = [file for file in all_md_files if 'Templates' not in file.parts]
+    all_md_files = list(Path(root_path).rglob('*.md'))
+    return [file for file in all_md_files if 'Templates' not in file.parts]
 
-    print(f"Found {len(task_files)} task files to process (after filtering).")
+def iter_task_files(root_path):
+    """Lazily yields the same files as find_task_files (in directory walk order), without listing the whole tree first."""
+    if 'Templates' in Path(root_path).parts:
+        return
+    for directory, subdirectories, filenames in os.walk(root_path):
+        subdirectories[:] = [name for name in subdirectories if name != 'Templates']
+        for filename in filenames:
+            if filename.endswith('.md'):
+                yield Path(directory, filename)
 
-    all_tasks = []
-    ingestion_errors = []
+# Same delimiter rule as python-frontmatter, so both paths split files identically
+_FM_BOUNDARY = re.compile(r"^-{3,}\s*$")
 
-    for file in task_files:
-        try:
+# Header parser backends. Each takes the header text and returns the loaded value, or _DEFER to hand the
+# header to the next backend in the chain. yaml (and frontmatter, and the process pool) are imported on
+# first use: none of them is needed before a project is opened, and together they are a large share of
+# the app's import time.
+_DEFER = object()
+HEADER_PARSER_ENV = 'VIBEGANTT_HEADER_PARSERS' # Comma-separated backend chain; inherited by worker processes
+DEFAULT_HEADER_PARSERS = ('flat', 'libyaml', 'yaml')
+_header_parser_chain = None
+
+def _load_libyaml(text):
+    import yaml
+    if not yaml.__with_libyaml__:
+        return _DEFER
+    return yaml.load(text, Loader=yaml.CSafeLoader)
+
+def _load_pure_yaml(text):
+    import yaml
+    return yaml.load(text, Loader=yaml.SafeLoader)
+
+# What the flat parser accepts: unindented `key: value` lines whose plain values resolve the way
+# yaml.SafeLoader resolves them. Anything else (quotes with escapes, flow or block collections, anchors,
+# tags, continuation lines, numbers other than decimal ints, timestamps with a time) defers to YAML.
+# Values that start like a number are only kept as strings when none of YAML's own implicit resolvers
+# match them (e.g. cost codes like 03-300 and most UUIDs).
+_FLAT_LINE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*):(?: (.*))?")
+_FLAT_INT = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_FLAT_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_FLAT_NULLS = {'', '~', 'null', 'Null', 'NULL'}
+_FLAT_BOOLS = {word: value for value, words in ((True, 'yes Yes YES true True TRUE on On ON'),
+                                                 (False, 'no No NO false False FALSE off Off OFF'))
+               for word in words.split()}
+_FLAT_INDICATORS = set("-?:,[]{}#&*!|>'\"%@`<=.+")
+
+def _flat_scalar(text):
+    if text in _FLAT_NULLS:
+        return None
+    if text in _FLAT_BOOLS:
+        return _FLAT_BOOLS[text]
+    first = text[0]
+    if first in '"\'' and len(text) > 1 and text[-1] == first and first not in text[1:-1] and '\\' not in text:
+        return text[1:-1]
+    if first in _FLAT_INDICATORS:
+        return int(text) if _FLAT_INT.fullmatch(text) else _DEFER
+    if '0' <= first <= '9':
+        if _FLAT_INT.fullmatch(text):
+            return int(text)
+        date_match = _FLAT_DATE.fullmatch(text)
+        if date_match:
+            try:
+                return date(*map(int, date_match.groups()))
+            except ValueError:
+                return _DEFER # Impossible dates are left to YAML, which reports them
+        import yaml
+        if any(pattern.match(text) for _, pattern in yaml.SafeLoader.yaml_implicit_resolvers.get(first, ())):
+            return _DEFER # Some other number or timestamp
+    if ': ' in text or ' #' in text or text.endswith(':'):
+        return _DEFER
+    return text
+
+def _load_flat(text):
+    metadata = {}
+    # Only '\n' (with an optional '\r' before it) ends a line here: str.splitlines() would also split on
+    # characters such as '\x0c' and '\x1c' that YAML rejects, and those must stay in the line to defer
+    for line in text.split('\n'):
+        if line.endswith('\r'):
+            line = line[:-1]
+        if not line.strip(' ') or line.startswith('#'):
+            continue
+        line_match = _FLAT_LINE.fullmatch(line.rstrip(' '))
+        if line_match is None or not line.isprintable():
+            return _DEFER
+        key, value = line_match.groups()
+        if key in _FLAT_NULLS or key in _FLAT_BOOLS or key in metadata:
+            return _DEFER
+        value = _flat_scalar((value or '').strip(' '))
+        if value is _DEFER:
+            return _DEFER
+        metadata[key] = value
+    return metadata or None # An empty header loads as None in YAML
+
+HEADER_PARSERS = {'flat': _load_flat, 'libyaml': _load_libyaml, 'yaml': _load_pure_yaml}
+
+def set_header_parsers(names=None):
+    """Selects the header parser chain (None restores the default). Also exported through the environment,
+       so process pools started afterwards use the same chain."""
+    global _header_parser_chain
+    if names is None:
+        os.environ.pop(HEADER_PARSER_ENV, None)
+    else:
+        unknown = [name for name in names if name not in HEADER_PARSERS]
+        if unknown:
+            raise ValueError(f"Unknown header parser(s): {', '.join(unknown)}")
+        os.environ[HEADER_PARSER_ENV] = ','.join(names)
+    _header_parser_chain = None
+
+def _header_parsers():
+    global _header_parser_chain
+    if _header_parser_chain is None:
+        names = [name.strip() for name in os.environ.get(HEADER_PARSER_ENV, '').split(',') if name.strip()]
+        _header_parser_chain = [(name, HEADER_PARSERS[name]) for name in names or DEFAULT_HEADER_PARSERS
+                                if name in HEADER_PARSERS]
+        if not any(name in ('libyaml', 'yaml') for name, _ in _header_parser_chain):
+            _header_parser_chain.append(('yaml', _load_pure_yaml)) # Something has to accept every header
+    return _header_parser_chain
+
+def parse_header_text(text):
+    """Loads a YAML header with the first backend that accepts it. Returns (value, backend name)."""
+    for name, load in _header_parsers():
+        value = load(text)
+        if value is not _DEFER:
+            return value, name
+    return _load_pure_yaml(text), 'yaml'
+
+class FileError(str):
+    """An error message about one task file ("File: name | ..."): a plain str that also carries the file's
+       full path, so the message can be matched to its file even when two folders hold the same name."""
+    def __new__(cls, message, file=None):
+        error = super().__new__(cls, message)
+        error.file = Path(file) if file is not None else None
+        return error
+
+ParsedTaskFile = namedtuple('ParsedTaskFile', 'file metadata content body_line validation_issues error_message parser',
+                            defaults=(None,))
+
+def read_frontmatter_header(file, with_parser=False):
+    """Reads a file only up to the closing '---' of its YAML header.
+       Returns (metadata, body_line) where body_line counts the lines before the note body,
+       or None when the file has no complete YAML header (callers fall back to frontmatter.load).
+       with_parser adds the name of the header parser backend that loaded it: (metadata, body_line, parser)."""
+    with open(file, 'r', encoding='utf-8') as f:
+        body_line = 1
+        first_line = f.readline()
+        while first_line and not first_line.strip(): # frontmatter strips leading whitespace
+            first_line = f.readline()
+            body_line += 1
+        if not _FM_BOUNDARY.match(first_line.strip()):
+            return None
+
+        header_lines = []
+        for line in f:
+            body_line += 1
+            if _FM_BOUNDARY.match(line):
+                break
+            header_lines.append(line)
+        else:
+            return None # No closing delimiter: frontmatter treats the whole file as content
+
+    fm_data, parser = parse_header_text(''.join(header_lines))
+    metadata = fm_data if isinstance(fm_data, dict) else {}
+    return (metadata, body_line, parser) if with_parser else (metadata, body_line)
+
+def load_task_body(file, body_line=None):
+    """Reads the note body of a task file. Matches frontmatter.load(file).content."""
+    import frontmatter
+    with open(file, 'r', encoding='utf-8') as f:
+        if body_line is None:
+            return frontmatter.load(f).content
+        for _ in range(body_line):
+            f.readline()
+        return f.read().strip()
+
+def parse_task_file(file, header_only=True):
+    """Loads and validates a single task file, returning a ParsedTaskFile; error_message is None on success.
+       With header_only the note body is not read (content is None and body_line locates it for later)."""
+    try:
+        header = read_frontmatter_header(file, with_parser=True) if header_only else None
+        if header is not None:
+            metadata, body_line, parser = header
+            content = None
+        else:
+            import frontmatter
             with open(file, 'r', encoding='utf-8') as f:
                 task_post = frontmatter.load(f)
+            metadata, content, body_line, parser = task_post.metadata, task_post.content, None, 'frontmatter'
+
+        # Validated in place: only 'date_start' and 'date_end' change, to proper date objects
+        validation_issues = validate_task_data(metadata)
+        return ParsedTaskFile(file, metadata, content, body_line, validation_issues, None, parser)
+    except Exception as e:
+        return ParsedTaskFile(file, None, None, None, None, FileError(f"File: {file.name} | Parsing Error: {e}", file))
+
+def parse_task_chunk(files):
+    """Worker entry point for parallel ingestion: parses a chunk of files in order."""
+    return [parse_task_file(file) for file in files]
 
-            # Create a copy of metadata for validation, as validation function modifies it
-            # The validation function will ensure 'date_start' and 'date_end' are proper date objects
-            temp_metadata_for_validation = task_post.metadata.copy()
-            validation_issues = validate_task_data(temp_metadata_for_validation)
+def _chunked(items, chunk_size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
-            # Apply the (potentially corrected) metadata back to the task_post
-            task_post.metadata.update(temp_metadata_for_validation)
+def map_file_chunks(worker, files, workers, chunk_size):
+    """Runs worker(list of files) -> list of results over files in chunks on a process pool and yields
+       the results in input order. At most two chunks per worker are in flight, so memory stays bounded
+       however many files there are; files may be a lazy iterator."""
+    if workers == 1:
+        for chunk in _chunked(files, chunk_size):
+            yield from worker(chunk)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunked(files, chunk_size):
+            pending.append(executor.submit(worker, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
-            if validation_issues:
-                error_message = f"File: {file.name} | Validation Error: {validation_issues}"
-                ingestion_errors.append(error_message)
+def task_from_parse_result(parse_result):
+    """Turns a parse_task_file result into (VibeTask or None, error message or None).
+       Files without a vibe_id get a fresh one and are marked dirty so it gets saved."""
+    file, metadata, content, body_line, validation_issues, error_message, _ = parse_result
+    if error_message:
+        return None, error_message
 
-            if 'vibe_id' not in task_post.metadata:
-                new_id = str(uuid.uuid4())
-                task_post.metadata['vibe_id'] = new_id
-                task_obj = VibeTask(file, task_post.metadata, task_post.content)
-                task_obj.is_dirty = True
+    if validation_issues:
+        error_message = FileError(f"File: {file.name} | Validation Error: {validation_issues}", file)
+
+    if isinstance(metadata, TaskFields): # Served by the parse cache
+        task_obj = VibeTask.from_fields(file, metadata, content, body_line)
+        if task_obj.vibe_id is _MISSING:
+            task_obj.vibe_id = str(uuid.uuid4())
+            task_obj.is_dirty = True
+    elif 'vibe_id' not in metadata:
+        new_id = str(uuid.uuid4())
+        metadata['vibe_id'] = new_id
+        task_obj = VibeTask(file, metadata, content, body_line)
+        task_obj.is_dirty = True
+    else:
+        task_obj = VibeTask(file, metadata, content, body_line)
+    return task_obj, error_message
+
+_UNSAVED_EXPRESSION_KEYS = {'date_order_due', 'date_precon_due'}
+
+def _is_unsaved_expression(key, value):
+    # Obsidian DataviewJS expressions are never written back
+    return key in _UNSAVED_EXPRESSION_KEYS and isinstance(value, str) and ("=" in value or "$=" in value)
+
+def _flatten_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y-%m-%d')
+    elif isinstance(value, list):
+        # Ensure all items in the list are strings before joining
+        return ", ".join(map(str, value))
+    elif value is None:
+        return ""
+    return str(value)
+
+def clean_metadata_for_save(metadata, linked_tasks=()):
+    """Flattens task metadata to the plain strings written back to the frontmatter header."""
+    clean_metadata = {key: _flatten_value(value) for key, value in metadata.items() if not _is_unsaved_expression(key, value)}
+    if linked_tasks:
+        clean_metadata['linked_tasks'] = ", ".join(linked_tasks)
+    return clean_metadata
+
+# --- Minimal-diff header writer ---
+# A save patches the existing file instead of re-dumping it: the header is split into one block of
+# lines per top-level key, blocks whose value is unchanged are kept byte for byte, changed keys get a
+# freshly dumped block, removed keys lose theirs and new keys are appended. An unloaded or unchanged
+# body is copied through untouched.
+_HEADER_KEY = re.compile(r"""^(?:"([^"]*)"|'([^']*)'|([^\s#'"?:\-][^:]*?))\s*:(?:\s|$)""")
+
+def split_frontmatter(lines):
+    """Splits a file's lines (keepends) into (lines through the opening '---', header lines, closing line,
+       body lines), or None without a complete header."""
+    index = 0
+    while index < len(lines) and not lines[index].strip():
+        index += 1
+    if index == len(lines) or not _FM_BOUNDARY.match(lines[index].strip()):
+        return None
+    for close in range(index + 1, len(lines)):
+        if _FM_BOUNDARY.match(lines[close]):
+            return lines[:index + 1], lines[index + 1:close], lines[close], lines[close + 1:]
+    return None
+
+def _header_blocks(header_lines):
+    """Groups header lines into [key, lines] blocks; key is None for comments and blank lines between keys."""
+    blocks = []
+    for line in header_lines:
+        match = _HEADER_KEY.match(line)
+        if match:
+            blocks.append([next(group for group in match.groups() if group is not None).strip(), [line]])
+        elif blocks and blocks[-1][0] is not None and (line[:1] in (' ', '\t', '-') or not line.strip()):
+            blocks[-1][1].append(line) # Indented continuation or block list item
+        else:
+            blocks.append([None, [line]])
+    # Blank lines trailing a key belong to the layout, not the value
+    for index in range(len(blocks) - 1, -1, -1):
+        key, block_lines = blocks[index]
+        trailing = 0
+        while key is not None and trailing < len(block_lines) - 1 and not block_lines[-1 - trailing].strip():
+            trailing += 1
+        if trailing:
+            blocks[index + 1:index + 1] = [[None, block_lines[-trailing:]]]
+            del block_lines[-trailing:]
+    return blocks
+
+def _same_value(value, original):
+    if isinstance(value, date) and not isinstance(value, datetime) and parse_date_value(original) == value:
+        return True # A validated date read from any supported format, e.g. '01/05/2024'
+    return value == original or _flatten_value(value) == _flatten_value(original)
+
+def _header_key_order(original_text):
+    """Top-level header keys of a task file's text in file order ([] when there is no header that loads)."""
+    parts = split_frontmatter(original_text.splitlines(keepends=True))
+    if parts is None:
+        return []
+    try:
+        header = parse_header_text(''.join(parts[1]))[0]
+    except Exception:
+        return []
+    return [str(key) for key in header] if isinstance(header, dict) else []
+
+def _dump_header_entry(key, value, original, newline):
+    import yaml
+    if isinstance(value, datetime):
+        value = value.date()
+    if value is None:
+        value = ""
+    elif isinstance(value, list) and isinstance(original, str):
+        value = ", ".join(map(str, value)) # Keep a comma-separated field comma-separated
+    try:
+        text = yaml.safe_dump({key: value}, sort_keys=False, allow_unicode=True, default_flow_style=False, width=2 ** 31)
+    except yaml.YAMLError:
+        text = yaml.safe_dump({key: str(value)}, sort_keys=False, allow_unicode=True, default_flow_style=False, width=2 ** 31)
+    return [line + newline for line in text.splitlines()]
+
+def patch_task_text(original_text, metadata, content=None, linked_tasks=()):
+    """Applies metadata (and content, unless None) to the text of an existing task file, touching only
+       the header lines of keys whose value changed. Returns (text, body_line), or None when the file has
+       no header this can patch safely (callers then render the whole file)."""
+    lines = original_text.splitlines(keepends=True)
+    parts = split_frontmatter(lines)
+    if parts is None:
+        return None
+    lead, header_lines, closing, body_lines = parts
+    original = parse_header_text(''.join(header_lines))[0] or {}
+    if not isinstance(original, dict):
+        return None
+    blocks = _header_blocks(header_lines)
+    block_keys = [key for key, _ in blocks if key is not None]
+    if len(set(block_keys)) != len(block_keys) or set(block_keys) != {str(key) for key in original}:
+        return None # Duplicate, complex or non-string keys: not worth guessing at
+    original = {str(key): value for key, value in original.items()}
+    newline = '\r\n' if lines[0].endswith('\r\n') else '\n'
+
+    desired = dict(metadata)
+    if linked_tasks:
+        desired['linked_tasks'] = ", ".join(linked_tasks)
+    new_header = []
+    for key, block_lines in blocks:
+        if key is None:
+            new_header.extend(block_lines)
+        elif key in desired:
+            value = desired[key]
+            if _is_unsaved_expression(key, value) or _same_value(value, original[key]):
+                new_header.extend(block_lines)
             else:
-                task_obj = VibeTask(file, task_post.metadata, task_post.content)
+                new_header.extend(_dump_header_entry(key, value, original[key], newline))
+        # Keys no longer in the metadata are dropped
+    for key, value in desired.items():
+        if str(key) not in original and not _is_unsaved_expression(key, value):
+            new_header.extend(_dump_header_entry(str(key), value, None, newline))
 
-            all_tasks.append(task_obj)
+    if content is not None and content != ''.join(body_lines).strip():
+        leading_blank = []
+        for line in body_lines:
+            if line.strip():
+                break
+            leading_blank.append(line)
+        body_lines = leading_blank + [content.replace('\n', newline) + newline]
+    body_line = len(lead) + len(new_header) + 1
+    return ''.join(lead + new_header + [closing] + body_lines), body_line
+
+def write_task_file(file_path, metadata, content=None, body_line=None, linked_tasks=()):
+    """Saves one task with a minimal diff and atomically replaces its file (temp file + os.replace). Safe to
+       call from a worker thread. content=None keeps the body on disk. Returns (written, body_line): written
+       is False when the result hashes the same as the file on disk, so no write happened. Raises on failure."""
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            original_text = f.read()
+    except FileNotFoundError:
+        original_text = None
+
+    patched = patch_task_text(original_text, metadata, content, linked_tasks) if original_text is not None else None
+    if patched is not None:
+        text, body_line = patched
+    else:
+        if content is None:
+            content = load_task_body(file_path, body_line)
+        import frontmatter
+        clean_metadata = clean_metadata_for_save(metadata, linked_tasks)
+        # Keys the file already has keep their order; new ones follow
+        key_order = _header_key_order(original_text) if original_text is not None else []
+        post_to_dump = frontmatter.Post(content)
+        post_to_dump.metadata = {key: clean_metadata[key] for key in key_order if key in clean_metadata}
+        post_to_dump.metadata.update(clean_metadata)
+        text, body_line = frontmatter.dumps(post_to_dump, sort_keys=False), None
+
+    if original_text is not None and hashlib.sha1(text.encode('utf-8')).digest() == hashlib.sha1(original_text.encode('utf-8')).digest():
+        return False, body_line
+
+    replace_file_text(file_path, text)
+    return True, body_line
+
+def replace_file_text(file_path, text):
+    """Atomically replaces a task file with text (temp file + os.replace), keeping its line endings as given."""
+    temp_path = Path(file_path).with_suffix('.md.tmp')
+    try:
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def snapshot_task_files(root_path):
+    """Maps every task file under root_path to (mtime_ns, size, inode) for change detection."""
+    snapshot = {}
+    for file in find_task_files(root_path):
+        try:
+            stat_result = file.stat()
+        except OSError:
+            continue # Deleted between listing and stat
+        snapshot[file] = (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+    return snapshot
+
+def diff_task_snapshots(old_snapshot, new_snapshot):
+    """Compares two snapshot_task_files results.
+       Returns (created, modified, deleted, renamed); renamed holds (old_path, new_path) pairs
+       matched by inode and size, and those paths are left out of created/deleted."""
+    created = [file for file in new_snapshot if file not in old_snapshot]
+    deleted = [file for file in old_snapshot if file not in new_snapshot]
+    modified = [file for file, state in new_snapshot.items()
+                if file in old_snapshot and old_snapshot[file][:2] != state[:2]]
+
+    renamed = []
+    if created and deleted:
+        deleted_by_identity = {(old_snapshot[file][2], old_snapshot[file][1]): file for file in deleted}
+        for new_file in list(created):
+            _, size, inode = new_snapshot[new_file]
+            old_file = deleted_by_identity.pop((inode, size), None) if inode else None
+            if old_file:
+                renamed.append((old_file, new_file))
+                created.remove(new_file)
+                deleted.remove(old_file)
+    return created, modified, deleted, renamed
+
+def parse_linked_ids(value):
+    """Normalizes a linked_tasks value to a list of vibe_ids. Accepts a YAML list or the
+       comma-separated string that save_all_changes writes back."""
+    if not value:
+        return []
+    items = value.split(',') if isinstance(value, str) else value if isinstance(value, list) else [value]
+    return [str(item).strip() for item in items if item is not None and str(item).strip()]
+
+def _graph_id(task):
+    vibe_id = task.metadata.get('vibe_id')
+    return None if vibe_id is None else str(vibe_id)
+
+class TaskGraph:
+    """Dependency graph over linked_tasks: a vibe_id -> VibeTask map plus forward and reverse adjacency.
+       Built in one pass; also records dangling links, duplicate vibe_ids and link cycles."""
+    def __init__(self, tasks=()):
+        self.rebuild(tasks)
+
+    def rebuild(self, tasks):
+        self.by_id = {}
+        self.duplicate_ids = [] # (task, vibe_id) for tasks whose vibe_id was already taken
+        for task in tasks:
+            vibe_id = _graph_id(task)
+            if vibe_id is None:
+                continue
+            if vibe_id in self.by_id:
+                self.duplicate_ids.append((task, vibe_id))
+            else:
+                self.by_id[vibe_id] = task
+
+        self.forward = {} # vibe_id -> ids it links to (existing tasks only)
+        self.reverse = {} # vibe_id -> ids linking to it
+        self.dangling = [] # (task, missing vibe_id)
+        for vibe_id, task in self.by_id.items():
+            self._add_links(vibe_id, task)
+        self.cycles = self.find_cycles()
+
+    def _add_links(self, vibe_id, task):
+        targets = []
+        for linked_id in parse_linked_ids(task.metadata.get('linked_tasks')):
+            if linked_id not in self.by_id:
+                self.dangling.append((task, linked_id))
+            elif linked_id not in targets:
+                targets.append(linked_id)
+                self.reverse.setdefault(linked_id, []).append(vibe_id)
+        if targets:
+            self.forward[vibe_id] = targets
+
+    def get(self, vibe_id):
+        return self.by_id.get(vibe_id)
+
+    def successors(self, task):
+        return [self.by_id[linked_id] for linked_id in self.forward.get(_graph_id(task), ())]
+
+    def predecessors(self, task):
+        return [self.by_id[linked_id] for linked_id in self.reverse.get(_graph_id(task), ())]
+
+    def reaches(self, from_id, to_id):
+        """True when to_id can be reached from from_id by following links."""
+        stack, seen = [from_id], {from_id}
+        while stack:
+            current = stack.pop()
+            if current == to_id:
+                return True
+            for linked_id in self.forward.get(current, ()):
+                if linked_id not in seen:
+                    seen.add(linked_id)
+                    stack.append(linked_id)
+        return False
 
+    def add_link(self, from_task, to_task):
+        """Records a new link in the adjacency lists. Returns False (and changes nothing) if the link
+           already exists or would close a cycle."""
+        from_id, to_id = _graph_id(from_task), _graph_id(to_task)
+        if from_id not in self.by_id or to_id not in self.by_id or from_id == to_id:
+            return False
+        if to_id in self.forward.get(from_id, ()) or self.reaches(to_id, from_id):
+            return False
+        self.forward.setdefault(from_id, []).append(to_id)
+        self.reverse.setdefault(to_id, []).append(from_id)
+        return True
+
+    def find_cycles(self):
+        """Strongly connected groups of linked tasks that form cycles, as lists of vibe_ids (iterative Tarjan)."""
+        index_of, lowlink, on_stack = {}, {}, set()
+        stack, cycles = [], []
+        next_index = 0
+        for root in self.forward:
+            if root in index_of:
+                continue
+            work = [(root, iter(self.forward.get(root, ())))]
+            index_of[root] = lowlink[root] = next_index
+            next_index += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = lowlink[child] = next_index
+                        next_index += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.forward.get(child, ()))))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1:
+                            cycles.append(component[::-1])
+        return cycles
+
+    def issues(self):
+        """Ingestion-style error messages for dangling links, duplicate ids and cycles."""
+        messages = []
+        for task, vibe_id in self.duplicate_ids:
+            messages.append(FileError(f"File: {task.file_path.name} | Link Error: duplicate vibe_id {vibe_id} "
+                                      f"(also used by {self.by_id[vibe_id].file_path.name})", task.file_path))
+        for task, missing_id in self.dangling:
+            messages.append(FileError(f"File: {task.file_path.name} | Link Error: linked task {missing_id} not found", task.file_path))
+        for cycle in self.cycles:
+            first_task = self.by_id[cycle[0]]
+            names = " -> ".join(self.by_id[vibe_id].file_path.name for vibe_id in cycle + cycle[:1])
+            messages.append(FileError(f"File: {first_task.file_path.name} | Link Error: dependency cycle {names}", first_task.file_path))
+        return messages
+
+# Cached results are validated metadata, so bump this whenever header parsing or validate_task_data
+# (including the date formats it accepts) changes what a file parses to, or the entry layout (TaskFields) changes
+PARSE_CACHE_VERSION = 5
+# Results with these issues hold a date_start defaulted to date.today(), so ParseCache never keeps them
+TODAY_DEFAULTED_ISSUES = frozenset(('missing_date_start', 'invalid_date_start_format'))
+
+def default_cache_path(root_path_str):
+    """Per-vault cache file under the user's local cache directory (outside the vault, so it never syncs)."""
+    cache_dir = Path(os.environ.get('LOCALAPPDATA') or Path.home() / '.cache') / 'VibeGantt'
+    vault_key = hashlib.sha1(str(Path(root_path_str).resolve()).encode('utf-8')).hexdigest()
+    return cache_dir / f"parse_cache_{vault_key}.pickle"
+
+class ParseCache:
+    """On-disk cache of parse_task_file results, keyed by path and invalidated by mtime/size.
+       Metadata is kept as TaskFields, so cached tasks are built without going through a metadata dict."""
+    def __init__(self, cache_path):
+        self.cache_path = Path(cache_path)
+        self.entries = {} # str(path) -> ((mtime_ns, size), TaskFields, content, body_line, validation_issues, error_message, parser)
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False # Entries changed since load/save
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return
         except Exception as e:
-            error_message = f"File: {file.name} | Parsing Error: {e}"
+            print(f"Ignoring unreadable parse cache {self.cache_path}: {e}")
+            return
+        if isinstance(payload, dict) and payload.get('version') == PARSE_CACHE_VERSION:
+            self.entries = payload['entries']
+
+    def save(self):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump({'version': PARSE_CACHE_VERSION, 'entries': self.entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.cache_path)
+        self.dirty = False
+
+    @staticmethod
+    def file_key(file):
+        try:
+            stat_result = file.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def lookup(self, file, key):
+        """The cached ParsedTaskFile of file (its metadata a TaskFields, see task_from_parse_result), or None."""
+        entry = self.entries.get(str(file))
+        if key is None or entry is None or entry[0] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ParsedTaskFile(file, *entry[1:])
+
+    def store(self, result, key):
+        file, metadata, content, body_line, validation_issues, error_message, parser = result
+        if key is None:
+            return
+        if validation_issues and not TODAY_DEFAULTED_ISSUES.isdisjoint(validation_issues):
+            # The start date defaulted to date.today(): caching it would freeze today's date
+            if self.entries.pop(str(file), None) is not None:
+                self.dirty = True
+            return
+        fields = VibeTask(file, metadata, None).fields() if metadata is not None else None
+        self.entries[str(file)] = (key, fields, content, body_line, validation_issues, error_message, parser)
+        self.dirty = True
+
+    def prune(self, task_files):
+        """Drops entries for files that no longer exist (or are no longer task files)."""
+        live_paths = {str(file) for file in task_files}
+        for stale_path in [path for path in self.entries if path not in live_paths]:
+            del self.entries[stale_path]
+            self.dirty = True
+
+def _parse_with_cache(task_files, workers, chunk_size, parse_cache):
+    """Yields parse results in task_files order, serving unchanged files from parse_cache. Files are
+       looked up a chunk at a time and only the misses of a chunk go to the (lazily started) process pool,
+       so cached files stream out immediately; the cache is pruned and saved once every file has been seen."""
+    seen_files = []
+    executor = None
+    pending = deque() # (chunk, keys, cached results, future or None) in file order
+    max_pending = 2 * workers if workers > 1 else 0
+
+    def finish(chunk, keys, cached, future):
+        parsed = iter(future.result() if future else parse_task_chunk([file for file, hit in zip(chunk, cached) if hit is None]))
+        for file, key, result in zip(chunk, keys, cached):
+            if result is None:
+                result = next(parsed)
+                parse_cache.store(result, key)
+            yield result
+
+    try:
+        for chunk in _chunked(task_files, chunk_size):
+            seen_files.extend(chunk)
+            keys = [ParseCache.file_key(file) for file in chunk]
+            cached = [parse_cache.lookup(file, key) for file, key in zip(chunk, keys)]
+            miss_files = [file for file, hit in zip(chunk, cached) if hit is None]
+            future = None
+            if miss_files and workers > 1:
+                if executor is None:
+                    from concurrent.futures import ProcessPoolExecutor
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                future = executor.submit(parse_task_chunk, miss_files)
+            pending.append((chunk, keys, cached, future))
+            while len(pending) > max_pending:
+                yield from finish(*pending.popleft())
+        while pending:
+            yield from finish(*pending.popleft())
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    parse_cache.prune(seen_files)
+    try:
+        if parse_cache.dirty: # A warm start with nothing new leaves the file alone
+            parse_cache.save()
+    except OSError as e:
+        print(f"Could not write parse cache {parse_cache.cache_path}: {e}")
+    print(f"Parse cache: {parse_cache.hits} unchanged, {parse_cache.misses} parsed.")
+
+def iter_project_tasks(root_path_str, workers=1, chunk_size=256, cache_path=None, batch_size=None):
+    """Streaming form of ingest_project_data: yields (task, error_message) pairs as files are parsed, in the
+       order ingest_project_data returns them (either side may be None). Link errors come last, once every
+       task is known. With batch_size, yields lists of up to batch_size pairs instead of single pairs."""
+    pairs = _iter_project_pairs(Path(root_path_str), workers, chunk_size, cache_path)
+    if batch_size:
+        yield from _chunked(pairs, batch_size)
+    else:
+        yield from pairs
+
+def _iter_project_pairs(root_path, workers, chunk_size, cache_path):
+    print(f"Scanning directory: {root_path}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, workers)
+    chunk_size = max(1, chunk_size)
+
+    # Files are discovered lazily, so the first tasks arrive before the whole tree has been listed
+    task_files = iter_task_files(root_path)
+    if cache_path:
+        parsed_files = _parse_with_cache(task_files, workers, chunk_size, ParseCache(cache_path))
+    else:
+        parsed_files = map_file_chunks(parse_task_chunk, task_files, workers, chunk_size)
+
+    all_tasks = []
+    file_count = 0
+    parser_counts = {}
+    for parse_result in parsed_files:
+        file_count += 1
+        parser_counts[parse_result.parser] = parser_counts.get(parse_result.parser, 0) + 1
+        task_obj, error_message = task_from_parse_result(parse_result)
+        if task_obj:
+            all_tasks.append(task_obj)
+        yield task_obj, error_message
+    parsers = ", ".join(f"{name} {count}" for name, count in parser_counts.items() if name)
+    print(f"Processed {file_count} task files (after filtering)." + (f" Header parsers: {parsers}." if parsers else ""))
+
+    for error_message in TaskGraph(all_tasks).issues():
+        yield None, error_message
+
+def ingest_project_data(root_path_str, workers=1, chunk_size=256, cache_path=None):
+    """Scans, parses, and VALIDATES project files.
+       workers > 1 (or None for one per CPU) spreads parsing across a process pool in chunks of chunk_size files;
+       the result order is the same as a sequential run.
+       With cache_path, files whose mtime and size are unchanged since the last run are served from the parse cache.
+       iter_project_tasks is the streaming form of this."""
+    if not root_path_str:
+        print("No folder selected. Aborting.")
+        return [], []
+
+    all_tasks = []
+    ingestion_errors = []
+    for task_obj, error_message in iter_project_tasks(root_path_str, workers, chunk_size, cache_path):
+        if error_message:
             ingestion_errors.append(error_message)
+        if task_obj:
+            all_tasks.append(task_obj)
 
     print("-" * 30)
     print(f"Ingestion Complete. Successfully loaded {len(all_tasks)} tasks.")
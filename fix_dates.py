@@ -1,31 +1,17 @@
+"""Converts date_start/date_end in task headers to MM/DD/YYYY. Kept for old scripts and habits:
+the work is done by migrate_dates.py (`migrate_dates.py VAULT --to us`), which this forwards to."""
+import sys
+from migrate_dates import main, migrate_file
 
-
-import os
-import re
+DEFAULT_TARGET = "C:\\Users\\mkempton\\Documents\\CODEX\\40-PROJECTS"
 
 def fix_date_format_in_file(file_path):
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    # Regex to find date_start and date_end fields with YYYY-MM-DD format
-    # and replace with MM/DD/YYYY format
-    content = re.sub(r"(date_start:\s*)(\d{4})-(\d{2})-(\d{2})", r"\1\3/\4/\2", content)
-    content = re.sub(r"(date_end:\s*)(\d{4})-(\d{2})-(\d{2})", r"\1\3/\4/\2", content)
-
-    with open(file_path, 'w') as f:
-        f.write(content)
+    return migrate_file(file_path, 'us')
 
 def process_directory(directory_path):
-    for filename in os.listdir(directory_path):
-        if filename.endswith(".md"):
-            file_path = os.path.join(directory_path, filename)
-            fix_date_format_in_file(file_path)
-            print(f"Processed {filename}")
+    # One folder, not its subfolders, in this process: the scope process_directory always had
+    return main([str(directory_path), '--to', 'us', '--no-recursive', '-j', '1'])
 
 if __name__ == "__main__":
-    target_directory = "C:\\Users\\mkempton\\Documents\\CODEX\\40-PROJECTS"
-    for root, dirs, files in os.walk(target_directory):
-        if "Task Sheets" in dirs:
-            task_sheets_path = os.path.join(root, "Task Sheets")
-            process_directory(task_sheets_path)
-
+    # Without arguments, migrate the Task Sheets folders of the original vault as before
+    sys.exit(main(['--to', 'us'] + (sys.argv[1:] or [DEFAULT_TARGET, '--task-sheets-only'])))
@@ -1,17 +1,26 @@
+import time
+_STARTUP_STARTED = time.perf_counter() # Before the heavy imports, for the startup timing report
 import sys
 import os
-from tkinter import filedialog, Tk
+from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QMenuBar,
-                             QStatusBar, QWidget, QVBoxLayout, QListWidget,
+                             QStatusBar, QWidget, QVBoxLayout, QListWidget, QListWidgetItem,
                              QSplitter, QPushButton, QAbstractItemView, QFormLayout,
-                             QLineEdit, QTextEdit, QComboBox, QMessageBox, QWidget, QSizePolicy, QScrollArea)
-from PyQt6.QtGui import QAction, QPainter, QColor, QPen, QTextOption, QFont
-from PyQt6.QtCore import Qt, QRectF, QDate, pyqtSignal, QPointF
-from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
-from datetime import date, timedelta, datetime
-from engine import ingest_project_data, VibeTask, validate_task_data
+                             QLineEdit, QTextEdit, QComboBox, QMessageBox, QWidget, QSizePolicy, QScrollArea, QProgressBar,
+                             QFileDialog)
+from PyQt6.QtGui import QAction, QPainter, QColor, QPen, QTextOption, QFont, QImage, QTransform
+from PyQt6.QtCore import Qt, QRectF, QDate, pyqtSignal, QPointF, QSize, QSettings, QTimer, QCoreApplication
+from datetime import date, timedelta
+from engine import (VibeTask, validate_task_data, validate_tasks, issue_codes, parse_date_text, default_cache_path, parse_task_file,
+                    task_from_parse_result, TaskGraph, FileError)
 from GanttChartWidget import GanttChartWidget
-import frontmatter
+from vault_watcher import VaultWatcher
+from task_store import TaskStore
+from task_saver import TaskSaver
+from project_loader import ProjectLoader
+
+LOAD_BATCH_SIZE = 500 # Tasks per batch handed from the loader thread to the GUI
+LOAD_REFRESH_SECONDS = 0.5 # Minimum time between chart/filter refreshes during a load
 
 DARK_THEME_QSS = """
     QWidget {
@@ -126,21 +135,19 @@ class DetailsPanel(QWidget):
 
         parsed_start_date = None
         if start_date_str:
-            try:
-                parsed_start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            except ValueError:
+            parsed_start_date = parse_date_text(start_date_str)
+            if parsed_start_date is None:
                 QMessageBox.warning(self, "Invalid Start Date Format",
-                                    "Start Date could not be parsed. Please use YYYY-MM-DD format.")
+                                    "Start Date could not be parsed. Please use YYYY-MM-DD or MM/DD/YYYY format.")
                 parsed_start_date = self.current_task.metadata.get('date_start', None)
 
 
         parsed_end_date = None
         if end_date_str:
-            try:
-                parsed_end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-            except ValueError:
+            parsed_end_date = parse_date_text(end_date_str)
+            if parsed_end_date is None:
                 QMessageBox.warning(self, "Invalid End Date Format",
-                                    "End Date could not be parsed. Please use YYYY-MM-DD format.")
+                                    "End Date could not be parsed. Please use YYYY-MM-DD or MM/DD/YYYY format.")
                 parsed_end_date = self.current_task.metadata.get('date_end', None)
 
 
@@ -186,16 +193,33 @@ class DetailsPanel(QWidget):
 
 
 class VibeGanttApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, open_last_project=True):
         super().__init__()
         self.setWindowTitle("VibeGantt - Project Flow IDE")
         self.setGeometry(100, 100, 1600, 900)
         self.tasks, self.errors = [], []
+        self.task_store = TaskStore()
+        self.task_graph = TaskGraph()
+        self.vault_watcher = None
+        self.task_saver = TaskSaver(self)
+        self.task_saver.progress.connect(self._on_save_progress)
+        self.task_saver.task_saved.connect(self._on_task_saved)
+        self.task_saver.finished.connect(self._on_save_finished)
+        self.resave_requested = False
+        self.project_loader = None # ProjectLoader thread while a project loads
+        self.project_root = None # Folder of the project on screen
+        self._discarded_edits = set()
+        self.settings = QSettings("VibeGantt", "VibeGantt")
         self._create_menu_bar()
         self._setup_ui()
-        self.load_project() # Automatically load project on startup
+        if open_last_project:
+            # After the window is up, so startup never waits on a dialog or on parsing
+            QTimer.singleShot(0, self._open_startup_project)
 
     def closeEvent(self, event):
+        self._stop_watching()
+        self.cancel_loading(wait=True)
+        self.task_saver.shutdown() # Let a running save finish writing before the app exits
         super().closeEvent(event)
 
     def _setup_ui(self):
@@ -232,11 +256,20 @@ class VibeGanttApp(QMainWindow):
         self.details_panel = DetailsPanel()
         splitter.addWidget(self.details_panel)
         self.gantt_chart.task_clicked.connect(self.details_panel.display_task)
+        self.gantt_chart.tasks_rescheduled.connect(self._on_tasks_rescheduled)
         self.details_panel.task_edited.connect(self.gantt_chart.update) # Trigger chart repaint on task edit
 
         splitter.setSizes([220, 1000, 380])
         self.setCentralWidget(splitter)
         self.setStatusBar(QStatusBar(self))
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0) # Busy indicator: the file count is unknown until the walk ends
+        self.load_progress.setMaximumWidth(160)
+        self.cancel_load_button = QPushButton("Cancel Loading")
+        self.cancel_load_button.clicked.connect(self.cancel_loading)
+        for widget in (self.load_progress, self.cancel_load_button):
+            self.statusBar().addPermanentWidget(widget)
+            widget.hide()
 
     def _create_filter_widget(self, name):
         label = QLabel(f"{name}:")
@@ -259,141 +292,402 @@ class VibeGanttApp(QMainWindow):
         save_all_action.setShortcut("Ctrl+S")
         save_all_action.triggered.connect(self.save_all_changes)
         file_menu.addAction(save_all_action)
+        validate_action = QAction("&Validate All Tasks", self)
+        validate_action.triggered.connect(self.validate_all_tasks)
+        file_menu.addAction(validate_action)
 
         print_action = QAction("&Print Gantt Chart...", self)
         print_action.setShortcut("Ctrl+P")
         print_action.triggered.connect(self.print_gantt_chart)
         file_menu.addAction(print_action)
 
+        self.live_reload_action = QAction("&Watch for External Changes", self)
+        self.live_reload_action.setCheckable(True)
+        self.live_reload_action.setChecked(True)
+        self.live_reload_action.toggled.connect(self._toggle_live_reload)
+        file_menu.addAction(self.live_reload_action)
+
         file_menu.addSeparator()
         exit_action = QAction("E&xit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+    def _open_startup_project(self):
+        """Reopens the last vault, or asks for one when none is remembered."""
+        last_vault = self.settings.value("last_vault", "")
+        if last_vault and Path(last_vault).is_dir():
+            self.open_project(last_vault)
+        else:
+            self.load_project()
+
     def load_project(self):
-        root = Tk()
-        root.withdraw()
-        root_path_str = filedialog.askdirectory(title="Select Root Project Folder")
-        root.destroy()
+        root_path_str = QFileDialog.getExistingDirectory(self, "Select Root Project Folder", self.settings.value("last_vault", ""))
         if not root_path_str:
             self.statusBar().showMessage("Project loading cancelled.", 5000)
             return
+        self.open_project(root_path_str)
 
-        self.tasks, self.errors = ingest_project_data(root_path_str)
+    def open_project(self, root_path_str):
+        self._discarded_edits = set() # ids of tasks whose edits the user chose to discard for this switch
+        if self._is_other_vault(root_path_str) and not self._resolve_unsaved_edits():
+            self.statusBar().showMessage("Opening the vault was cancelled.", 5000)
+            return
+        self.cancel_loading(wait=True)
+        self._stop_watching()
+        # With nothing on screen the chart fills in as batches arrive. Otherwise the current project stays
+        # live (and editable) until the new one is complete, then is swapped out in one step.
+        self._progressive_load = not self.tasks
+        self._loaded_tasks, self._loaded_errors = [], []
+        if self._progressive_load:
+            self.tasks, self.errors = self._loaded_tasks, self._loaded_errors
+            self.task_store = TaskStore()
+            self.task_graph = TaskGraph()
+            self.details_panel.setDisabled(True)
+            self._populate_filter_options()
+        self._loading_root = root_path_str
+        self._next_load_refresh = 0.0
+
+        loader = ProjectLoader(root_path_str, default_cache_path(root_path_str), LOAD_BATCH_SIZE, self)
+        # Signals from a superseded loader are ignored
+        loader.batch_ready.connect(lambda batch: self._on_load_batch(loader, batch))
+        loader.progress.connect(lambda files_done: self._on_load_progress(loader, files_done))
+        loader.finished.connect(lambda: self._on_load_finished(loader))
+        self.project_loader = loader
+        self.load_progress.show()
+        self.cancel_load_button.show()
+        self.statusBar().showMessage("Loading project...")
+        loader.start()
+
+    def cancel_loading(self, wait=False):
+        loader = self.project_loader
+        if loader is None:
+            return
+        loader.requestInterruption()
+        if wait:
+            loader.wait()
+            # Deliver the batches it queued before stopping (and its finished signal), so none are lost
+            QCoreApplication.sendPostedEvents()
+            self._on_load_finished(loader)
+
+    def _on_load_batch(self, loader, batch):
+        if loader is not self.project_loader:
+            return
+        new_tasks = [task for task, _ in batch if task]
+        self._loaded_errors.extend(error for _, error in batch if error)
+        self._loaded_tasks.extend(new_tasks)
+        if not self._progressive_load:
+            return
+        self.task_store.add_tasks(new_tasks)
+        if time.monotonic() >= self._next_load_refresh:
+            started = time.monotonic()
+            self._show_loaded_tasks()
+            # Refreshing is O(tasks), so back off as the project grows to keep the GUI thread responsive
+            self._next_load_refresh = time.monotonic() + max(LOAD_REFRESH_SECONDS, 4 * (time.monotonic() - started))
+
+    def _on_load_progress(self, loader, files_done):
+        if loader is self.project_loader:
+            self.statusBar().showMessage(f"Loading project... {files_done} files read.")
+
+    def _show_loaded_tasks(self):
+        self.task_graph = TaskGraph(self.tasks)
+        self._refresh_filter_options()
+        self.apply_filters()
+
+    def _on_load_finished(self, loader):
+        if loader is not self.project_loader:
+            return
+        self.project_loader = None
+        self.load_progress.hide()
+        self.cancel_load_button.hide()
+        if loader.cancelled or loader.error:
+            outcome = "cancelled" if loader.cancelled else f"failed: {loader.error}"
+            if self._progressive_load:
+                self._show_loaded_tasks() # Keep what was read so far
+                self.project_root = self._loading_root # The tasks on screen come from it
+                self.statusBar().showMessage(f"Loading {outcome}. Showing the {len(self.tasks)} tasks read so far.")
+            else:
+                self.statusBar().showMessage(f"Loading {outcome}. The previous project is unchanged.", 5000)
+            if self.project_root is not None and self.live_reload_action.isChecked():
+                self._start_watching() # open_project stopped it for the load
+            return
+
+        if self._progressive_load:
+            self._show_loaded_tasks()
+        else:
+            switching = self._is_other_vault(self._loading_root)
+            if switching and not self._resolve_unsaved_edits(): # Edits made while the new vault loaded
+                self.statusBar().showMessage("Opening the vault was cancelled. The previous project is unchanged.", 5000)
+                if self.live_reload_action.isChecked():
+                    self._start_watching()
+                return
+            self._swap_in_project(self._loaded_tasks, self._loaded_errors, keep_edits=not switching)
+        self.project_root = self._loading_root
+        self.settings.setValue("last_vault", self.project_root) # Only a completed load is reopened at startup
         status_message = f"Loaded {len(self.tasks)} tasks."
         if self.errors: status_message += f" Found {len(self.errors)} issues."
         self.statusBar().showMessage(status_message)
-        self._populate_filter_options()
-        self.apply_filters() # Apply initial filter after loading tasks
-        self.details_panel.setDisabled(True)
+        if self.live_reload_action.isChecked():
+            self._start_watching()
+
+    def _swap_in_project(self, tasks, errors, keep_edits=True):
+        """Replaces the loaded project in one step. With keep_edits (a reload of the same vault), tasks with
+           unsaved edits (including the one open in the details panel) replace their freshly read copies, or
+           are kept if their file is gone, so the swap never discards an edit. Switching to another vault
+           passes keep_edits=False once _resolve_unsaved_edits has dealt with them."""
+        edited = {task.file_path: task for task in self.tasks if task.is_dirty} if keep_edits else {}
+        if edited:
+            tasks = [edited.pop(task.file_path, task) for task in tasks] + list(edited.values())
+        current_task = self.details_panel.current_task
+        self.tasks, self.errors = tasks, errors
+        self.task_store = TaskStore(tasks)
+        self._show_loaded_tasks()
+
+        if current_task is None or any(task is current_task for task in tasks):
+            return # Nothing open, or the open edit is the same object in the new project
+        replacement = next((task for task in tasks if task.file_path == current_task.file_path), None)
+        if replacement is not None:
+            self.details_panel.display_task(replacement)
+        else:
+            self.details_panel.current_task = None
+            self.details_panel.setDisabled(True)
+
+    def _is_other_vault(self, root_path_str):
+        if self.project_root is None:
+            return bool(self.tasks) # Tasks from a folder that is not recorded are never merged into another vault
+        return Path(root_path_str) != Path(self.project_root)
+
+    def _resolve_unsaved_edits(self):
+        """Before another vault replaces this one: asks whether to save or discard unsaved edits (those
+           already discarded for this switch are not asked about again). Returns False if the user
+           cancels, or if some edits could not be saved."""
+        dirty = [task for task in self.tasks if task.is_dirty and id(task) not in self._discarded_edits]
+        if not dirty:
+            return True
+        buttons = QMessageBox.StandardButton
+        answer = QMessageBox.question(self, "Unsaved Changes",
+                                      f"{len(dirty)} task(s) have unsaved changes. Save them before opening another vault?",
+                                      buttons.Save | buttons.Discard | buttons.Cancel, buttons.Save)
+        if answer == buttons.Discard:
+            self._discarded_edits.update(id(task) for task in dirty)
+            return True
+        if answer != buttons.Save:
+            return False
+        self.task_saver.wait() # A running save finishes first, so every edit goes out in this one
+        self.save_all_changes()
+        while self.task_saver.busy:
+            self.task_saver.wait()
+        return not any(task.is_dirty for task in self.tasks) # Failed writes were reported and stay dirty
+
+    def _start_watching(self):
+        self._stop_watching()
+        self.vault_watcher = VaultWatcher(self.project_root, self)
+        self.vault_watcher.files_changed.connect(self.apply_external_changes)
+
+    def _stop_watching(self):
+        if self.vault_watcher:
+            self.vault_watcher.stop()
+            self.vault_watcher.deleteLater()
+            self.vault_watcher = None
+
+    def _toggle_live_reload(self, enabled):
+        if not enabled:
+            self._stop_watching()
+        elif getattr(self, 'project_root', None):
+            self._start_watching()
+
+    def apply_external_changes(self, created, modified, deleted, renamed):
+        """Patches self.tasks in place for files changed outside the app, re-parsing only those files.
+           Tasks with unsaved edits are left alone so external changes never clobber them; a deleted file's
+           task is kept too when it has unsaved edits, and the user is warned."""
+        tasks_by_path = {task.file_path: task for task in self.tasks}
+        stale_error_files = {Path(file) for file in deleted}
+        stale_error_files.update(Path(old_file) for old_file, _ in renamed)
+        new_errors = []
+
+        removed_tasks = []
+        kept_deleted = []
+        for file in deleted:
+            task = tasks_by_path.get(file)
+            if task and task.is_dirty:
+                kept_deleted.append(file.name)
+            elif task:
+                removed_tasks.append(tasks_by_path.pop(file))
+        removed = {id(task) for task in removed_tasks}
+        for old_file, new_file in renamed:
+            task = tasks_by_path.pop(old_file, None)
+            if task:
+                task.file_path = new_file
+                tasks_by_path[new_file] = task
+
+        skipped = []
+        new_tasks = []
+        for file in created + modified + [new_file for _, new_file in renamed]:
+            existing = tasks_by_path.get(file)
+            if existing and existing.is_dirty:
+                skipped.append(file.name)
+                continue
+            task_obj, error_message = task_from_parse_result(parse_task_file(file))
+            stale_error_files.add(file)
+            if error_message:
+                new_errors.append(error_message)
+            if task_obj is None:
+                continue
+            if existing:
+                # Update the existing object so references held by the chart and details panel stay valid
+                existing.update_from(task_obj)
+                self.task_store.update_task(existing)
+            else:
+                tasks_by_path[file] = task_obj
+                new_tasks.append(task_obj)
+
+        if removed:
+            self.tasks = [task for task in self.tasks if id(task) not in removed]
+        self.tasks.extend(new_tasks)
+        self.task_store.remove_tasks(removed_tasks)
+        self.task_store.add_tasks(new_tasks)
+        self.task_graph = TaskGraph(self.tasks)
+        self.errors = [error for error in self.errors if getattr(error, 'file', None) not in stale_error_files]
+        self.errors.extend(new_errors)
+
+        current_task = self.details_panel.current_task
+        if current_task and id(current_task) in removed:
+            self.details_panel.current_task = None
+            self.details_panel.setDisabled(True)
+        elif current_task and not current_task.is_dirty and current_task.file_path in set(modified) | {new for _, new in renamed}:
+            self.details_panel.display_task(current_task)
+
+        self._refresh_filter_options()
+        self.apply_filters()
+        change_count = len(created) + len(modified) + len(deleted) + len(renamed)
+        status_message = f"Reloaded {change_count} changed file(s)."
+        if skipped:
+            status_message += f" Kept unsaved edits in {len(skipped)} file(s) changed on disk: {', '.join(skipped)}"
+        self.statusBar().showMessage(status_message, 5000)
+        if kept_deleted:
+            QMessageBox.warning(self, "Files Deleted",
+                                f"{len(kept_deleted)} file(s) with unsaved edits were deleted outside the app: "
+                                f"{', '.join(kept_deleted)}. Their tasks and edits were kept.")
+
+    def _facet_filters(self):
+        return [('project_name', self.project_filter),
+                ('phase', self.phase_filter),
+                ('cost_code', self.cost_code_filter),
+                ('assigned_to', self.assigned_to_filter)]
+
+    def _get_filter_values(self):
+        """(list widget, sorted values, {value: task count}) for each facet filter."""
+        filter_values = []
+        for key, list_widget in self._facet_filters():
+            counts = self.task_store.facet_counts(key)
+            filter_values.append((list_widget, sorted(counts), counts))
+        return filter_values
+
+    def _on_tasks_rescheduled(self, tasks):
+        for task in tasks:
+            self.task_store.update_task(task)
 
     def _populate_filter_options(self):
-        def get_all_values(metadata_key):
-            all_values = set()
-            for t in self.tasks:
-                value = t.metadata.get(metadata_key)
-                if value:
-                    values = value if isinstance(value, list) else [value]
-                    all_values.update(str(v) for v in values) # Ensure values are string for set/sorting
-            return sorted(list(all_values))
-        
         self.project_filter.clearSelection()
         self.phase_filter.clearSelection()
         self.cost_code_filter.clearSelection()
         self.assigned_to_filter.clearSelection()
 
-        for list_widget, items in [(self.project_filter, get_all_values('project_name')),
-                                   (self.phase_filter, get_all_values('phase')),
-                                   (self.cost_code_filter, get_all_values('cost_code')),
-                                   (self.assigned_to_filter, get_all_values('assigned_to'))]:
+        for list_widget, items, counts in self._get_filter_values():
             list_widget.clear()
-            list_widget.addItems(items)
+            for text in items:
+                item = QListWidgetItem(text)
+                item.setToolTip(f"{counts[text]} task(s)")
+                list_widget.addItem(item)
+
+    def _refresh_filter_options(self):
+        """Adds and removes filter entries in place, keeping the user's current selection."""
+        for list_widget, items, counts in self._get_filter_values():
+            list_widget.blockSignals(True)
+            wanted = set(items)
+            for row in range(list_widget.count() - 1, -1, -1):
+                if list_widget.item(row).text() not in wanted:
+                    list_widget.takeItem(row)
+            # Both lists are sorted, so merge the new values into position
+            row = 0
+            for text in items:
+                while row < list_widget.count() and list_widget.item(row).text() < text:
+                    row += 1
+                if row >= list_widget.count() or list_widget.item(row).text() != text:
+                    list_widget.insertItem(row, text)
+                list_widget.item(row).setToolTip(f"{counts[text]} task(s)")
+                row += 1
+            list_widget.blockSignals(False)
 
     def apply_filters(self):
         today = date.today()
         selected_range = self.date_range_filter.currentText()
         if selected_range == "All Time":
-            valid_dates = [d for t in self.tasks for d in [t.metadata.get('date_start'), t.metadata.get('date_end')] if isinstance(d, date)]
-            view_start, view_end = (min(valid_dates), max(valid_dates)) if valid_dates else (today, today + timedelta(days=1))
+            date_bounds = self.task_store.date_bounds()
+            view_start, view_end = (date.fromordinal(date_bounds[0]), date.fromordinal(date_bounds[1])) if date_bounds else (today, today + timedelta(days=1))
         else:
             days = int(selected_range.split()[1]) if "Days" in selected_range else 365
             view_start, view_end = (today, today + timedelta(days=days)) if "Next" in selected_range else (date(today.year, 1, 1), date(today.year, 12, 31))
 
-        selected_projects = {item.text() for item in self.project_filter.selectedItems()}
-        selected_phases = {item.text() for item in self.phase_filter.selectedItems()}
-        selected_cost_codes = {item.text() for item in self.cost_code_filter.selectedItems()}
-        selected_assignees = {item.text() for item in self.assigned_to_filter.selectedItems()}
-        filtered_tasks = []
-        for task in self.tasks:
-            task_start, task_end = task.metadata.get('date_start'), task.metadata.get('date_end')
-            if not (isinstance(task_start, date) and isinstance(task_end, date)):
-                continue
-
-            if task_start > view_end or task_end < view_start:
-                continue
-
-            def check_match(key, selections):
-                if not selections: return True
-                value = task.metadata.get(key)
-                if not value: return False
-                value_list = value if isinstance(value, list) else [value]
-                return any(str(item) in selections for item in value_list)
-
-            if (check_match('project_name', selected_projects) and
-                check_match('phase', selected_phases) and
-                check_match('cost_code', selected_cost_codes) and
-                check_match('assigned_to', selected_assignees)):
-                filtered_tasks.append(task)
-        self.gantt_chart.set_tasks(filtered_tasks, filtered_tasks, view_start, view_end)
+        selections = {key: {item.text() for item in list_widget.selectedItems()} for key, list_widget in self._facet_filters()}
+        if selected_range == "All Time":
+            rows = self.task_store.query(selections=selections) # The window spans every task anyway
+        else:
+            rows = self.task_store.query(view_start.toordinal(), view_end.toordinal(), selections)
+        filtered_tasks = self.task_store.select(rows)
+        self.gantt_chart.set_tasks(filtered_tasks, filtered_tasks, view_start, view_end, self.task_graph)
         self.statusBar().showMessage(f"Rendering {len(filtered_tasks)} tasks.", 3000)
 
     def save_all_changes(self):
         if self.details_panel.current_task and self.details_panel.current_task.is_dirty:
             self.details_panel.update_current_task_object()
+            self.task_store.update_task(self.details_panel.current_task)
 
-        saved_count = 0
-        for task in self.tasks:
-            if task.is_dirty:
-                try:
-                    temp_path = task.file_path.with_suffix('.md.tmp')
-                    post_to_dump = frontmatter.Post(task.content)
-                    
-                    clean_metadata = {}
-                    problematic_keys = {'date_order_due', 'date_precon_due'}
-
-                    for key, value in task.metadata.items():
-                        if key in problematic_keys and isinstance(value, str) and ("=" in value or "$=" in value):
-                            # Skip saving problematic Obsidian DataviewJS expressions directly
-                            continue 
-                        elif isinstance(value, (date, datetime)):
-                            clean_metadata[key] = value.strftime('%Y-%m-%d')
-                        elif isinstance(value, list):
-                            # Ensure all items in the list are strings before joining
-                            clean_metadata[key] = ", ".join(map(str, value))
-                        elif value is None:
-                            clean_metadata[key] = ""
-                        else:
-                            clean_metadata[key] = str(value)
-                    
-                    if task.linked_tasks:
-                        clean_metadata['linked_tasks'] = ", ".join(task.linked_tasks)
-
-                    post_to_dump.metadata = clean_metadata
-                    
-                    with open(temp_path, 'wb') as f:
-                        frontmatter.dump(post_to_dump, f)
-                    os.replace(temp_path, task.file_path)
-                    task.is_dirty = False
-                    saved_count += 1
-                except Exception as e:
-                    print(f"CRITICAL: Failed to save {task.file_path.name}. Error: {e}")
-                    QMessageBox.critical(self, "Save Error", f"Failed to save {task.file_path.name}.\nError: {e}")
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-        self.statusBar().showMessage(f"Successfully saved {saved_count} tasks.", 5000)
+        if self.task_saver.busy:
+            self.resave_requested = True # Saved when the running save finishes
+            self.statusBar().showMessage("Save in progress; new changes will be saved when it finishes.", 5000)
+            return
+        queued = self.task_saver.save(self.tasks)
+        if queued:
+            self.statusBar().showMessage(f"Saving {queued} tasks...")
+        self.gantt_chart.invalidate_tiles() # Saved edits may have changed names and dates of any bar
         self.gantt_chart.update()
 
+    def _on_save_progress(self, done, total):
+        self.statusBar().showMessage(f"Saving tasks... {done}/{total}")
+
+    def _on_task_saved(self, task):
+        if self.vault_watcher:
+            self.vault_watcher.acknowledge([task.file_path])
+
+    def _on_save_finished(self, saved, failed):
+        if failed:
+            self.statusBar().showMessage(f"Saved {len(saved)} tasks; {len(failed)} failed.", 10000)
+            details = "\n".join(f"{task.file_path.name}: {error}" for task, error in failed[:20])
+            if len(failed) > 20:
+                details += f"\n... and {len(failed) - 20} more (see console)."
+            QMessageBox.warning(self, "Save Errors", f"{len(failed)} of {len(saved) + len(failed)} tasks could not be saved "
+                                                     f"and are still marked as changed.\n\n{details}")
+        else:
+            unchanged = f" ({self.task_saver.unchanged} already up to date)" if self.task_saver.unchanged else ""
+            self.statusBar().showMessage(f"Successfully saved {len(saved)} tasks{unchanged}.", 5000)
+        if self.resave_requested:
+            self.resave_requested = False
+            self.save_all_changes()
+
+    def validate_all_tasks(self):
+        """Re-validates every loaded task in one batch (e.g. after edits or a reload) and shows one summary.
+           Validation errors in the issue list are replaced; parse and link errors are kept."""
+        result = validate_tasks(self.tasks)
+        self.errors = [error for error in self.errors if " | Validation Error: " not in error]
+        self.errors.extend(FileError(f"File: {task.file_path.name} | Validation Error: {issue_codes(mask)}", task.file_path)
+                           for task, mask in zip(self.tasks, result.masks) if mask)
+        summary = ", ".join(f"{code} {count}" for code, count in result.issue_counts.items())
+        self.statusBar().showMessage(f"Validated {len(self.tasks)} tasks: {result.flagged} with issues" +
+                                     (f" ({summary})." if summary else "."))
+        return result
+
     def print_gantt_chart(self):
+        from PyQt6.QtPrintSupport import QPrinter, QPrintDialog # Only needed here; kept off the startup path
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         print_dialog = QPrintDialog(printer, self)
         if print_dialog.exec() == QPrintDialog.DialogCode.Accepted:
@@ -460,11 +754,34 @@ class VibeGanttApp(QMainWindow):
         else:
             self.statusBar().showMessage("Print cancelled.", 3000)
 
+def report_startup(marks):
+    """Prints how long each startup phase took; marks are (phase, perf_counter time) in order."""
+    previous = _STARTUP_STARTED
+    phases = []
+    for phase, mark in marks:
+        phases.append(f"{phase} {1000 * (mark - previous):.0f} ms")
+        previous = mark
+    print(f"Startup: {', '.join(phases)}; interactive after {1000 * (previous - _STARTUP_STARTED):.0f} ms")
+
 if __name__ == '__main__':
+    # --startup-report: print the startup timings and quit once the window is interactive (for tracking regressions)
+    report_only = '--startup-report' in sys.argv
+    marks = [("imports", time.perf_counter())]
     app = QApplication(sys.argv)
     app.setStyleSheet(DARK_THEME_QSS)
-    main_window = VibeGanttApp()
+    marks.append(("QApplication", time.perf_counter()))
+    main_window = VibeGanttApp(open_last_project=not report_only)
+    marks.append(("main window", time.perf_counter()))
     main_window.show()
 
-    if os.environ.get('QT_QPA_PLATFORM') != 'offscreen':
-        sys.exit(app.exec())
\ No newline at end of file
+    def on_interactive():
+        # The first event-loop turn after show(): the window is painted and takes input
+        marks.append(("first show", time.perf_counter()))
+        report_startup(marks)
+        if report_only:
+            main_window.close()
+            app.quit()
+    QTimer.singleShot(0, on_interactive)
+
+    if report_only or os.environ.get('QT_QPA_PLATFORM') != 'offscreen':
+        sys.exit(app.exec())
@@ -0,0 +1,121 @@
+"""Synthetic vault generator for benchmarks and load testing.
+
+Writes a vault shaped like a real one: several projects, each with a "Task Sheets" folder of task files
+spread over phases and cost codes, linked_tasks chains (comma strings and YAML lists), list-valued
+assigned_to/phase fields, a mix of ISO and MM/DD/YYYY dates, nested headers that need full YAML, a
+Templates folder per project (which ingestion skips) and a fraction of malformed headers. The same seed
+always produces the same vault.
+
+    python make_vault.py OUT_FOLDER -n 20000 --projects 12 --seed 1
+"""
+import argparse
+import random
+import sys
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+PHASES = ['Preconstruction', 'Sitework', 'Foundation', 'Framing', 'MEP Rough-In', 'Envelope', 'Interiors', 'Closeout']
+PEOPLE = ['Alice', 'Bob', 'Carmen', 'Dev', 'Erin', 'Farid', 'Grace', 'Hiro', 'Ines', 'Jon', 'Kofi', 'Lena']
+WORDS = ['Pour', 'Inspect', 'Install', 'Frame', 'Order', 'Review', 'Submit', 'Wire', 'Paint', 'Test', 'Slab', 'Wall',
+         'Roof', 'Duct', 'Panel', 'Window', 'Door', 'Stair', 'Level 2', 'Core', 'East wing', 'Permit', 'RFI']
+MALFORMED_HEADERS = [
+    "task_name: [unclosed\ndate_start: 2024-01-01\n",
+    "task_name: Bad indent\n  date_start: 2024-01-01\n date_end: 2024-01-02\n",
+    "task_name: \"unterminated\ndate_start: 2024-01-01\n",
+    "task_name: Tabbed\n\tdate_start: 2024-01-01\n",
+]
+TEMPLATE_TEXT = "---\ntask_name: {{title}}\nvibe_id:\nproject_name:\ndate_start: {{date}}\ndate_end:\nlinked_tasks:\n---\n\n## Notes\n"
+
+def _task_header(rng, project, index, vibe_ids, project_start):
+    phase_index = min(len(PHASES) - 1, index * len(PHASES) // max(1, len(vibe_ids)))
+    start = project_start + timedelta(days=phase_index * 30 + rng.randrange(30))
+    end = start + timedelta(days=rng.choice([0, 1, 2, 3, 5, 8, 13, 21]))
+    if rng.random() < 0.01:
+        start, end = end + timedelta(days=3), start # Impossible timeline
+
+    lines = [f"task_name: {rng.choice(WORDS)} {rng.choice(WORDS).lower()} {index}",
+             f"vibe_id: {vibe_ids[index]}",
+             f"project_name: {project}"]
+    if rng.random() < 0.1:
+        lines.append(f"phase: [{PHASES[phase_index]}, {PHASES[min(phase_index + 1, len(PHASES) - 1)]}]")
+    else:
+        lines.append(f"phase: {PHASES[phase_index]}")
+    lines.append(f"cost_code: {phase_index + 1:02d}-{rng.randrange(1, 10) * 100}")
+    people = rng.sample(PEOPLE, rng.choice([1, 1, 1, 2, 3]))
+    if len(people) == 1:
+        lines.append(f"assigned_to: {people[0]}")
+    else:
+        lines.append("assigned_to:")
+        lines.extend(f"  - {person}" for person in people)
+
+    us_dates = rng.random() < 0.15 # Files that went through fix_dates.py
+    for key, value in (('date_start', start), ('date_end', end)):
+        lines.append(f"{key}: {value.month:02d}/{value.day:02d}/{value.year}" if us_dates else f"{key}: {value.isoformat()}")
+
+    # Chains inside a project: linked_tasks are successors (they start after this task ends), so most
+    # tasks link forward to the next task and some also to one a few places further on
+    if index + 1 < len(vibe_ids) and rng.random() < 0.7:
+        links = [vibe_ids[index + 1]]
+        if index + 6 < len(vibe_ids) and rng.random() < 0.3:
+            links.append(vibe_ids[rng.randrange(index + 2, index + 6)])
+        lines.append(f"linked_tasks: [{', '.join(links)}]" if rng.random() < 0.3 else f"linked_tasks: {', '.join(links)}")
+    if rng.random() < 0.5:
+        lines.append(f"hours_est: {rng.randrange(1, 80)}")
+    if rng.random() < 0.05:
+        lines.append("checklist:\n  permits: done\n  inspection: pending") # Nested: needs full YAML
+    return "\n".join(lines) + "\n"
+
+def _task_body(rng, index):
+    paragraphs = [" ".join(rng.choice(WORDS).lower() for _ in range(rng.randrange(8, 40))) for _ in range(rng.randrange(0, 4))]
+    return f"# Task {index}\n\n" + "\n\n".join(paragraphs) + "\n"
+
+def generate_vault(root_path, task_count, projects=8, seed=0, malformed_ratio=0.01, templates_per_project=3):
+    """Writes task_count task files (malformed ones included) under root_path. Returns a summary dict."""
+    rng = random.Random(seed)
+    root_path = Path(root_path)
+    projects = max(1, min(projects, task_count or 1))
+    written = malformed = 0
+    for project_index in range(projects):
+        project = f"Project {chr(ord('A') + project_index % 26)}{project_index // 26 or ''}"
+        project_folder = root_path / project
+        sheets_folder = project_folder / "Task Sheets"
+        sheets_folder.mkdir(parents=True, exist_ok=True)
+        templates_folder = project_folder / "Templates"
+        templates_folder.mkdir(exist_ok=True)
+        for template_index in range(templates_per_project):
+            (templates_folder / f"Template {template_index}.md").write_text(TEMPLATE_TEXT, encoding='utf-8')
+
+        count = task_count // projects + (1 if project_index < task_count % projects else 0)
+        vibe_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(count)]
+        project_start = date(2024, 1, 1) + timedelta(days=rng.randrange(365))
+        for index in range(count):
+            if rng.random() < malformed_ratio:
+                header = rng.choice(MALFORMED_HEADERS)
+                malformed += 1
+            else:
+                header = _task_header(rng, project, index, vibe_ids, project_start)
+            text = f"---\n{header}---\n\n{_task_body(rng, index)}"
+            (sheets_folder / f"{project} task {index:05d}.md").write_text(text, encoding='utf-8')
+            written += 1
+    return {'tasks': written, 'malformed': malformed, 'projects': projects, 'templates': projects * templates_per_project}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic VibeGantt vault.")
+    parser.add_argument('root', help="Folder to write the vault into (created if missing)")
+    parser.add_argument('-n', '--tasks', type=int, default=5000, help="Number of task files (default 5000)")
+    parser.add_argument('--projects', type=int, default=8, help="Number of projects (default 8)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default 0)")
+    parser.add_argument('--malformed', type=float, default=0.01, help="Fraction of files with broken headers (default 0.01)")
+    args = parser.parse_args(argv)
+
+    root_path = Path(args.root)
+    if root_path.exists() and any(root_path.iterdir()):
+        print(f"Error: {root_path} is not empty.", file=sys.stderr)
+        return 2
+    summary = generate_vault(root_path, args.tasks, args.projects, args.seed, args.malformed)
+    print(f"Wrote {summary['tasks']} task files ({summary['malformed']} malformed) in {summary['projects']} projects to {root_path}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
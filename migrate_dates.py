@@ -0,0 +1,135 @@
+"""Bulk date-format migration: rewrites date fields in the YAML header of every task file under a folder.
+
+Only unindented `field: value` lines inside the frontmatter block are touched; the note body and every
+other byte of the file are left alone. Files with nothing to change are not written, and changed files
+are replaced atomically (temp file + rename), so a sync client only sees the files that really changed.
+Files are read and rewritten on a process pool in chunks, like validate_vault.
+
+    python migrate_dates.py VAULT --to iso             # 01/05/2024 -> 2024-01-05
+    python migrate_dates.py VAULT --to us --dry-run    # count what would change, write nothing
+
+Exit codes: 0 done, 1 some files could not be read or written, 2 bad arguments or missing folder.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from engine import iter_task_files, map_file_chunks, split_frontmatter, replace_file_text, parse_date_text
+
+EXIT_OK, EXIT_ERRORS, EXIT_USAGE = 0, 1, 2
+
+DATE_FORMATS = {'iso': '{0.year:04d}-{0.month:02d}-{0.day:02d}', 'us': '{0.month:02d}/{0.day:02d}/{0.year:04d}'}
+DEFAULT_FIELDS = ('date_start', 'date_end')
+
+# field, separator, optional quote, the date itself, closing quote, trailing spaces/comment, line ending
+_HEADER_DATE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)(\s*:[ \t]*)(['\"]?)([0-9][0-9/-]*[0-9])\3([ \t]*(?:#.*)?)(\r?\n)?$")
+
+def migrate_header_dates(text, to_format, fields=DEFAULT_FIELDS):
+    """Rewrites the dates of fields in the header of a task file's text into to_format ('iso' or 'us').
+       Returns (new text, number of dates changed); values that are not dates are left as they are."""
+    lines = text.splitlines(keepends=True)
+    parts = split_frontmatter(lines)
+    if parts is None:
+        return text, 0
+    lead, header_lines, closing, body_lines = parts
+    date_format = DATE_FORMATS[to_format]
+    changes = 0
+    for index, line in enumerate(header_lines):
+        match = _HEADER_DATE.match(line)
+        if match is None or match.group(1) not in fields:
+            continue
+        key, separator, quote, value, trailing, newline = match.groups()
+        parsed = parse_date_text(value)
+        if parsed is None:
+            continue
+        new_value = date_format.format(parsed)
+        if new_value != value:
+            header_lines[index] = f"{key}{separator}{quote}{new_value}{quote}{trailing}{newline or ''}"
+            changes += 1
+    if not changes:
+        return text, 0
+    return ''.join(lead + header_lines + [closing] + body_lines), changes
+
+def migrate_file(file, to_format, fields=DEFAULT_FIELDS, dry_run=False):
+    """Migrates one file in place (unless dry_run). Returns the number of dates changed."""
+    with open(file, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    new_text, changes = migrate_header_dates(text, to_format, fields)
+    if changes and not dry_run:
+        replace_file_text(file, new_text)
+    return changes
+
+def migrate_chunk(files, to_format, fields, dry_run):
+    """Worker entry point: (file, dates changed, error message or None) for each file of a chunk."""
+    results = []
+    for file in files:
+        try:
+            results.append((file, migrate_file(file, to_format, fields, dry_run), None))
+        except Exception as e:
+            results.append((file, 0, f"{type(e).__name__}: {e}"))
+    return results
+
+def iter_migration_files(root_path, task_sheets_only=False, recursive=True):
+    """Task files under root_path, or only those directly in it when not recursive; with task_sheets_only,
+       just those directly inside a "Task Sheets" folder (the old scripts' scope)."""
+    if recursive:
+        files = iter_task_files(root_path)
+    else:
+        files = (Path(root_path, name) for name in sorted(os.listdir(root_path))
+                 if name.endswith('.md') and os.path.isfile(os.path.join(root_path, name)))
+    for file in files:
+        if not task_sheets_only or file.parent.name == 'Task Sheets':
+            yield file
+
+def migrate_vault(root_path, to_format, fields=DEFAULT_FIELDS, dry_run=False, workers=1, chunk_size=256,
+                  task_sheets_only=False, recursive=True):
+    """Yields (file, dates changed, error message or None) for every task file under root_path, in walk order."""
+    worker = partial(migrate_chunk, to_format=to_format, fields=tuple(fields), dry_run=dry_run)
+    yield from map_file_chunks(worker, iter_migration_files(root_path, task_sheets_only, recursive), workers, chunk_size)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the date fields in every task file's header to one format.")
+    parser.add_argument('root', help="Vault or project folder to migrate")
+    parser.add_argument('--to', required=True, choices=sorted(DATE_FORMATS), help="Target format: iso (YYYY-MM-DD) or us (MM/DD/YYYY)")
+    parser.add_argument('--fields', default=','.join(DEFAULT_FIELDS), help="Comma-separated header fields to convert (default: date_start,date_end)")
+    parser.add_argument('--dry-run', action='store_true', help="Count the dates that would change without writing anything")
+    parser.add_argument('--task-sheets-only', action='store_true', help='Only files directly inside a "Task Sheets" folder')
+    parser.add_argument('--no-recursive', dest='recursive', action='store_false', help="Only files directly in the folder, not in subfolders")
+    parser.add_argument('-j', '--workers', type=int, default=0, help="Worker processes (0 = one per CPU, the default)")
+    parser.add_argument('--chunk-size', type=int, default=256, help="Files per worker batch (default 256)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Print only the summary")
+    args = parser.parse_args(argv)
+
+    root_path = Path(args.root)
+    if not root_path.is_dir():
+        print(f"Error: {root_path} is not a folder.", file=sys.stderr)
+        return EXIT_USAGE
+    fields = tuple(field.strip() for field in args.fields.split(',') if field.strip())
+    workers = max(1, args.workers or os.cpu_count() or 1)
+
+    started = time.perf_counter()
+    scanned = changed_files = changed_dates = 0
+    errors = []
+    for file, changes, error in migrate_vault(root_path, args.to, fields, args.dry_run, workers, max(1, args.chunk_size),
+                                              args.task_sheets_only, args.recursive):
+        scanned += 1
+        relative = file.relative_to(root_path)
+        if error:
+            errors.append(error)
+            print(f"Error: {relative}: {error}", file=sys.stderr)
+        elif changes:
+            changed_files += 1
+            changed_dates += changes
+            if not args.quiet:
+                print(f"{relative}: {changes} date{'s' if changes != 1 else ''}")
+
+    verb = "Would change" if args.dry_run else "Changed"
+    print(f"{verb} {changed_dates} dates in {changed_files} of {scanned} files"
+          f"{f', {len(errors)} errors' if errors else ''} ({time.perf_counter() - started:.2f}s).")
+    return EXIT_ERRORS if errors else EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())
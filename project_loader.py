@@ -0,0 +1,36 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from engine import iter_project_tasks
+
+class ProjectLoader(QThread):
+    """Runs iter_project_tasks on a worker thread and hands batches of (task, error) pairs to the GUI thread.
+
+    requestInterruption() cancels between batches (the parse cache is then left as it was);
+    after finished, cancelled and error tell the GUI how the load ended."""
+    batch_ready = pyqtSignal(list) # (task, error) pairs
+    progress = pyqtSignal(int) # Task files processed so far
+
+    def __init__(self, root_path, cache_path=None, batch_size=500, parent=None):
+        super().__init__(parent)
+        self.root_path = root_path
+        self.cache_path = cache_path
+        self.batch_size = batch_size
+        self.cancelled = False
+        self.error = None
+
+    def run(self):
+        files_done = 0
+        batches = iter_project_tasks(self.root_path, cache_path=self.cache_path, batch_size=self.batch_size)
+        try:
+            for batch in batches:
+                if self.isInterruptionRequested():
+                    self.cancelled = True
+                    break
+                # Every file yields a task or a parse error; link errors at the end are not files
+                files_done += sum(1 for task, error in batch if task is not None or "| Parsing Error:" in error)
+                self.batch_ready.emit(batch)
+                self.progress.emit(files_done)
+        except Exception as e:
+            self.error = str(e)
+            print(f"CRITICAL: Loading {self.root_path} failed. Error: {e}")
+        finally:
+            batches.close()
@@ -1,28 +1,17 @@
-import os
-import re
+"""Converts date_start/date_end in task headers back to YYYY-MM-DD. Kept for old scripts and habits:
+the work is done by migrate_dates.py (`migrate_dates.py VAULT --to iso`), which this forwards to."""
+import sys
+from migrate_dates import main, migrate_file
 
-def revert_date_format_in_file(file_path):
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    # Regex to find date_start and date_end fields with MM/DD/YYYY format
-    # and replace with YYYY-MM-DD format
-    content = re.sub(r"(date_start:\s*)(\d{2})/(\d{2})/(\d{4})", r"\1\4-\2-\3", content)
-    content = re.sub(r"(date_end:\s*)(\d{2})/(\d{2})/(\d{4})", r"\1\4-\2-\3", content)
+DEFAULT_TARGET = r"C:\Users\mkempton\Documents\CODEX\40-PROJECTS"
 
-    with open(file_path, 'w') as f:
-        f.write(content)
+def revert_date_format_in_file(file_path):
+    return migrate_file(file_path, 'iso')
 
 def process_directory(directory_path):
-    for filename in os.listdir(directory_path):
-        if filename.endswith(".md"):
-            file_path = os.path.join(directory_path, filename)
-            revert_date_format_in_file(file_path)
-            print(f"Processed {filename}")
+    # One folder, not its subfolders, in this process: the scope process_directory always had
+    return main([str(directory_path), '--to', 'iso', '--no-recursive', '-j', '1'])
 
 if __name__ == "__main__":
-    target_directory = r"C:\Users\mkempton\Documents\CODEX\40-PROJECTS"
-    for root, dirs, files in os.walk(target_directory):
-        if "Task Sheets" in dirs:
-            task_sheets_path = os.path.join(root, "Task Sheets")
-            process_directory(task_sheets_path)
+    # Without arguments, migrate the Task Sheets folders of the original vault as before
+    sys.exit(main(['--to', 'iso'] + (sys.argv[1:] or [DEFAULT_TARGET, '--task-sheets-only'])))
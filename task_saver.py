@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from PyQt6.QtCore import QObject, QCoreApplication, pyqtSignal
+from engine import write_task_file
+
+class TaskSaver(QObject):
+    """Writes dirty tasks through a thread pool so the GUI keeps running during big saves.
+
+    A save snapshots each task's metadata (and body, if loaded) on the GUI thread and clears is_dirty,
+    so edits made while it runs mark the task dirty again and go out with the next save. Per-file
+    results are queued back to the GUI thread; a file that fails is marked dirty again and reported
+    in the finished summary instead of stopping the rest."""
+    progress = pyqtSignal(int, int) # files done, files in this save
+    task_saved = pyqtSignal(object) # Each task as its file is replaced
+    finished = pyqtSignal(list, list) # saved tasks, (task, error message) pairs that failed
+    _file_done = pyqtSignal(object, object, str, object) # Emitted from worker threads: task, write_task_file result, error ("" on success), old body_line
+
+    def __init__(self, parent=None, workers=4):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.futures = []
+        self.total = 0
+        self.done = 0
+        self.saved, self.failed = [], []
+        self.unchanged = 0 # Saved tasks whose file already had the same bytes
+        self._file_done.connect(self._on_file_done)
+
+    @property
+    def busy(self):
+        return self.done < self.total
+
+    def save(self, tasks):
+        """Starts writing the dirty tasks among tasks. Returns how many were queued (0 while a save is running)."""
+        if self.busy:
+            return 0
+        dirty_tasks = [task for task in tasks if task.is_dirty]
+        self.total, self.done = len(dirty_tasks), 0
+        self.saved, self.failed = [], []
+        self.unchanged = 0
+        self.futures = []
+        for task in dirty_tasks:
+            task.is_dirty = False
+            content = task.content if task.content_loaded else None
+            body_line = task.body_line
+            # The header above the body may change size when the file is replaced, so until the new offset
+            # arrives a lazy body load re-parses the whole file (whichever version is on disk) instead
+            task.body_line = None
+            future = self.executor.submit(write_task_file, task.file_path, task.metadata.copy(), content,
+                                          body_line, tuple(task.linked_tasks))
+            future.add_done_callback(lambda future, task=task, body_line=body_line:
+                                     self._file_done.emit(task, self._result(future), self._error_text(future), body_line))
+            self.futures.append(future)
+        if not dirty_tasks:
+            self.finished.emit([], [])
+        return len(dirty_tasks)
+
+    @staticmethod
+    def _result(future):
+        return None if future.exception() is not None else future.result()
+
+    @staticmethod
+    def _error_text(future):
+        error = future.exception()
+        return "" if error is None else (str(error) or type(error).__name__)
+
+    def _on_file_done(self, task, result, error, old_body_line):
+        self.done += 1
+        if error:
+            task.is_dirty = True
+            task.body_line = old_body_line # The file was not replaced
+            self.failed.append((task, error))
+            print(f"CRITICAL: Failed to save {task.file_path.name}. Error: {error}")
+        else:
+            written, task.body_line = result # The header may have grown or shrunk above the body
+            self.saved.append(task)
+            if written:
+                self.task_saved.emit(task)
+            else:
+                self.unchanged += 1
+        self.progress.emit(self.done, self.total)
+        if self.done == self.total:
+            self.finished.emit(self.saved, self.failed)
+
+    def wait(self):
+        """Blocks until the current save is written and its results are delivered."""
+        wait(self.futures)
+        while self.busy:
+            QCoreApplication.processEvents()
+
+    def shutdown(self):
+        self.wait()
+        self.executor.shutdown()
@@ -0,0 +1,247 @@
+import numpy as np
+from bisect import bisect_left, bisect_right, insort
+from engine import FACET_KEYS
+
+NO_DATE = 0 # date.toordinal() is always >= 1, so 0 marks a missing/unvalidated date
+
+def bits_to_mask(bits, row_count):
+    """Expands an int bitset (bit i = row i) into a boolean NumPy row mask."""
+    raw = bits.to_bytes((row_count + 7) // 8, 'little')
+    return np.unpackbits(np.frombuffer(raw, dtype=np.uint8), bitorder='little')[:row_count].astype(bool)
+
+def rows_to_bits(rows, row_count):
+    """Packs row indices into an int bitset in one vectorized step (avoids n big-int ORs)."""
+    mask = np.zeros(row_count, dtype=bool)
+    mask[rows] = True
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+class FacetIndex:
+    """Inverted index from each facet value to an int bitset of the rows using it.
+       Multi-valued (list) fields set the row's bit under every item."""
+    def __init__(self):
+        self.bitsets = {} # string value -> int bitset of rows
+        self.row_values = {} # row -> tuple of string values, so edits can clear the old bits
+
+    @staticmethod
+    def encode(value):
+        # Same rules as the old per-task check: falsy values never match, list items are compared as strings
+        if not value:
+            return ()
+        if type(value) is str:
+            return (value,)
+        items = value if isinstance(value, list) else [value]
+        return tuple(dict.fromkeys(str(item) for item in items))
+
+    def add_many(self, row_value_pairs, row_count):
+        rows_by_text = {}
+        encode, row_values = self.encode, self.row_values
+        for row, value in row_value_pairs:
+            values = encode(value)
+            if values:
+                row_values[row] = values
+                for text in values:
+                    rows = rows_by_text.get(text)
+                    if rows is None:
+                        rows_by_text[text] = [row]
+                    else:
+                        rows.append(row)
+        for text, rows in rows_by_text.items():
+            self.bitsets[text] = self.bitsets.get(text, 0) | rows_to_bits(rows, row_count)
+
+    def remove_many(self, rows, row_count):
+        rows_by_text = {}
+        for row in rows:
+            for text in self.row_values.pop(row, ()):
+                rows_by_text.setdefault(text, []).append(row)
+        for text, text_rows in rows_by_text.items():
+            remaining = self.bitsets[text] & ~rows_to_bits(text_rows, row_count)
+            if remaining:
+                self.bitsets[text] = remaining
+            else:
+                del self.bitsets[text]
+
+    def select(self, selections):
+        """Union of the bitsets of the selected values."""
+        bits = 0
+        for text in selections:
+            bits |= self.bitsets.get(text, 0)
+        return bits
+
+    def counts(self):
+        return {text: bits.bit_count() for text, bits in self.bitsets.items()}
+
+class IntervalIndex:
+    """Answers "which spans overlap [a, b]" over integer (ordinal) spans, with incremental updates.
+
+    Spans are bucketed by length class (class c holds lengths below 2**c) and each bucket keeps its
+    starts sorted. A span of class c that overlaps [a, b] must start inside [a - 2**c + 1, b], so a
+    query is one bisect per bucket plus a scan of that start range, where at most the span's own
+    length class worth of starts are false positives. Cost is O(C log n + k) for C length classes
+    (about 12 for spans up to ten years) and k results."""
+    def __init__(self, spans=()):
+        self.spans = {} # key -> (start, end)
+        self.buckets = {} # length class -> sorted list of (start, key)
+        grouped = {}
+        for key, start, end in spans:
+            self.spans[key] = (start, end)
+            grouped.setdefault(self._length_class(start, end), []).append((start, key))
+        for length_class, entries in grouped.items():
+            entries.sort()
+            self.buckets[length_class] = entries
+
+    @staticmethod
+    def _length_class(start, end):
+        return max(0, end - start).bit_length()
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __contains__(self, key):
+        return key in self.spans
+
+    def add(self, key, start, end):
+        if key in self.spans:
+            self.remove(key)
+        self.spans[key] = (start, end)
+        insort(self.buckets.setdefault(self._length_class(start, end), []), (start, key))
+
+    def remove(self, key):
+        span = self.spans.pop(key, None)
+        if span is None:
+            return
+        bucket = self.buckets[self._length_class(*span)]
+        del bucket[bisect_left(bucket, (span[0], key))]
+
+    def update(self, key, start, end):
+        if self.spans.get(key) != (start, end):
+            self.add(key, start, end)
+
+    def overlapping(self, view_start, view_end):
+        """Keys of spans with start <= view_end and end >= view_start, in no particular order."""
+        spans = self.spans
+        found = []
+        for length_class, bucket in self.buckets.items():
+            max_length = (1 << length_class) - 1
+            low = bisect_left(bucket, (view_start - max_length,))
+            high = bisect_right(bucket, (view_end, float('inf')))
+            for _, key in bucket[low:high]:
+                if spans[key][1] >= view_start:
+                    found.append(key)
+        return found
+
+class TaskStore:
+    """Columnar copy of the schedule and facet fields of a task list.
+       Start/end dates are ordinal ints in NumPy arrays and each facet has a bitset inverted index, so a
+       date-window + facet filter is a bitset union per facet, an intersection across facets and an
+       IntervalIndex lookup for the window. Rows of removed tasks are tombstoned and reclaimed by compaction."""
+    def __init__(self, tasks=()):
+        self.rebuild(tasks)
+
+    def rebuild(self, tasks):
+        self.tasks = list(tasks)
+        self.row_of = {id(task): row for row, task in enumerate(self.tasks)}
+        self.start = np.fromiter((task.start_ord or NO_DATE for task in self.tasks), dtype=np.int64, count=len(self.tasks))
+        self.end = np.fromiter((task.end_ord or NO_DATE for task in self.tasks), dtype=np.int64, count=len(self.tasks))
+        self.alive = np.ones(len(self.tasks), dtype=bool)
+        self.dead_count = 0
+        self.facets = {key: FacetIndex() for key in FACET_KEYS}
+        for key, index in self.facets.items():
+            index.add_many(((row, task.facet(key)) for row, task in enumerate(self.tasks)), len(self.tasks))
+        self.intervals = IntervalIndex((row, task.start_ord, task.end_ord) for row, task in enumerate(self.tasks)
+                                       if task.start_ord and task.end_ord)
+
+    def __len__(self):
+        return len(self.tasks) - self.dead_count
+
+    def add_tasks(self, tasks):
+        tasks = [task for task in tasks if id(task) not in self.row_of]
+        if not tasks:
+            return
+        first_row = len(self.tasks)
+        self.tasks.extend(tasks)
+        self.start = np.concatenate([self.start, np.fromiter((task.start_ord or NO_DATE for task in tasks), dtype=np.int64, count=len(tasks))])
+        self.end = np.concatenate([self.end, np.fromiter((task.end_ord or NO_DATE for task in tasks), dtype=np.int64, count=len(tasks))])
+        self.alive = np.concatenate([self.alive, np.ones(len(tasks), dtype=bool)])
+        for row, task in enumerate(tasks, first_row):
+            self.row_of[id(task)] = row
+            if task.start_ord and task.end_ord:
+                self.intervals.add(row, task.start_ord, task.end_ord)
+        for key, index in self.facets.items():
+            index.add_many(((row, task.facet(key)) for row, task in enumerate(tasks, first_row)), len(self.tasks))
+
+    def remove_tasks(self, tasks):
+        rows = [self.row_of.pop(id(task)) for task in tasks if id(task) in self.row_of]
+        if not rows:
+            return
+        for index in self.facets.values():
+            index.remove_many(rows, len(self.tasks))
+        for row in rows:
+            self.tasks[row] = None
+            self.intervals.remove(row)
+        self.alive[rows] = False
+        self.dead_count += len(rows)
+        if self.dead_count > 1024 and self.dead_count * 2 > len(self.tasks):
+            self.rebuild(task for task in self.tasks if task is not None)
+
+    def update_task(self, task):
+        """Re-reads one task's dates and facet values after it was edited."""
+        row = self.row_of.get(id(task))
+        if row is None:
+            return
+        self.start[row] = task.start_ord or NO_DATE
+        self.end[row] = task.end_ord or NO_DATE
+        if task.start_ord and task.end_ord:
+            self.intervals.update(row, task.start_ord, task.end_ord)
+        else:
+            self.intervals.remove(row)
+        for key, index in self.facets.items():
+            index.remove_many([row], len(self.tasks))
+            index.add_many([(row, task.facet(key))], len(self.tasks))
+
+    def facet_counts(self, key):
+        """{value: number of tasks using it} for one facet."""
+        return self.facets[key].counts()
+
+    def facet_values(self, key):
+        """Sorted distinct values currently used by at least one task."""
+        return sorted(self.facets[key].bitsets)
+
+    def date_bounds(self):
+        """(earliest, latest) ordinal over all valid start and end dates, or None when there are none."""
+        starts = self.start[self.alive & (self.start != NO_DATE)]
+        ends = self.end[self.alive & (self.end != NO_DATE)]
+        if not len(starts) and not len(ends):
+            return None
+        both = np.concatenate([starts, ends])
+        return int(both.min()), int(both.max())
+
+    def query(self, view_start=None, view_end=None, selections=None):
+        """Row indices (ascending) of tasks with valid dates overlapping [view_start, view_end] (ordinals)
+           that match every facet in selections ({facet key: set of values}; empty sets match everything)."""
+        row_count = len(self.tasks)
+        facet_bits = None
+        for key, selected in (selections or {}).items():
+            if selected:
+                bits = self.facets[key].select(selected)
+                facet_bits = bits if facet_bits is None else facet_bits & bits
+                if not facet_bits:
+                    return np.empty(0, dtype=np.int64)
+
+        if view_start is not None and view_end is not None:
+            # Windowed presets only touch the tasks the interval index returns
+            rows = np.array(sorted(self.intervals.overlapping(view_start, view_end)), dtype=np.int64)
+            if facet_bits is not None and len(rows):
+                rows = rows[bits_to_mask(facet_bits, row_count)[rows]]
+            return rows
+
+        mask = self.alive & (self.start != NO_DATE) & (self.end != NO_DATE)
+        if view_end is not None:
+            mask &= self.start <= view_end
+        if view_start is not None:
+            mask &= self.end >= view_start
+        if facet_bits is not None:
+            mask &= bits_to_mask(facet_bits, row_count)
+        return np.flatnonzero(mask)
+
+    def select(self, rows):
+        return [self.tasks[row] for row in rows]
@@ -0,0 +1,33 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from benchmark import main, compare, DEFAULT_OUTPUT
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_smoke_run_writes_results(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir, "bench.json")
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(main(['--tasks', '40', '--repeat', '1', '--output', str(output)]), 0)
+            report = json.loads(output.read_text(encoding='utf-8'))
+
+        names = {(result['name'], result['variant']) for result in report['results']}
+        self.assertIn(('ingest_project_data', 'cached'), names)
+        self.assertIn(('apply_filters', 'facets'), names)
+        self.assertIn(('render', 'zoom 0.05'), names)
+        self.assertIn(('save_all_changes', 'all dirty'), names)
+        self.assertTrue(all(result['best'] >= 0 and result['tasks'] == 40 for result in report['results']))
+
+        slower = [dict(result, best=result['best'] * 2 + 0.001) for result in report['results']]
+        lines = compare(slower, report['results'])
+        self.assertEqual(len(lines), len(report['results']))
+
+    def test_default_output_is_json(self):
+        self.assertEqual(Path(DEFAULT_OUTPUT).suffix, '.json')
+
+if __name__ == '__main__':
+    unittest.main()
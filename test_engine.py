@@ -1,4 +1,6 @@
+import tempfile
 import unittest
+import frontmatter
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 from datetime import date, timedelta
@@ -8,7 +10,10 @@ import sys
 sys.modules['tkinter'] = MagicMock()
 sys.modules['tkinter.filedialog'] = MagicMock()
 
-from engine import VibeTask, validate_task_data
+from engine import (VibeTask, validate_task_data, ingest_project_data, ParseCache, snapshot_task_files, diff_task_snapshots,
+                    parse_task_file, TaskGraph, write_task_file, load_task_body, read_frontmatter_header,
+                    parse_header_text, set_header_parsers, parse_date_value,
+                    validate_tasks, issue_codes)
 
 class TestEngine(unittest.TestCase):
 
@@ -18,6 +23,28 @@ class TestEngine(unittest.TestCase):
         self.assertEqual(task.content, "Test Content")
         self.assertFalse(task.is_dirty)
 
+    def test_vibe_task_metadata_view(self):
+        metadata = {"task_name": "Test Task", "project_name": "Proj" + "ect A", "assigned_to": ["Al" + "ice"],
+                    "date_start": date(2024, 1, 1), "date_end": "2024-01-05", "hours_est": 8}
+        task = VibeTask(Path("test.md"), metadata, "")
+        self.assertEqual(task.metadata, metadata)
+        self.assertEqual(task.start_ord, date(2024, 1, 1).toordinal())
+        self.assertIsNone(task.end_ord) # Unvalidated strings stay as-is in the overflow dict
+        # Compared with the interned copies: other tests may have interned these values first
+        self.assertIs(task.project_name, sys.intern("Proj" + "ect A"))
+        self.assertIs(task.assigned_to[0], sys.intern("Al" + "ice"))
+
+        task.metadata['date_end'] = date(2024, 1, 6)
+        task.metadata.setdefault('linked_tasks', []).append("other-id")
+        del task.metadata['hours_est']
+        self.assertEqual(task.end_ord, date(2024, 1, 6).toordinal())
+        self.assertEqual(task.metadata['linked_tasks'], ["other-id"])
+        self.assertNotIn('hours_est', task.metadata)
+        self.assertIsNone(task.metadata.get('phase'))
+        self.assertEqual(set(task.metadata), {"task_name", "project_name", "assigned_to", "date_start", "date_end", "linked_tasks"})
+        with self.assertRaises(AttributeError):
+            task.unexpected_attribute = 1
+
     def test_validate_task_data_success(self):
         metadata = {
             "task_name": "Test Task",
@@ -46,6 +73,268 @@ class TestEngine(unittest.TestCase):
         self.assertIn("impossible_timeline", issues)
         self.assertEqual(metadata["date_end"], metadata["date_start"])
 
+    def test_validate_task_data_date_formats(self):
+        metadata = {"task_name": "US dates", "date_start": "01/05/2024", "date_end": "1/9/2024"}
+        self.assertIsNone(validate_task_data(metadata))
+        self.assertEqual((metadata["date_start"], metadata["date_end"]), (date(2024, 1, 5), date(2024, 1, 9)))
+
+        metadata = {"task_name": "Unknown", "date_start": "5 Jan 2024", "date_end": "2024-02-30"}
+        issues = validate_task_data(metadata)
+        self.assertIn("invalid_date_start_format", issues)
+        self.assertIn("missing_date_end", issues)
+        self.assertEqual(metadata["date_start"], date.today())
+
+        self.assertEqual(parse_date_value(["2024-3-4"]), date(2024, 3, 4))
+        self.assertEqual(parse_date_value([date(2024, 3, 4)]), date(2024, 3, 4))
+        self.assertIsNone(parse_date_value("２０２４-01-05"))
+        self.assertEqual(parse_date_value("nonsense", date(2000, 1, 1)), date(2000, 1, 1))
+
+    def test_validate_tasks_matches_validate_task_data(self):
+        samples = [
+            {"task_name": "Ok", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)},
+            {"task_name": "Strings", "date_start": "01/05/2024", "date_end": "2024-01-09"},
+            {"date_start": "bad", "date_due": "2024-01-03"},
+            {"task_name": None, "date_start": "2024-01-05", "date_end": "2024-01-01"},
+            {},
+        ]
+        tasks = [VibeTask(Path(f"{i}.md"), dict(metadata), "") for i, metadata in enumerate(samples)]
+        for items in (samples, tasks):
+            result = validate_tasks(items)
+            for metadata, mask, start_ord, end_ord in zip(samples, result.masks, result.start_ords, result.end_ords):
+                expected = dict(metadata)
+                self.assertEqual(issue_codes(mask) or None, validate_task_data(expected))
+                self.assertEqual((start_ord, end_ord), (expected["date_start"].toordinal(), expected["date_end"].toordinal()))
+            self.assertEqual(result.flagged, 3)
+            self.assertEqual(result.issue_counts["impossible_timeline"], 2)
+            self.assertEqual(result.issue_counts["missing_task_name"], 3)
+        self.assertEqual(samples[1]["date_start"], "01/05/2024") # Inputs are not modified
+
+    def test_ingest_project_data_parallel_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(12):
+                Path(root, f"task_{i:02}.md").write_text(
+                    f"---\ntask_name: Task {i}\nvibe_id: id-{i}\ndate_start: 2024-01-01\ndate_end: 2024-01-0{i % 9 + 1}\n---\nBody {i}\n",
+                    encoding='utf-8')
+            Path(root, "broken.md").write_text("---\ntask_name: [unclosed\n---\n", encoding='utf-8')
+            Path(root, "Templates").mkdir()
+            Path(root, "Templates", "template.md").write_text("---\ntask_name: Template\n---\n", encoding='utf-8')
+
+            sequential_tasks, sequential_errors = ingest_project_data(root)
+            parallel_tasks, parallel_errors = ingest_project_data(root, workers=2, chunk_size=3)
+
+        self.assertEqual(len(sequential_tasks), 12)
+        self.assertEqual([t.file_path for t in parallel_tasks], [t.file_path for t in sequential_tasks])
+        self.assertEqual([t.metadata for t in parallel_tasks], [t.metadata for t in sequential_tasks])
+        self.assertEqual(parallel_errors, sequential_errors)
+        self.assertEqual(len(parallel_errors), 1)
+
+    def test_ingest_project_data_parse_cache(self):
+        with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = Path(cache_dir, "cache.pickle")
+            for name in ("a", "b"):
+                Path(root, f"{name}.md").write_text(
+                    f"---\ntask_name: {name}\nvibe_id: {name}\ndate_start: 2024-01-01\ndate_end: 2024-01-02\n---\n{name} body\n",
+                    encoding='utf-8')
+            cold_tasks, _ = ingest_project_data(root, cache_path=cache_path)
+
+            with patch('engine.parse_task_file') as mock_parse, patch.object(ParseCache, 'save') as mock_save:
+                warm_tasks, warm_errors = ingest_project_data(root, cache_path=cache_path)
+                mock_parse.assert_not_called()
+                mock_save.assert_not_called() # Nothing changed: the cache file is not rewritten
+            self.assertEqual([t.metadata for t in warm_tasks], [t.metadata for t in cold_tasks])
+            self.assertEqual([t.content for t in warm_tasks], [t.content for t in cold_tasks])
+            self.assertEqual(warm_errors, [])
+
+            Path(root, "a.md").write_text("---\ntask_name: a2\nvibe_id: a\ndate_start: 2024-01-01\ndate_end: 2024-01-03\n---\n",
+                                          encoding='utf-8')
+            Path(root, "b.md").unlink()
+            tasks, _ = ingest_project_data(root, cache_path=cache_path)
+            self.assertEqual([t.metadata['task_name'] for t in tasks], ["a2"])
+            self.assertEqual(list(ParseCache(cache_path).entries), [str(Path(root, "a.md"))])
+
+            # A start date defaulted to today must not be frozen in the cache
+            Path(root, "a.md").write_text("---\ntask_name: a3\nvibe_id: a\n---\n", encoding='utf-8')
+            tasks, _ = ingest_project_data(root, cache_path=cache_path)
+            self.assertEqual(tasks[0].metadata['date_start'], date.today())
+            self.assertEqual(ParseCache(cache_path).entries, {})
+
+    def test_diff_task_snapshots(self):
+        with tempfile.TemporaryDirectory() as root:
+            for name in ("keep", "edit", "remove", "old_name"):
+                Path(root, f"{name}.md").write_text(f"---\ntask_name: {name}\n---\n", encoding='utf-8')
+            before = snapshot_task_files(root)
+            Path(root, "edit.md").write_text("---\ntask_name: edited and longer\n---\n", encoding='utf-8')
+            Path(root, "remove.md").unlink()
+            Path(root, "old_name.md").rename(Path(root, "new_name.md"))
+            Path(root, "added.md").write_text("---\ntask_name: added, a new file\n---\n", encoding='utf-8')
+            created, modified, deleted, renamed = diff_task_snapshots(before, snapshot_task_files(root))
+
+        self.assertEqual(created, [Path(root, "added.md")])
+        self.assertEqual(modified, [Path(root, "edit.md")])
+        self.assertEqual(deleted, [Path(root, "remove.md")])
+        self.assertEqual(renamed, [(Path(root, "old_name.md"), Path(root, "new_name.md"))])
+
+    def test_header_only_parse_matches_frontmatter(self):
+        samples = {
+            "plain": "---\ntask_name: A\ndate_start: 2024-01-01\n---\n\n# Heading\nBody text\n\n",
+            "leading_blank": "\n\n---\ntask_name: B\nproject_name: [P1, P2]\n---\nBody\n",
+            "no_header": "Just a note\nwith text\n",
+            "unclosed": "---\ntask_name: C\nno closing delimiter\n",
+            "scalar_header": "---\njust a string\n---\nBody\n",
+            "long_delimiters": "-----\ntask_name: D\n----  \nBody --- with dashes\n---\nmore\n",
+        }
+        with tempfile.TemporaryDirectory() as root:
+            for name, text in samples.items():
+                file = Path(root, f"{name}.md")
+                file.write_text(text, encoding='utf-8')
+                full = parse_task_file(file, header_only=False)
+                fast = parse_task_file(file)
+                expected_post = frontmatter.load(file)
+                self.assertEqual(fast.metadata, full.metadata, name)
+                self.assertEqual(full.content, expected_post.content, name)
+                task = VibeTask(file, fast.metadata, fast.content, fast.body_line)
+                self.assertEqual(task.content, expected_post.content, name)
+
+            task = VibeTask(Path(root, "plain.md"), {}, None, parse_task_file(Path(root, "plain.md")).body_line)
+            self.assertFalse(task.content_loaded)
+            self.assertEqual(task.content, "# Heading\nBody text")
+            self.assertTrue(task.content_loaded)
+
+    def test_header_parsers_match_yaml(self):
+        headers = [
+            "task_name: Pour slab\nvibe_id: 42\ndate_start: 2024-01-01\nstatus: yes\nnotes:\n# comment\nowner: 'Bob'\n",
+            "task_name: \"Quoted\"\r\nlinked_tasks: a, b\r\nurl: http://example.com/a#b\r\ncost_code: 03-300\r\n",
+            "",
+            "assigned_to:\n  - Alice\n  - Bob\n",
+            "cost: 1.5\nratio: 012\n",
+            "cost_code: 03-300\nstarted: 2024-01-05 10:00:00\n",
+            "task_name: a: b\n",
+            "date_start: 2024-02-30\nnext: [x\n",
+            "a: 1\x0cb: 2\n", # Line breaks for str.splitlines() but not for YAML
+            "a: x\x1cb: y\r\n",
+            "a: x\rb: y\n",
+        ]
+        import yaml
+        for text in headers:
+            try:
+                expected = yaml.load(text, Loader=yaml.SafeLoader)
+            except yaml.YAMLError:
+                with self.assertRaises(yaml.YAMLError):
+                    parse_header_text(text)
+                continue
+            value, parser = parse_header_text(text)
+            self.assertEqual(value, expected, text)
+            self.assertEqual([type(item) for item in (value or {}).values()], [type(item) for item in (expected or {}).values()])
+            self.assertEqual(parser, 'flat' if text in headers[:3] else 'libyaml' if yaml.__with_libyaml__ else 'yaml', text)
+
+        try:
+            set_header_parsers(['yaml'])
+            self.assertEqual(parse_header_text(headers[0]), (yaml.load(headers[0], Loader=yaml.SafeLoader), 'yaml'))
+            with self.assertRaises(ValueError):
+                set_header_parsers(['nope'])
+        finally:
+            set_header_parsers(None)
+
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "flat.md").write_text("---\n" + headers[0] + "---\nBody\n", encoding='utf-8')
+            Path(root, "nested.md").write_text("---\n" + headers[3] + "---\nBody\n", encoding='utf-8')
+            Path(root, "none.md").write_text("Body\n", encoding='utf-8')
+            self.assertEqual(parse_task_file(Path(root, "flat.md")).parser, 'flat')
+            self.assertIn(parse_task_file(Path(root, "nested.md")).parser, ('libyaml', 'yaml'))
+            self.assertEqual(parse_task_file(Path(root, "none.md")).parser, 'frontmatter')
+
+    def test_task_graph(self):
+        def task(vibe_id, links=None):
+            metadata = {"task_name": vibe_id, "vibe_id": vibe_id}
+            if links is not None:
+                metadata["linked_tasks"] = links
+            return VibeTask(Path(f"{vibe_id}.md"), metadata, "")
+        a, b, c, d = task("a", ["b", "missing"]), task("b", "c, a"), task("c", []), task("d", ["c"])
+        duplicate = task("a")
+        graph = TaskGraph([a, b, c, d, duplicate])
+
+        self.assertIs(graph.get("c"), c)
+        self.assertEqual(graph.successors(b), [c, a])
+        self.assertEqual(graph.predecessors(c), [b, d])
+        self.assertEqual([missing for _, missing in graph.dangling], ["missing"])
+        self.assertEqual(graph.cycles, [["a", "b"]])
+        issues = graph.issues()
+        self.assertEqual(len(issues), 3)
+        self.assertTrue(any("dependency cycle a.md -> b.md -> a.md" in issue for issue in issues))
+
+        self.assertFalse(graph.add_link(c, b)) # c -> b would close b -> c
+        self.assertTrue(graph.add_link(d, a))
+        self.assertEqual(graph.successors(d), [c, a])
+
+
+    def test_write_task_file_minimal_diff(self):
+        original = ("---\r\n"
+                    "# Managed by the team\r\n"
+                    "task_name: \"Pour slab\"\r\n"
+                    "date_start: 2024-01-01\r\n"
+                    "date_end: 2024-01-05\r\n"
+                    "assigned_to:\r\n"
+                    "  - Alice\r\n"
+                    "  - Bob\r\n"
+                    "\r\n"
+                    "linked_tasks: a, b\r\n"
+                    "obsolete: yes\r\n"
+                    "---\r\n"
+                    "\r\n"
+                    "Body text\r\n")
+        with tempfile.TemporaryDirectory() as root:
+            file = Path(root, "task.md")
+            file.write_bytes(original.encode('utf-8'))
+            metadata, body_line = read_frontmatter_header(file)
+
+            # Nothing changed: the file is left alone
+            self.assertEqual(write_task_file(file, dict(metadata), None, body_line), (False, body_line))
+
+            del metadata['obsolete']
+            metadata['date_end'] = date(2024, 1, 9)
+            metadata['linked_tasks'] = ['a', 'b', 'c']
+            metadata['phase'] = 'Foundation'
+            written, new_body_line = write_task_file(file, metadata, None, body_line)
+
+            self.assertTrue(written)
+            self.assertEqual(file.read_bytes().decode('utf-8'),
+                             original.replace("date_end: 2024-01-05", "date_end: 2024-01-09")
+                                     .replace("linked_tasks: a, b", "linked_tasks: a, b, c")
+                                     .replace("obsolete: yes\r\n", "phase: Foundation\r\n"))
+            self.assertEqual(load_task_body(file, new_body_line), "Body text")
+            self.assertEqual(frontmatter.load(file).metadata['assigned_to'], ['Alice', 'Bob'])
+
+            written, new_body_line = write_task_file(file, metadata, "New body", new_body_line)
+            self.assertTrue(written)
+            self.assertTrue(file.read_bytes().endswith(b"---\r\n\r\nNew body\r\n"))
+
+    def test_write_task_file_keeps_us_dates_and_key_order(self):
+        with tempfile.TemporaryDirectory() as root:
+            file = Path(root, "task.md")
+            file.write_text("---\ntask_name: Slab\ndate_start: 01/05/2024\ndate_end: '01/09/2024'\n---\nBody\n", encoding='utf-8')
+            parsed = parse_task_file(file)
+            self.assertEqual(parsed.metadata['date_start'], date(2024, 1, 5))
+            # Validated dates equal to the US-format text on disk are not rewritten as ISO
+            self.assertEqual(write_task_file(file, parsed.metadata, None, parsed.body_line), (False, parsed.body_line))
+
+            # A duplicate key forces the full render, which keeps the file's key order
+            file.write_text("---\nzeta: 1\ntask_name: Slab\nzeta: 2\ndate_start: 2024-01-05\n---\nBody\n", encoding='utf-8')
+            metadata = dict(parse_task_file(file).metadata, hours_est=4)
+            written, _ = write_task_file(file, metadata, None, None)
+            self.assertTrue(written)
+            self.assertEqual(list(frontmatter.load(file).metadata), ['zeta', 'task_name', 'date_start', 'date_end', 'hours_est'])
+
+    def test_write_task_file_without_header(self):
+        with tempfile.TemporaryDirectory() as root:
+            file = Path(root, "task.md")
+            file.write_text("Just a note\n", encoding='utf-8')
+            written, body_line = write_task_file(file, {"task_name": "Note"}, None)
+            self.assertTrue(written)
+            self.assertIsNone(body_line)
+            post = frontmatter.load(file)
+            self.assertEqual(post.metadata, {"task_name": "Note"})
+            self.assertEqual(post.content, "Just a note")
+
 
 if __name__ == '__main__':
     unittest.main()
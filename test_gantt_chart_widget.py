@@ -1,9 +1,10 @@
 import unittest
 from unittest.mock import Mock
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, QRect, QPointF
+from PyQt6.QtGui import QImage, QPainter, QColor
 from datetime import date, timedelta
-from GanttChartWidget import GanttChartWidget
+from GanttChartWidget import GanttChartWidget, PaintResources, generate_color_from_text, pick_time_unit, time_ticks
 from engine import VibeTask
 
 import os
@@ -53,6 +54,190 @@ class TestGanttChartWidget(unittest.TestCase):
         self.widget.zoom_factor = 2.0
         self.assertEqual(self.widget.get_pixels_per_day(), 60.0)
 
+    def test_drag_updates_bar_intervals(self):
+        task1 = VibeTask(None, {"task_name": "Task 1", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+        task2 = VibeTask(None, {"task_name": "Task 2", "date_start": date(2024, 1, 10), "date_end": date(2024, 1, 12)}, "")
+        self.widget.set_tasks([task1, task2], [task1, task2], date(2024, 1, 1), date(2024, 1, 31))
+        jan_5 = date(2024, 1, 5).toordinal()
+        self.assertEqual(self.widget.bar_intervals.overlapping(jan_5, jan_5), [])
+
+        self.widget.update_task_and_dependencies(task1, date(2024, 1, 5))
+
+        self.assertEqual(self.widget.bar_intervals.overlapping(jan_5, jan_5), [0])
+        self.assertEqual(task1.metadata['date_end'], date(2024, 1, 6))
+
+    def test_render_culls_to_clip_rect(self):
+        start = date(2024, 1, 1)
+        tasks = [VibeTask(None, {"task_name": f"Task {i:03}", "vibe_id": str(i), "linked_tasks": [str(i + 1)],
+                                 "date_start": start + timedelta(days=i), "date_end": start + timedelta(days=i + 2)}, "")
+                 for i in range(200)]
+        self.widget.set_tasks(tasks, tasks, start, start + timedelta(days=220))
+        self.assertEqual(len(self.widget.display_links), 199)
+        row_pitch = self.widget.task_height + self.widget.task_spacing
+        image = QImage(800, 600, QImage.Format.Format_ARGB32)
+
+        painter = QPainter(image)
+        # Rows 10-19 are exposed vertically; columns cover days 0-19, so bars of rows 10-19 are all visible
+        painted_rows = self.widget.render(painter, clip_rect=QRect(0, self.widget.header_height + 10 * row_pitch, 800, 10 * row_pitch - 1))
+        painter.end()
+        self.assertEqual(painted_rows, list(range(10, 20)))
+
+        painter = QPainter(image)
+        painted_rows = self.widget.render(painter)
+        painter.end()
+        self.assertEqual(len(painted_rows), 200)
+
+    def test_dependency_propagation_stops_on_cycles(self):
+        task1 = VibeTask(None, {"task_name": "Task 1", "vibe_id": "1", "linked_tasks": ["2"], "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+        task2 = VibeTask(None, {"task_name": "Task 2", "vibe_id": "2", "linked_tasks": ["1"], "date_start": date(2024, 1, 3), "date_end": date(2024, 1, 4)}, "")
+        self.widget.set_tasks([task1, task2], [task1, task2], date(2024, 1, 1), date(2024, 1, 31))
+
+        self.widget.update_task_and_dependencies(task1, date(2024, 1, 10))
+
+        self.assertEqual(task1.metadata['date_start'], date(2024, 1, 10))
+        self.assertEqual(task2.metadata['date_start'], date(2024, 1, 12))
+        self.assertEqual(self.widget.display_links, [(0, 1), (1, 0)])
+
+    def test_dependency_propagation_long_chain_and_diamonds(self):
+        start = date(2024, 1, 1)
+        chain = [VibeTask(None, {"task_name": f"Task {i}", "vibe_id": str(i), "linked_tasks": [str(i + 1)] if i < 1999 else [],
+                                 "date_start": start + timedelta(days=2 * i), "date_end": start + timedelta(days=2 * i + 1)}, "")
+                 for i in range(2000)]
+        self.widget.set_tasks(chain, chain, start, start + timedelta(days=4000))
+        self.widget.update_task_and_dependencies(chain[0], start + timedelta(days=10))
+        self.assertEqual(chain[-1].metadata['date_start'], start + timedelta(days=10 + 2 * 1999))
+
+        # 30 stacked diamonds: a -> (b, c) -> d, where c lasts longer than b; every path count doubles per level
+        tasks = []
+        for level in range(30):
+            top, left, right = f"{level}a", f"{level}b", f"{level}c"
+            tasks += [VibeTask(None, {"task_name": top, "vibe_id": top, "linked_tasks": [left, right],
+                                      "date_start": start, "date_end": start}, ""),
+                      VibeTask(None, {"task_name": left, "vibe_id": left, "linked_tasks": [f"{level + 1}a"],
+                                      "date_start": start, "date_end": start}, ""),
+                      VibeTask(None, {"task_name": right, "vibe_id": right, "linked_tasks": [f"{level + 1}a"],
+                                      "date_start": start, "date_end": start + timedelta(days=2)}, "")]
+        tasks.append(VibeTask(None, {"task_name": "end", "vibe_id": "30a", "date_start": start, "date_end": start}, ""))
+        self.widget.set_tasks(tasks, tasks, start, start + timedelta(days=200))
+        moves = []
+        original_move = self.widget._move_task
+        self.widget._move_task = lambda task, new_start: (moves.append(task), original_move(task, new_start))
+        self.widget.update_task_and_dependencies(tasks[0], start)
+
+        self.assertEqual(len(moves), len(tasks))
+        # Each level takes 1 day for a, then the longer branch c (3 days) starts after it
+        self.assertEqual(tasks[-1].metadata['date_start'], start + timedelta(days=30 * 4))
+        self.assertEqual(tasks[3].metadata['date_start'], start + timedelta(days=4))
+
+    def test_task_at(self):
+        task1 = VibeTask(None, {"task_name": "Task 1", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+        task2 = VibeTask(None, {"task_name": "Task 2", "date_start": date(2024, 1, 5), "date_end": date(2024, 1, 5)}, "")
+        self.widget.set_tasks([task1, task2], [task1, task2], date(2024, 1, 1), date(2024, 1, 31))
+        pixels_per_day = self.widget.get_pixels_per_day()
+        bar_left = self.widget.name_column_width
+        row_pitch = self.widget.task_height + self.widget.task_spacing
+        first_row_y = self.widget.header_height + 10
+
+        self.assertIs(self.widget.task_at(QPointF(bar_left + 5, first_row_y)), task1)
+        self.assertIs(self.widget.task_at(QPointF(bar_left + 4.5 * pixels_per_day, first_row_y + row_pitch)), task2)
+        self.assertIsNone(self.widget.task_at(QPointF(bar_left + 3 * pixels_per_day, first_row_y))) # Past task 1's bar
+        self.assertIsNone(self.widget.task_at(QPointF(bar_left + 5, self.widget.header_height + self.widget.task_height + 1))) # Row gap
+        self.assertIsNone(self.widget.task_at(QPointF(bar_left + 5, 10))) # Header
+        self.assertIsNone(self.widget.task_at(QPointF(bar_left + 5, first_row_y + 2 * row_pitch))) # Below the last row
+
+    def test_tiles_are_cached_and_invalidated_for_live_rows(self):
+        start = date(2024, 1, 1)
+        tasks = [VibeTask(None, {"task_name": f"Task {i:03}", "vibe_id": str(i), "linked_tasks": [str(i + 1)] if i == 0 else [],
+                                 "date_start": start + timedelta(days=i), "date_end": start + timedelta(days=i + 1)}, "")
+                 for i in range(100)]
+        self.widget.set_tasks(tasks, tasks, start, start + timedelta(days=120))
+        self.widget.resize(1000, 1200)
+        self.widget.grab()
+        cached_tiles = set(self.widget.tile_cache)
+        self.assertIn((0, 0), cached_tiles)
+        self.assertIn((1, 2), cached_tiles)
+
+        first_tile = self.widget.tile_cache[(0, 0)]
+        self.widget.grab()
+        self.assertIs(self.widget.tile_cache[(0, 0)], first_tile) # Reused, not repainted
+
+        # Dragging task 0 makes it and its dependent task 1 live; only the top band of tiles is dropped
+        self.widget._begin_live_rows(tasks[0])
+        self.assertEqual(self.widget.live_rows, {0, 1})
+        self.assertEqual(self.widget.live_links, [(0, 1)])
+        self.assertEqual(set(self.widget.tile_cache), {key for key in cached_tiles if key[1] != 0})
+
+        self.widget.tile_cache.pop((0, 0), None)
+        painted_rows = []
+        self.widget._paint_bar = lambda painter, row: painted_rows.append(row)
+        self.widget._tile(0, 0)
+        self.assertIn(2, painted_rows)
+        self.assertNotIn(0, painted_rows) # Live bars are left out of the tiles
+        del self.widget._paint_bar
+
+        self.widget._end_live_rows()
+        self.assertEqual(self.widget.live_rows, set())
+        self.assertNotIn((0, 0), self.widget.tile_cache)
+
+        self.widget.zoom_factor = 2.0
+        self.widget.invalidate_tiles()
+        self.assertEqual(len(self.widget.tile_cache), 0)
+
+    def test_live_bars_stay_out_of_the_name_column(self):
+        start = date(2024, 1, 1)
+        task = VibeTask(None, {"task_name": "T", "date_start": start, "date_end": start + timedelta(days=1)}, "")
+        self.widget.set_tasks([task], [task], start, start + timedelta(days=30))
+        self.widget.resize(800, 200)
+        self.widget._begin_live_rows(task)
+        self.widget.update_task_and_dependencies(task, start - timedelta(days=3)) # Dragged left, under the name column
+        image = self.widget.grab().toImage()
+        pixels_per_day = self.widget.get_pixels_per_day()
+        row_y = int(self.widget._bar_rect(0).center().y() + self.widget.pan_offset.y())
+        self.assertEqual(image.pixelColor(int(self.widget.name_column_width - 1.5 * pixels_per_day), row_y), QColor(50, 50, 50))
+
+    def test_paint_resources_cache(self):
+        resources = PaintResources(max_elided=2)
+        color = resources.color("Project A")
+        self.assertIs(resources.color(["Project A"]), color)
+        self.assertEqual(color, generate_color_from_text("Project A"))
+        self.assertIs(resources.font(8), resources.font(8))
+        self.assertIs(resources.metrics(8), resources.metrics(8))
+
+        short = resources.elide("A fairly long task name", 8, 30)
+        self.assertNotEqual(short, "A fairly long task name")
+        self.assertEqual(resources.elide("A fairly long task name", 8, 1000), "A fairly long task name")
+        resources.elide("Another", 8, 1000)
+        self.assertEqual(len(resources.elided), 2) # Oldest entry evicted
+        self.assertNotIn(("A fairly long task name", 8, 30), resources.elided)
+        resources.clear_text()
+        self.assertEqual(len(resources.elided), 0)
+
+    def test_time_scale_ticks(self):
+        self.assertEqual(pick_time_unit(30.0), 'day')
+        self.assertEqual(pick_time_unit(10.0), 'week')
+        self.assertEqual(pick_time_unit(2.0), 'month')
+        self.assertEqual(pick_time_unit(0.5), 'quarter')
+        self.assertEqual(pick_time_unit(0.05), 'year')
+
+        months = list(time_ticks(date(2024, 1, 15), date(2024, 12, 31), 'month'))
+        self.assertEqual(len(months), 12)
+        self.assertEqual(months[0], (date(2024, 1, 1), date(2024, 2, 1)))
+        self.assertEqual(months[-1], (date(2024, 12, 1), date(2025, 1, 1)))
+        quarters = [tick for tick, _ in time_ticks(date(2024, 5, 20), date(2025, 1, 2), 'quarter')]
+        self.assertEqual(quarters, [date(2024, 4, 1), date(2024, 7, 1), date(2024, 10, 1), date(2025, 1, 1)])
+        weeks = [tick for tick, _ in time_ticks(date(2024, 1, 3), date(2024, 1, 16), 'week')]
+        self.assertEqual(weeks, [date(2024, 1, 1), date(2024, 1, 8), date(2024, 1, 15)])
+
+    def test_header_ticks_follow_screen_width(self):
+        # Ten years at 0.5 px/day fit in about 1800 px; the header ticks by quarter, not once per day
+        self.widget.set_tasks([], [], date(2015, 1, 1), date(2024, 12, 31))
+        self.widget.zoom_factor = 0.5 / 30
+        self.assertEqual(pick_time_unit(self.widget.get_pixels_per_day()), 'quarter')
+        image = QImage(1000, 200, QImage.Format.Format_ARGB32)
+        painter = QPainter(image)
+        self.widget.render(painter)
+        painter.end()
+
     @classmethod
     def tearDownClass(cls):
         pass
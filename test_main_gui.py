@@ -1,13 +1,24 @@
 import unittest
 from unittest.mock import patch, Mock
 from main_gui import VibeGanttApp
-from engine import VibeTask
+from engine import VibeTask, FileError, load_task_body
+from task_store import TaskStore
+from task_saver import TaskSaver
+from PyQt6.QtWidgets import QApplication
+from datetime import date
+from pathlib import Path
+import frontmatter
+import tempfile
 
 import os
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
 class TestVibeGanttApp(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
     @patch('main_gui.VibeGanttApp.__init__', lambda x: None)
     def setUp(self):
         self.main_window = VibeGanttApp()
@@ -21,46 +32,240 @@ class TestVibeGanttApp(unittest.TestCase):
         self.main_window.cost_code_filter = Mock()
         self.main_window.assigned_to_filter = Mock()
         self.main_window.date_range_filter = Mock()
+        self.main_window.vault_watcher = None
+        self.main_window.task_store = TaskStore()
+        self.main_window.task_saver = TaskSaver()
+        # Lambdas: PyQt does not deliver to bound slots of a QObject whose __init__ was mocked out
+        self.main_window.task_saver.progress.connect(lambda *args: self.main_window._on_save_progress(*args))
+        self.main_window.task_saver.finished.connect(lambda *args: self.main_window._on_save_finished(*args))
+        self.main_window.resave_requested = False
+        self.main_window.project_loader = None
+        self.main_window.project_root = None
+        self.main_window.settings = Mock()
+        self.main_window.settings.value.return_value = ""
+        self.main_window.load_progress = Mock()
+        self.main_window.cancel_load_button = Mock()
+        self.main_window.live_reload_action = Mock()
+        self.main_window.live_reload_action.isChecked.return_value = False
 
     def test_initialization(self):
         # This test is no longer relevant as we are mocking the init
         pass
 
-    @patch('main_gui.Tk')
-    @patch('main_gui.filedialog.askdirectory', return_value='fake_path')
-    @patch('main_gui.ingest_project_data')
-    def test_load_project(self, mock_ingest, mock_askdirectory, mock_tk):
-        task1 = VibeTask(None, {"task_name": "Task 1", "project_name": "Project A", "date_start": "2024-01-01", "date_end": "2024-01-05"}, "")
-        mock_ingest.return_value = ([task1], [])
+    def test_validate_all_tasks(self):
+        good = VibeTask(Path("good.md"), {"task_name": "Good", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+        late = VibeTask(Path("late.md"), {"task_name": "Late", "date_start": date(2024, 1, 5), "date_end": date(2024, 1, 2)}, "")
+        self.main_window.tasks = [good, late]
+        self.main_window.errors = ["File: good.md | Validation Error: ['missing_task_name']", "File: x.md | Link Error: gone"]
+
+        result = self.main_window.validate_all_tasks()
+        self.assertEqual(result.flagged, 1)
+        self.assertEqual(self.main_window.errors, ["File: x.md | Link Error: gone",
+                                                   "File: late.md | Validation Error: ['impossible_timeline']"])
+        self.main_window.statusBar().showMessage.assert_called_with("Validated 2 tasks: 1 with issues (impossible_timeline 1).")
+
+    def prepare_filters(self):
         self.main_window.date_range_filter.currentText.return_value = "All Time"
-        self.main_window.project_filter.selectedItems.return_value = []
-        self.main_window.phase_filter.selectedItems.return_value = []
-        self.main_window.cost_code_filter.selectedItems.return_value = []
-        self.main_window.assigned_to_filter.selectedItems.return_value = []
+        for _, list_widget in self.main_window._facet_filters():
+            list_widget.selectedItems.return_value = []
+            list_widget.count.return_value = 0
 
+    @patch('main_gui.QFileDialog.getExistingDirectory', return_value='fake_path')
+    @patch('main_gui.ProjectLoader')
+    def test_load_project(self, mock_loader_class, mock_get_directory):
+        task1 = VibeTask(None, {"task_name": "Task 1", "project_name": "Project A", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 5)}, "")
+        task2 = VibeTask(None, {"task_name": "Task 2", "project_name": "Project B", "date_start": date(2024, 1, 2), "date_end": date(2024, 1, 6)}, "")
+        loader = mock_loader_class.return_value
+        loader.cancelled, loader.error = False, None
+        self.prepare_filters()
 
         self.main_window.load_project()
+        loader.start.assert_called_once()
+        self.main_window._on_load_batch(loader, [(task1, None)])
+        # The first batch is on screen before the rest has been read
+        self.assertEqual(self.main_window.gantt_chart.set_tasks.call_args[0][0], [task1])
+        self.main_window._on_load_batch(loader, [(task2, None)])
+        self.main_window._on_load_finished(loader)
 
-        self.assertEqual(len(self.main_window.tasks), 1)
+        self.assertEqual(len(self.main_window.tasks), 2)
         self.assertEqual(self.main_window.tasks[0].metadata['task_name'], "Task 1")
         self.assertEqual(len(self.main_window.errors), 0)
+        self.assertEqual(self.main_window.gantt_chart.set_tasks.call_args[0][0], [task1, task2])
+        self.assertIsNone(self.main_window.project_loader)
+        self.assertEqual(self.main_window.project_root, 'fake_path')
+        self.main_window.settings.setValue.assert_called_once_with("last_vault", 'fake_path')
+
+    @patch('main_gui.QFileDialog.getExistingDirectory', return_value='fake_path')
+    @patch('main_gui.ProjectLoader')
+    def test_reload_swaps_atomically_and_keeps_edits(self, mock_loader_class, mock_get_directory):
+        def make_task(name, day):
+            return VibeTask(Path(f"{name}.md"), {"task_name": name, "date_start": date(2024, 1, day), "date_end": date(2024, 1, day + 1)}, "")
+        edited, clean = make_task("edited", 1), make_task("clean", 2)
+        edited.is_dirty = True
+        self.main_window.tasks = [edited, clean]
+        self.main_window.task_store = TaskStore(self.main_window.tasks)
+        self.main_window.details_panel.current_task = edited
+        self.main_window.project_root = 'fake_path'
+        loader = mock_loader_class.return_value
+        loader.cancelled, loader.error = False, None
+        self.prepare_filters()
+
+        self.main_window.load_project()
+        fresh_edited, fresh_clean = make_task("edited", 3), make_task("clean", 4)
+        self.main_window._on_load_batch(loader, [(fresh_edited, None), (fresh_clean, None)])
+        self.assertEqual(self.main_window.tasks, [edited, clean]) # Old project untouched until the load completes
+
+        self.main_window._on_load_finished(loader)
+        self.assertEqual(self.main_window.tasks, [edited, fresh_clean])
+        self.assertEqual(self.main_window.task_store.select(self.main_window.task_store.query()), [edited, fresh_clean])
+        self.main_window.details_panel.display_task.assert_not_called()
+        self.main_window.details_panel.setDisabled.assert_not_called()
+
+    @patch('main_gui.ProjectLoader')
+    def test_switching_vaults_asks_about_unsaved_edits(self, mock_loader_class):
+        edited = VibeTask(Path("old", "edited.md"), {"task_name": "Edited", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+        edited.is_dirty = True
+        self.main_window.tasks = [edited]
+        self.main_window.task_store = TaskStore(self.main_window.tasks)
+        self.main_window.details_panel.current_task = edited
+        self.main_window.project_root = "old"
+        loader = mock_loader_class.return_value
+        loader.cancelled, loader.error = False, None
+        self.prepare_filters()
+
+        with patch('main_gui.QMessageBox') as mock_message_box:
+            mock_message_box.question.return_value = mock_message_box.StandardButton.Cancel
+            self.main_window.open_project("new")
+            loader.start.assert_not_called()
+
+            mock_message_box.question.return_value = mock_message_box.StandardButton.Discard
+            self.main_window.open_project("new")
+            fresh = VibeTask(Path("new", "fresh.md"), {"task_name": "Fresh", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+            self.main_window._on_load_batch(loader, [(fresh, None)])
+            self.main_window._on_load_finished(loader)
+        self.assertEqual(mock_message_box.question.call_count, 2) # Not asked again when the load ends
+        self.assertEqual(self.main_window.tasks, [fresh])
+        self.assertEqual(self.main_window.project_root, "new")
+        self.main_window.details_panel.setDisabled.assert_called_with(True) # The discarded edit is no longer shown
+
+    @patch('main_gui.QFileDialog.getExistingDirectory', return_value='fake_path')
+    @patch('main_gui.ProjectLoader')
+    def test_cancel_reload_keeps_project(self, mock_loader_class, mock_get_directory):
+        task = VibeTask(None, {"task_name": "Task 1"}, "")
+        self.main_window.tasks = [task]
+        loader = mock_loader_class.return_value
+        loader.cancelled, loader.error = True, None
+
+        self.main_window.load_project()
+        self.main_window._on_load_batch(loader, [(VibeTask(None, {"task_name": "Other"}, ""), None)])
+        self.main_window.cancel_loading(wait=True)
+
+        loader.requestInterruption.assert_called_once()
+        self.assertEqual(self.main_window.tasks, [task])
+        self.assertIsNone(self.main_window.project_loader)
+
+    @patch('main_gui.VaultWatcher')
+    @patch('main_gui.ProjectLoader')
+    def test_cancelled_load_restarts_watching_and_is_not_remembered(self, mock_loader_class, mock_watcher_class):
+        task = VibeTask(Path("old", "a.md"), {"task_name": "Task 1"}, "")
+        self.main_window.tasks = [task]
+        self.main_window.project_root = "old"
+        self.main_window.live_reload_action.isChecked.return_value = True
+        loader = mock_loader_class.return_value
+        loader.cancelled, loader.error = True, None
+
+        self.main_window.open_project("new")
+        self.main_window.cancel_loading(wait=True)
+
+        self.assertEqual(self.main_window.tasks, [task])
+        self.assertEqual(self.main_window.project_root, "old")
+        mock_watcher_class.assert_called_once_with("old", self.main_window)
+        self.assertIs(self.main_window.vault_watcher, mock_watcher_class.return_value)
+        self.main_window.settings.setValue.assert_not_called()
+
+    @patch('main_gui.ProjectLoader')
+    def test_cancelled_first_load_is_not_merged_into_the_next_vault(self, mock_loader_class):
+        loader = mock_loader_class.return_value
+        loader.cancelled, loader.error = True, None
+        self.prepare_filters()
+        self.main_window.open_project("first")
+        partial = VibeTask(Path("first", "a.md"), {"task_name": "A", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+        self.main_window._on_load_batch(loader, [(partial, None)])
+        self.main_window._on_load_finished(loader)
+        self.assertEqual(self.main_window.project_root, "first") # The partial tasks belong to it
+        partial.is_dirty = True
+
+        with patch('main_gui.QMessageBox') as mock_message_box:
+            mock_message_box.question.return_value = mock_message_box.StandardButton.Discard
+            self.main_window.open_project("second")
+            loader.cancelled = False
+            fresh = VibeTask(Path("second", "b.md"), {"task_name": "B", "date_start": date(2024, 1, 1), "date_end": date(2024, 1, 2)}, "")
+            self.main_window._on_load_batch(loader, [(fresh, None)])
+            self.main_window._on_load_finished(loader)
+        mock_message_box.question.assert_called_once()
+        self.assertEqual(self.main_window.tasks, [fresh])
+
+    def test_save_all_changes(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "task1.md").write_text("---\ntask_name: Old\n---\nBody text\n", encoding='utf-8')
+            task1 = VibeTask(Path(root, "task1.md"), {"task_name": "Task 1", "project_name": "Project A", "date_start": date(2024, 1, 1),
+                                                       "date_end": date(2024, 1, 5), "linked_tasks": ["a", "b"]}, None, body_line=3)
+            missing = VibeTask(Path(root, "no_such_folder", "task2.md"), {"task_name": "Task 2"}, "")
+            clean = VibeTask(Path(root, "task3.md"), {"task_name": "Task 3"}, "")
+            task1.is_dirty = missing.is_dirty = True
+            self.main_window.tasks = [task1, missing, clean]
+            self.main_window.details_panel.current_task = task1
+
+            with patch('main_gui.QMessageBox') as mock_message_box:
+                self.main_window.save_all_changes()
+                self.assertIsNone(task1.body_line) # Stale until the new offset arrives: lazy loads re-parse the file
+                self.main_window.task_saver.wait()
+            self.assertEqual(load_task_body(Path(root, "task1.md"), task1.body_line), "Body text")
+
+            saved = frontmatter.load(Path(root, "task1.md"))
+            self.assertEqual(saved.metadata['task_name'], "Task 1")
+            self.assertEqual(saved.metadata['date_start'], date(2024, 1, 1))
+            self.assertEqual(saved.metadata['linked_tasks'], ["a", "b"])
+            self.assertEqual(saved.content, "Body text")
+            self.assertFalse(Path(root, "task3.md").exists())
+            self.assertFalse(task1.is_dirty)
+            self.assertTrue(missing.is_dirty) # Failed writes stay pending
+            mock_message_box.warning.assert_called_once() # One summary for all failures
+            self.assertIn("task2.md", mock_message_box.warning.call_args[0][2])
+
+    def test_apply_external_changes(self):
+        with tempfile.TemporaryDirectory() as root:
+            kept = VibeTask(Path(root, "kept.md"), {"task_name": "Kept", "vibe_id": "k"}, "")
+            edited = VibeTask(Path(root, "edited.md"), {"task_name": "Edited", "vibe_id": "e"}, "")
+            edited.is_dirty = True
+            gone = VibeTask(Path(root, "gone.md"), {"task_name": "Gone", "vibe_id": "g"}, "")
+            lost = VibeTask(Path(root, "lost.md"), {"task_name": "Lost", "vibe_id": "l"}, "")
+            lost.is_dirty = True
+            self.main_window.tasks = [kept, edited, gone, lost]
+            # Same file name in another folder: only the deleted file's error goes
+            other_error = FileError("File: gone.md | Parsing Error: bad", Path(root, "other", "gone.md"))
+            self.main_window.errors = [FileError("File: gone.md | Parsing Error: old", Path(root, "gone.md")), other_error]
+            self.main_window.task_store = TaskStore(self.main_window.tasks)
+            self.main_window.details_panel.current_task = None
+            self.main_window._refresh_filter_options = Mock()
+            self.main_window.apply_filters = Mock()
+            Path(root, "kept.md").write_text("---\ntask_name: Kept v2\nvibe_id: k\ndate_start: 2024-01-01\ndate_end: 2024-01-02\n---\n", encoding='utf-8')
+            Path(root, "edited.md").write_text("---\ntask_name: Overwritten\nvibe_id: e\n---\n", encoding='utf-8')
+            Path(root, "new.md").write_text("---\ntask_name: New\nvibe_id: n\ndate_start: 2024-01-01\ndate_end: 2024-01-02\n---\n", encoding='utf-8')
+
+            with patch('main_gui.QMessageBox') as mock_message_box:
+                self.main_window.apply_external_changes([Path(root, "new.md")], [Path(root, "kept.md"), Path(root, "edited.md")],
+                                                        [Path(root, "gone.md"), Path(root, "lost.md")], [])
 
-    @patch('main_gui.open')
-    @patch('main_gui.QMessageBox')
-    @patch('main_gui.frontmatter.dump')
-    @patch('main_gui.os.replace')
-    def test_save_all_changes(self, mock_replace, mock_dump, mock_message_box, mock_open):
-        from pathlib import Path
-        task1 = VibeTask(Path("fake_path/task1.md"), {"task_name": "Task 1", "project_name": "Project A", "date_start": "2024-01-01", "date_end": "2024-01-05"}, "")
-        task1.is_dirty = True
-        self.main_window.tasks = [task1]
-        self.main_window.details_panel.current_task = task1
-
-        self.main_window.save_all_changes()
-
-        mock_dump.assert_called_once()
-        mock_replace.assert_called_once()
-        self.assertFalse(task1.is_dirty)
+        self.assertEqual([t.metadata['task_name'] for t in self.main_window.tasks], ["Kept v2", "Edited", "Lost", "New"])
+        self.assertIs(self.main_window.tasks[0], kept)
+        self.assertEqual(len(self.main_window.task_store), 4)
+        mock_message_box.warning.assert_called_once() # The unsaved edit in lost.md was kept, with a warning
+        self.assertIn("lost.md", mock_message_box.warning.call_args[0][2])
+        self.assertEqual(self.main_window.errors, [other_error])
+        self.assertEqual(self.main_window.task_store.select(self.main_window.task_store.query()), [kept, self.main_window.tasks[3]])
+        self.main_window._refresh_filter_options.assert_called_once()
+        self.main_window.apply_filters.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
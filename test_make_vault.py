@@ -0,0 +1,33 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from make_vault import generate_vault
+from engine import ingest_project_data
+
+class TestMakeVault(unittest.TestCase):
+
+    def test_generated_vault_loads(self):
+        with tempfile.TemporaryDirectory() as root:
+            summary = generate_vault(root, 300, projects=3, seed=7, malformed_ratio=0.05)
+            self.assertEqual(summary['tasks'], 300)
+            self.assertEqual(len(list(Path(root).rglob("Templates/*.md"))), summary['templates'])
+            with redirect_stdout(io.StringIO()):
+                tasks, errors = ingest_project_data(root)
+
+            self.assertEqual(len(tasks), 300 - summary['malformed'])
+            self.assertEqual(sum("Parsing Error" in error for error in errors), summary['malformed'])
+            self.assertEqual({task.facet('project_name') for task in tasks}, {"Project A", "Project B", "Project C"})
+            self.assertTrue(any(isinstance(task.facet('assigned_to'), list) for task in tasks))
+            self.assertTrue(any(task.metadata.get('linked_tasks') for task in tasks))
+            self.assertTrue(all(task.start_ord and task.end_ord for task in tasks))
+
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            generate_vault(first, 20, seed=1)
+            generate_vault(second, 20, seed=1)
+            read = lambda root: {path.relative_to(root): path.read_bytes() for path in Path(root).rglob("*.md")}
+            self.assertEqual(read(first), read(second))
+
+if __name__ == '__main__':
+    unittest.main()
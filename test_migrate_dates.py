@@ -0,0 +1,71 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from migrate_dates import main, migrate_header_dates, EXIT_OK
+from fix_dates import fix_date_format_in_file, process_directory
+
+class TestMigrateDates(unittest.TestCase):
+
+    def run_cli(self, *args):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(list(args))
+        return code, out.getvalue().splitlines()
+
+    def test_only_header_dates_change(self):
+        text = ("---\r\n"
+                "task_name: Pour slab\r\n"
+                "date_start: 2024-01-05 # planned\r\n"
+                "date_end: '2024-1-9'\r\n"
+                "date_due: 2024-01-10\r\n"
+                "notes:\r\n"
+                "  date_start: 2024-01-05\r\n"
+                "---\r\n"
+                "date_start: 2024-01-05 in the body stays\r\n")
+        new_text, changes = migrate_header_dates(text, 'us')
+        self.assertEqual(changes, 2)
+        self.assertEqual(new_text, text.replace("date_start: 2024-01-05 # planned", "date_start: 01/05/2024 # planned")
+                                       .replace("date_end: '2024-1-9'", "date_end: '01/09/2024'"))
+        self.assertEqual(migrate_header_dates(new_text, 'iso')[0],
+                         text.replace("'2024-1-9'", "'2024-01-09'"))
+        self.assertEqual(migrate_header_dates("No header\ndate_start: 2024-01-05\n", 'us'), ("No header\ndate_start: 2024-01-05\n", 0))
+
+    def test_dry_run_and_unchanged_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "Task Sheets").mkdir()
+            Path(root, "Task Sheets", "a.md").write_text("---\ndate_start: 2024-01-05\ndate_end: 2024-01-06\n---\nBody\n", encoding='utf-8')
+            Path(root, "b.md").write_text("---\ndate_start: 01/05/2024\n---\n", encoding='utf-8')
+            before = {name: os.stat(Path(root, name)).st_mtime_ns for name in ("b.md",)}
+
+            code, lines = self.run_cli(root, '--to', 'us', '--dry-run', '-j', '1')
+            self.assertEqual(code, EXIT_OK)
+            self.assertEqual(lines[-1].split(" (")[0], "Would change 2 dates in 1 of 2 files")
+            self.assertIn("2024-01-05", Path(root, "Task Sheets", "a.md").read_text(encoding='utf-8'))
+
+            code, lines = self.run_cli(root, '--to', 'us', '-j', '2', '--chunk-size', '1')
+            self.assertEqual(lines[-1].split(" (")[0], "Changed 2 dates in 1 of 2 files")
+            self.assertEqual(Path(root, "Task Sheets", "a.md").read_text(encoding='utf-8'),
+                             "---\ndate_start: 01/05/2024\ndate_end: 01/06/2024\n---\nBody\n")
+            self.assertEqual(os.stat(Path(root, "b.md")).st_mtime_ns, before["b.md"]) # Nothing to change: not rewritten
+            self.assertEqual(list(Path(root).rglob("*.tmp")), [])
+
+            code, lines = self.run_cli(root, '--to', 'iso', '--task-sheets-only', '-q')
+            self.assertEqual(lines, [lines[-1]])
+            self.assertTrue(lines[-1].startswith("Changed 2 dates in 1 of 1 files"))
+            self.assertEqual(fix_date_format_in_file(Path(root, "Task Sheets", "a.md")), 2)
+
+    def test_process_directory_is_not_recursive(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "sub").mkdir()
+            for name in ("top.md", "sub/nested.md"):
+                Path(root, name).write_text("---\ndate_start: 2024-01-05\n---\n", encoding='utf-8')
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(process_directory(root), EXIT_OK)
+            self.assertIn("01/05/2024", Path(root, "top.md").read_text(encoding='utf-8'))
+            self.assertIn("2024-01-05", Path(root, "sub", "nested.md").read_text(encoding='utf-8'))
+
+if __name__ == '__main__':
+    unittest.main()
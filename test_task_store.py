@@ -0,0 +1,101 @@
+import random
+import unittest
+from pathlib import Path
+from datetime import date, timedelta
+from engine import VibeTask
+from task_store import TaskStore, IntervalIndex
+
+def make_task(name, start, end, **facets):
+    return VibeTask(Path(f"{name}.md"), {"task_name": name, "date_start": start, "date_end": end, **facets}, "")
+
+class TestTaskStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tasks = [
+            make_task("a", date(2024, 1, 1), date(2024, 1, 10), project_name="P1", phase="Rough"),
+            make_task("b", date(2024, 2, 1), date(2024, 2, 5), project_name="P2", assigned_to=["Ann", "Bob"]),
+            make_task("c", date(2024, 3, 1), date(2024, 3, 2), project_name=["P1", "P3"], cost_code=100),
+            make_task("d", "not a date", date(2024, 3, 2), project_name="P1"),
+        ]
+        self.store = TaskStore(self.tasks)
+
+    def query_names(self, view_start=None, view_end=None, **selections):
+        rows = self.store.query(view_start and view_start.toordinal(), view_end and view_end.toordinal(), selections)
+        return [task.metadata['task_name'] for task in self.store.select(rows)]
+
+    def test_date_window(self):
+        self.assertEqual(self.query_names(), ["a", "b", "c"])
+        self.assertEqual(self.query_names(date(2024, 1, 10), date(2024, 2, 1)), ["a", "b"])
+        self.assertEqual(self.query_names(date(2024, 2, 6), date(2024, 2, 28)), [])
+
+    def test_facet_selection(self):
+        self.assertEqual(self.query_names(project_name={"P1"}), ["a", "c"])
+        self.assertEqual(self.query_names(project_name={"P1", "P2"}, phase={"Rough"}), ["a"])
+        self.assertEqual(self.query_names(assigned_to={"Bob"}), ["b"])
+        self.assertEqual(self.query_names(cost_code={"100"}), ["c"])
+        self.assertEqual(self.query_names(phase={"Unknown"}), [])
+
+    def test_facet_values_and_bounds(self):
+        self.assertEqual(self.store.facet_values('project_name'), ["P1", "P2", "P3"])
+        self.assertEqual(self.store.facet_values('assigned_to'), ["Ann", "Bob"])
+        self.assertEqual(self.store.date_bounds(), (date(2024, 1, 1).toordinal(), date(2024, 3, 2).toordinal()))
+
+    def test_update_task(self):
+        task = self.tasks[0]
+        task.metadata['date_start'] = date(2024, 5, 1)
+        task.metadata['date_end'] = date(2024, 5, 3)
+        task.metadata['project_name'] = "P9"
+        self.store.update_task(task)
+        self.assertEqual(self.query_names(date(2024, 5, 1), date(2024, 5, 1)), ["a"])
+        self.assertEqual(self.query_names(project_name={"P1"}), ["c"])
+        self.assertEqual(self.store.facet_values('project_name'), ["P1", "P2", "P3", "P9"])
+
+    def test_add_remove_and_counts(self):
+        self.assertEqual(self.store.facet_counts('project_name'), {"P1": 3, "P2": 1, "P3": 1})
+        new_task = make_task("e", date(2024, 4, 1), date(2024, 4, 2), project_name="P2")
+        self.store.add_tasks([new_task])
+        self.store.remove_tasks([self.tasks[1]])
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(self.query_names(project_name={"P2"}), ["e"])
+        self.assertEqual(self.store.facet_counts('project_name'), {"P1": 3, "P2": 1, "P3": 1})
+        self.assertEqual(self.store.facet_values('assigned_to'), [])
+        self.assertEqual(self.query_names(), ["a", "c", "e"])
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def test_matches_brute_force_with_updates(self):
+        rng = random.Random(7)
+        spans = {}
+        for key in range(500):
+            start = rng.randint(0, 1000)
+            spans[key] = (start, start + rng.choice([0, 1, 3, 10, 40, 400]))
+        index = IntervalIndex((key, start, end) for key, (start, end) in spans.items())
+        for key in rng.sample(sorted(spans), 100):
+            start = rng.randint(0, 1000)
+            spans[key] = (start, start + rng.randint(0, 60))
+            index.update(key, *spans[key])
+        for key in rng.sample(sorted(spans), 50):
+            del spans[key]
+            index.remove(key)
+
+        self.assertEqual(len(index), len(spans))
+        for _ in range(200):
+            view_start = rng.randint(-50, 1100)
+            view_end = view_start + rng.randint(0, 90)
+            expected = sorted(key for key, (start, end) in spans.items() if start <= view_end and end >= view_start)
+            self.assertEqual(sorted(index.overlapping(view_start, view_end)), expected)
+
+    def test_store_window_query_uses_index(self):
+        tasks = [make_task(str(i), date(2024, 1, 1) + timedelta(days=i), date(2024, 1, 3) + timedelta(days=i)) for i in range(10)]
+        store = TaskStore(tasks)
+        rows = store.query(date(2024, 1, 5).toordinal(), date(2024, 1, 6).toordinal())
+        self.assertEqual(list(rows), [2, 3, 4, 5])
+        tasks[0].metadata['date_start'] = date(2024, 1, 6)
+        tasks[0].metadata['date_end'] = date(2024, 1, 7)
+        store.update_task(tasks[0])
+        self.assertEqual(list(store.query(date(2024, 1, 5).toordinal(), date(2024, 1, 6).toordinal())), [0, 2, 3, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
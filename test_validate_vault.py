@@ -0,0 +1,58 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from validate_vault import main, EXIT_OK, EXIT_ISSUES, EXIT_PARSE_ERRORS
+
+class TestValidateVault(unittest.TestCase):
+
+    def run_cli(self, *args):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(list(args))
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def write(self, root, name, text):
+        path = Path(root, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+
+    def test_clean_vault(self):
+        with tempfile.TemporaryDirectory() as root:
+            self.write(root, "a.md", "---\ntask_name: A\nvibe_id: a\ndate_start: 2024-01-01\ndate_end: 2024-01-02\n---\n")
+            self.write(root, "Templates/t.md", "---\ntask_name:\n---\n")
+            code, lines = self.run_cli(root)
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(lines[0], {'file': 'a.md', 'status': 'ok', 'issues': []})
+        self.assertEqual(lines[-1]['summary']['files'], 1)
+
+    def test_issues_and_parse_errors(self):
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(5):
+                self.write(root, f"ok{i}.md", f"---\ntask_name: T{i}\nvibe_id: '{i}'\nlinked_tasks: [missing]\ndate_start: 2024-01-01\ndate_end: 2024-01-02\n---\n")
+            self.write(root, "sub/late.md", "---\ntask_name: Late\ndate_start: 2024-02-01\ndate_end: 2024-01-01\n---\n")
+            code, lines = self.run_cli(root, '--only-issues', '--workers', '2', '--chunk-size', '2')
+            self.assertEqual(code, EXIT_ISSUES)
+            self.assertEqual(lines[:-1], [{'file': str(Path('sub', 'late.md')), 'status': 'issues', 'issues': ['impossible_timeline']}])
+
+            code, lines = self.run_cli(root, '--summary', '--check-links')
+            self.assertEqual(code, EXIT_ISSUES)
+            self.assertEqual(len(lines), 1)
+            self.assertEqual(lines[0]['summary']['link_errors'], 5)
+            self.assertEqual(lines[0]['summary']['issue_counts'], {'impossible_timeline': 1})
+
+            self.write(root, "sub/linked.md", "---\ntask_name: L\nvibe_id: l\nlinked_tasks: [gone]\n---\n")
+            code, lines = self.run_cli(root, '--only-issues', '--check-links')
+            link_files = sorted(line['file'] for line in lines if line.get('status') == 'link_error')
+            self.assertEqual(link_files, sorted([f"ok{i}.md" for i in range(5)] + [str(Path('sub', 'linked.md'))]))
+            Path(root, "sub", "linked.md").unlink()
+
+            self.write(root, "broken.md", "---\ntask_name: [unclosed\n---\n")
+            code, lines = self.run_cli(root, '--summary')
+            self.assertEqual(code, EXIT_PARSE_ERRORS)
+            self.assertEqual(lines[0]['summary']['parse_errors'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication
+from vault_watcher import VaultWatcher
+
+os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+class TestVaultWatcher(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_watches_folders_and_rescans_changed_subtrees(self):
+        with tempfile.TemporaryDirectory() as root:
+            for folder in ("A/Task Sheets", "B", ".obsidian/plugins", "A/Templates"):
+                Path(root, folder).mkdir(parents=True)
+            Path(root, "A", "Task Sheets", "a.md").write_text("a", encoding='utf-8')
+            Path(root, "B", "b.md").write_text("b", encoding='utf-8')
+            watcher = VaultWatcher(root)
+            events = []
+            watcher.files_changed.connect(lambda *args: events.append(args))
+            watcher.wait() # The first scan is the baseline and reports nothing
+            self.assertEqual(events, [])
+            try:
+                if not watcher.is_polling:
+                    self.assertEqual(sorted(watcher.fs_watcher.directories()),
+                                     sorted(str(Path(root, *parts)) for parts in [(), ("A",), ("A", "Task Sheets"), ("B",)]))
+                    self.assertEqual(watcher.fs_watcher.files(), [])
+
+                Path(root, "A", "Task Sheets", "new.md").write_text("new", encoding='utf-8')
+                Path(root, "B", "b.md").unlink()
+                watcher.rescan({Path(root, "A")})
+                self.assertEqual(events, []) # Scanned on the worker thread; the result arrives as an event
+                watcher.wait()
+                self.assertEqual(events, [([Path(root, "A", "Task Sheets", "new.md")], [], [], [])])
+
+                watcher.rescan() # A full rescan picks up the rest
+                watcher.wait()
+                self.assertEqual(events[1], ([], [], [Path(root, "B", "b.md")], []))
+                self.assertEqual(len(events), 2)
+            finally:
+                watcher.stop()
+
+if __name__ == '__main__':
+    unittest.main()
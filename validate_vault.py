@@ -0,0 +1,106 @@
+"""Headless vault validation: checks every task file under a folder without starting the GUI.
+
+Streams one JSON object per file to stdout (or only a summary with --summary). Files are
+walked lazily and parsed in bounded chunks, so memory does not grow with the vault; only
+--check-links keeps a vibe_id -> links map for the whole vault.
+
+Exit codes: 0 no issues, 1 validation or link issues, 2 bad arguments or missing folder,
+3 files that could not be parsed (unreadable or broken YAML).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from engine import (VibeTask, TaskGraph, iter_task_files, map_file_chunks, parse_task_file, parse_linked_ids,
+                    HEADER_PARSERS, set_header_parsers)
+
+EXIT_OK, EXIT_ISSUES, EXIT_USAGE, EXIT_PARSE_ERRORS = 0, 1, 2, 3
+
+def check_task_chunk(files):
+    """Worker entry point: validates a chunk of files, returning only what the report needs
+       (file, error message, validation issues, vibe_id, linked ids, header parser) so little crosses the process boundary."""
+    results = []
+    for file in files:
+        parsed = parse_task_file(file)
+        if parsed.error_message:
+            results.append((file, parsed.error_message, None, None, (), None))
+        else:
+            vibe_id = parsed.metadata.get('vibe_id')
+            results.append((file, None, parsed.validation_issues or [], None if vibe_id is None else str(vibe_id),
+                            tuple(parse_linked_ids(parsed.metadata.get('linked_tasks'))), parsed.parser))
+    return results
+
+def validate_vault(root_path, workers=1, chunk_size=256, check_links=False, parser_counts=None):
+    """Yields one report dict per task file, then one per link problem when check_links is set.
+       parser_counts (a Counter), when given, counts the header parser backend that loaded each file."""
+    link_tasks = []
+    for file, error_message, issues, vibe_id, linked_ids, parser in map_file_chunks(check_task_chunk, iter_task_files(root_path),
+                                                                            workers, chunk_size):
+        relative = str(file.relative_to(root_path))
+        if error_message:
+            yield {'file': relative, 'status': 'error', 'error': error_message}
+            continue
+        if parser_counts is not None:
+            parser_counts[parser] += 1
+        yield {'file': relative, 'status': 'issues' if issues else 'ok', 'issues': issues}
+        if check_links and vibe_id is not None:
+            # A bare task is enough for TaskGraph: only the path, vibe_id and links are kept
+            link_tasks.append(VibeTask(file, {'vibe_id': vibe_id, 'linked_tasks': list(linked_ids)}, ""))
+
+    if check_links:
+        graph = TaskGraph(link_tasks)
+        for message in graph.issues():
+            yield {'file': str(message.file.relative_to(root_path)), 'status': 'link_error', 'issues': [message]}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate every task file in a VibeGantt vault.")
+    parser.add_argument('root', help="Vault or project folder to scan")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="Parser processes (0 = one per CPU, default 1)")
+    parser.add_argument('--chunk-size', type=int, default=256, help="Files per worker batch (default 256)")
+    parser.add_argument('--summary', action='store_true', help="Print only the final summary")
+    parser.add_argument('--only-issues', action='store_true', help="Leave files without issues out of the stream")
+    parser.add_argument('--check-links', action='store_true', help="Also report dangling links, duplicate ids and cycles")
+    parser.add_argument('--parsers', help=f"Header parser chain, comma-separated, tried in order (from: {', '.join(HEADER_PARSERS)})")
+    args = parser.parse_args(argv)
+
+    root_path = Path(args.root)
+    if not root_path.is_dir():
+        print(f"Error: {root_path} is not a folder.", file=sys.stderr)
+        return EXIT_USAGE
+    workers = args.workers or os.cpu_count() or 1
+    if args.parsers:
+        try:
+            set_header_parsers([name.strip() for name in args.parsers.split(',') if name.strip()])
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return EXIT_USAGE
+
+    started = time.perf_counter()
+    statuses = Counter()
+    issue_counts = Counter()
+    parser_counts = Counter()
+    out = sys.stdout
+    for report in validate_vault(root_path, max(1, workers), max(1, args.chunk_size), args.check_links, parser_counts):
+        statuses[report['status']] += 1
+        if report['status'] == 'issues':
+            issue_counts.update(report['issues'])
+        if not args.summary and not (args.only_issues and report['status'] == 'ok'):
+            out.write(json.dumps(report) + '\n')
+
+    summary = {'files': statuses['ok'] + statuses['issues'] + statuses['error'], 'ok': statuses['ok'],
+               'with_issues': statuses['issues'], 'parse_errors': statuses['error'], 'link_errors': statuses['link_error'],
+               'issue_counts': dict(issue_counts.most_common()), 'parsers': dict(parser_counts.most_common()), 'seconds': round(time.perf_counter() - started, 3)}
+    out.write(json.dumps({'summary': summary}) + '\n')
+    out.flush()
+
+    if statuses['error']:
+        return EXIT_PARSE_ERRORS
+    if statuses['issues'] or statuses['link_error']:
+        return EXIT_ISSUES
+    return EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from PyQt6.QtCore import QObject, QTimer, QCoreApplication, QFileSystemWatcher, pyqtSignal
+from engine import snapshot_task_files, diff_task_snapshots
+
+class VaultWatcher(QObject):
+    """Watches a project folder for created, modified, deleted and renamed task files.
+
+    Uses QFileSystemWatcher (inotify on Linux) on the vault's folders only, skipping dot-folders
+    (.git, .obsidian, ...) and Templates, so a large vault needs one watch per folder rather than per
+    file. Bursts of folder events are coalesced by a single-shot debounce timer, and only the changed
+    folders are rescanned. Folder watches do not report a file rewritten in place, so a full rescan
+    runs every few seconds as well. When the folders cannot all be watched, falls back to polling.
+
+    Scans (stat walks of the vault) run on a worker thread and their results are queued back to the
+    GUI thread, where they are compared with the last snapshot; one scan runs at a time and requests
+    made meanwhile are merged into the next one."""
+    files_changed = pyqtSignal(list, list, list, list) # created, modified, deleted, renamed (old, new) pairs
+    _scan_done = pyqtSignal(object, object, object) # Emitted from the worker thread: scanned tops (None for all), snapshot, folders
+
+    def __init__(self, root_path, parent=None, debounce_ms=300, poll_interval_ms=2000, full_rescan_interval_ms=10000,
+                 force_polling=False):
+        super().__init__(parent)
+        self.root_path = Path(root_path)
+        self.snapshot = None # Set by the first scan
+        self.changed_directories = set()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.scan_future = None
+        self.scanning = False
+        self.stopped = False
+        self.pending_full, self.pending_directories = False, set()
+        self.acknowledged = {} # Files written by this app while a scan ran: path -> stat state
+        self._scan_done.connect(self._on_scan_done)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self._rescan_changed_directories)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval_ms)
+        self.poll_timer.timeout.connect(self.rescan)
+
+        self.full_rescan_timer = QTimer(self)
+        self.full_rescan_timer.setInterval(full_rescan_interval_ms)
+        self.full_rescan_timer.timeout.connect(self.rescan)
+
+        self.fs_watcher = None
+        if not force_polling:
+            # Folders are added when the first scan has listed them
+            self.fs_watcher = QFileSystemWatcher(self)
+            self.fs_watcher.directoryChanged.connect(self._schedule_rescan)
+            self.full_rescan_timer.start()
+        else:
+            self.poll_timer.start()
+        self.rescan()
+
+    @property
+    def is_polling(self):
+        return self.fs_watcher is None
+
+    @staticmethod
+    def watched_directories(top):
+        """top and every folder under it, except dot-folders and Templates folders (and what is inside them)."""
+        if not os.path.isdir(top):
+            return []
+        directories = [str(top)]
+        for directory, subdirectories, _ in os.walk(top):
+            subdirectories[:] = [name for name in subdirectories if name != 'Templates' and not name.startswith('.')]
+            directories.extend(os.path.join(directory, name) for name in subdirectories)
+        return directories
+
+    def _scan(self, tops, with_directories):
+        """Worker thread: (snapshot of the task files under tops, folders to watch under tops or None)."""
+        snapshot = {}
+        for top in tops:
+            snapshot.update(snapshot_task_files(top))
+        directories = [directory for top in tops for directory in self.watched_directories(top)] if with_directories else None
+        return snapshot, directories
+
+    def _watch_paths(self, tops, directories):
+        """Brings the watched folders under tops in line with directories. Returns False if any could not be watched."""
+        watched = set(self.fs_watcher.directories())
+        wanted = set(directories)
+        gone = [directory for directory in watched - wanted if any(Path(directory).is_relative_to(top) for top in tops)]
+        if gone:
+            self.fs_watcher.removePaths(gone)
+        new_paths = sorted(wanted - watched)
+        if not new_paths:
+            return True
+        failed = self.fs_watcher.addPaths(new_paths)
+        return not failed
+
+    def _schedule_rescan(self, path):
+        self.changed_directories.add(Path(path))
+        self.debounce_timer.start() # Restarting the timer coalesces bursts into one rescan
+
+    def _rescan_changed_directories(self):
+        directories, self.changed_directories = self.changed_directories, set()
+        if directories:
+            self.rescan(directories)
+
+    def rescan(self, directories=None):
+        """Requests a scan of the whole vault, or of just the subtrees of directories. The result is compared
+           with the last snapshot on the GUI thread, and files_changed is emitted if anything differs."""
+        if directories is None:
+            self.pending_full = True
+        else:
+            self.pending_directories.update(Path(directory) for directory in directories)
+        self._start_scan()
+
+    def _start_scan(self):
+        if self.scanning or self.stopped or not (self.pending_full or self.pending_directories):
+            return
+        directories = self.pending_directories
+        # Outermost folders only: a subtree inside another changed folder is rescanned with it
+        tops = [top for top in directories if not any(parent in directories for parent in top.parents)]
+        if self.pending_full or self.snapshot is None or self.root_path in tops:
+            tops = None
+        self.pending_full, self.pending_directories = False, set()
+        self.scanning = True
+        self.acknowledged = {}
+        self.scan_future = self.executor.submit(self._scan, tops or [self.root_path], self.fs_watcher is not None)
+        self.scan_future.add_done_callback(lambda future, tops=tops: self._scan_done.emit(tops, *self._result(future)))
+
+    @staticmethod
+    def _result(future):
+        if future.exception() is not None:
+            print(f"Vault scan failed: {future.exception()}")
+            return None, None
+        return future.result()
+
+    def _on_scan_done(self, tops, new_part, directories):
+        self.scanning = False
+        if self.stopped:
+            return
+        if new_part is not None:
+            self._apply_scan(tops, new_part, directories)
+        self._start_scan()
+
+    def _apply_scan(self, tops, new_part, directories):
+        # The scan may have read a file before this app finished writing it
+        for file, state in self.acknowledged.items():
+            if file in new_part or tops is None or any(parent in tops for parent in file.parents):
+                new_part[file] = state
+        if self.snapshot is None: # First scan: the baseline
+            old_part, self.snapshot = new_part, dict(new_part)
+        elif tops is None:
+            old_part, self.snapshot = self.snapshot, new_part
+        else:
+            top_set = set(tops)
+            old_part = {file: state for file, state in self.snapshot.items() if any(parent in top_set for parent in file.parents)}
+            for file in old_part:
+                del self.snapshot[file]
+            self.snapshot.update(new_part)
+        created, modified, deleted, renamed = diff_task_snapshots(old_part, new_part)
+
+        if self.fs_watcher is not None and directories is not None and not self._watch_paths(tops or [self.root_path], directories):
+            # Out of inotify watches (or no native backend): poll instead
+            self.fs_watcher.deleteLater()
+            self.fs_watcher = None
+            self.full_rescan_timer.stop()
+            self.poll_timer.start()
+        if created or modified or deleted or renamed:
+            self.files_changed.emit(created, modified, deleted, renamed)
+
+    def wait(self):
+        """Blocks until no scan is running or requested and every result has been delivered."""
+        while self.scanning:
+            wait([self.scan_future])
+            QCoreApplication.processEvents()
+
+    def acknowledge(self, files):
+        """Records the current on-disk state of files this app just wrote, so our own saves are not reported back."""
+        for file in files:
+            try:
+                stat_result = Path(file).stat()
+            except OSError:
+                continue
+            state = (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+            if self.snapshot is not None:
+                self.snapshot[Path(file)] = state
+            if self.scanning:
+                self.acknowledged[Path(file)] = state
+
+    def stop(self):
+        self.stopped = True
+        self.debounce_timer.stop()
+        self.poll_timer.stop()
+        self.full_rescan_timer.stop()
+        self.executor.shutdown(wait=True, cancel_futures=True) # At most the one running scan
+        if self.fs_watcher is not None:
+            paths = self.fs_watcher.directories()
+            if paths:
+                self.fs_watcher.removePaths(paths)